@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Quadtree adaptive sampling of the (K, σ) landscape
+
+A uniform grid spends most of its points on flat plateaus (locked ridge,
+fully incoherent region), while all the structure sits along the σ_c and
+σ_mem boundaries. adaptive_mesh starts from a coarse grid of cells and
+splits a cell into four whenever one of the tracked metrics varies across
+its corners by more than its tolerance, so the boundaries are resolved to
+the finest level while plateaus stay coarse.
+
+Every point is simulated once (corners are shared between neighbouring
+cells) and each refinement level is one run_sweep across the process pool.
+The output is a scattered list of point records, the same records a
+uniform-grid runner produces, so figure scripts that griddata() the
+measured points read it unchanged.
+"""
+
+import numpy as np
+
+from sweep import run_sweep
+
+
+def _point_key(K, sigma):
+    return (round(float(K), 12), round(float(sigma), 12))
+
+
+def adaptive_mesh(fn, args, K_range, sigma_range, tolerances, initial=(5, 5), max_depth=4,
+                  max_points=None, max_workers=None, on_result=None):
+    """
+    Sample fn over a rectangle of (K, σ), refining where the metrics change
+
+    Parameters:
+    -----------
+    fn : callable
+        fn(K, sigma, *args) -> dict of metrics for one point (module level)
+    args : tuple
+        Extra arguments for fn (e.g. (config,))
+    K_range, sigma_range : (float, float)
+        Rectangle to sample
+    tolerances : dict
+        {metric: tolerance}; a cell is split when max − min of any metric
+        over its four corners exceeds the tolerance (e.g.
+        {'abs_S_mean': 0.05, 'PLI_mean': 0.05})
+    initial : (int, int)
+        Points per axis of the starting uniform grid
+    max_depth : int
+        Maximum number of times a starting cell is halved
+    max_points : int, optional
+        Simulation budget; when a level would exceed it, the cells with the
+        largest variation are split first
+    max_workers, on_result :
+        As in run_sweep
+
+    Returns:
+    --------
+    records : list of dict
+        fn's result at every sampled point, sorted by (K, σ)
+    cells : list of dict
+        Final leaf cells {'K': [lo, hi], 'sigma': [lo, hi], 'depth': d}
+    """
+    points = {}
+
+    def evaluate(new_points):
+        new_points = [p for p in dict.fromkeys(new_points) if p not in points]
+        results = run_sweep(fn, [p + tuple(args) for p in new_points],
+                            max_workers=max_workers, on_result=on_result)
+        points.update(zip(new_points, results))
+
+    def variation(cell):
+        K_lo, K_hi, s_lo, s_hi, _ = cell
+        corners = [points[_point_key(K, s)] for K in (K_lo, K_hi) for s in (s_lo, s_hi)]
+        ratios = []
+        for metric, tolerance in tolerances.items():
+            values = np.array([corner[metric] for corner in corners], dtype=float)
+            values = values[np.isfinite(values)]
+            if values.size > 1:
+                ratios.append((values.max() - values.min()) / tolerance)
+        return max(ratios, default=0.0)
+
+    K_axis = np.linspace(K_range[0], K_range[1], initial[0])
+    sigma_axis = np.linspace(sigma_range[0], sigma_range[1], initial[1])
+    evaluate([_point_key(K, s) for K in K_axis for s in sigma_axis])
+    cells = [
+        (K_axis[i], K_axis[i + 1], sigma_axis[j], sigma_axis[j + 1], 0)
+        for i in range(len(K_axis) - 1) for j in range(len(sigma_axis) - 1)
+    ]
+
+    while True:
+        candidates = [(variation(cell), cell) for cell in cells if cell[4] < max_depth]
+        candidates = sorted([c for c in candidates if c[0] > 1.0], key=lambda c: -c[0])
+        if not candidates:
+            break
+
+        to_split = []
+        new_points = set()
+        for _, cell in candidates:
+            K_lo, K_hi, s_lo, s_hi, _ = cell
+            K_mid, s_mid = 0.5 * (K_lo + K_hi), 0.5 * (s_lo + s_hi)
+            cell_points = {_point_key(K, s) for K, s in [
+                (K_mid, s_lo), (K_mid, s_hi), (K_lo, s_mid), (K_hi, s_mid), (K_mid, s_mid)
+            ]} - set(points)
+            if max_points is not None and len(points) + len(new_points | cell_points) > max_points:
+                continue
+            new_points |= cell_points
+            to_split.append(cell)
+        if not to_split:
+            break
+
+        evaluate(sorted(new_points))
+        for cell in to_split:
+            cells.remove(cell)
+            K_lo, K_hi, s_lo, s_hi, depth = cell
+            K_mid, s_mid = 0.5 * (K_lo + K_hi), 0.5 * (s_lo + s_hi)
+            cells += [
+                (K_lo, K_mid, s_lo, s_mid, depth + 1), (K_mid, K_hi, s_lo, s_mid, depth + 1),
+                (K_lo, K_mid, s_mid, s_hi, depth + 1), (K_mid, K_hi, s_mid, s_hi, depth + 1)
+            ]
+
+    records = [points[key] for key in sorted(points)]
+    leaves = [
+        {'K': [float(K_lo), float(K_hi)], 'sigma': [float(s_lo), float(s_hi)], 'depth': depth}
+        for K_lo, K_hi, s_lo, s_hi, depth in cells
+    ]
+    return records, leaves
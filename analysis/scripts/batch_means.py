@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Batch-means estimation from one long trajectory per (K, σ)
+
+A seed ensemble pays the full transient once per seed and gets its error bar
+from the spread between seeds. In a stationary (in particular a locked)
+regime one trajectory that is equilibrated once and then run n_seeds times
+as long carries the same information for a fraction of the transient cost;
+its error bars come from overlapping batch means (OBM) instead:
+
+    SEM² = b / ((n − b + 1)(n − b)) · Σ_j (x̄_j(b) − x̄)²
+
+over all n − b + 1 windows x̄_j(b) of b consecutive steps, computed from
+prefix sums. The batch size is chosen automatically on a doubling ladder
+as the first b at which the estimate stops growing (select_batch_size).
+
+Nonlinear estimators are linearized first (delta method): the SEM of |S̄|,
+PLI and the lag-τ Pearson ρ_S is the OBM SEM of their influence series,
+whose mean is zero by construction.
+"""
+
+import numpy as np
+
+from rut_core import run_single_experiment, rolling_chsh, CircularMoments
+
+# Fewest batches a batch size must leave
+MIN_BATCHES = 20
+
+
+def obm_sem(x, batch_size):
+    """
+    Overlapping-batch-means standard error of mean(x)
+
+    Parameters:
+    -----------
+    x : array, shape (n,)
+        Stationary, correlated series
+    batch_size : int
+        Batch length b (1 ≤ b < n)
+
+    Returns:
+    --------
+    sem : float
+    """
+    x = np.asarray(x, dtype=float)
+    n = x.size
+    b = int(batch_size)
+    c = np.concatenate([[0.0], np.cumsum(x - x.mean())])
+    batches = (c[b:] - c[:-b]) / b
+    return float(np.sqrt(b * np.sum(batches**2) / ((n - b + 1) * (n - b))))
+
+
+def select_batch_size(x, min_batch=1, min_batches=MIN_BATCHES, tol=0.05, atol=1e-12):
+    """
+    Smallest batch size at which the OBM standard error has levelled off
+
+    Too short batches are still correlated with each other and underestimate
+    the SEM; past the correlation time the estimate only fluctuates. The
+    ladder b = min_batch·2^k (while n / b ≥ min_batches) is scanned for the
+    first b whose SEM at 2b is larger by less than tol or by less than twice
+    the estimate's own relative error √(b / 3n). SEMs below atol (e.g. a
+    noiseless locked run, where the series is round-off) count as settled.
+
+    Returns:
+    --------
+    batch_size : int
+    sem : float
+        OBM SEM at batch_size
+    plateau : bool
+        False if the SEM was still growing at the longest batch (the
+        trajectory is too short for its correlation time; sem is then a
+        lower bound)
+    """
+    n = len(x)
+    ladder = [max(int(min_batch), 1)]
+    while n // (2 * ladder[-1]) >= min_batches:
+        ladder.append(2 * ladder[-1])
+    sems = [obm_sem(x, b) for b in ladder]
+
+    for k in range(len(ladder) - 1):
+        allowance = max(tol, 2 * np.sqrt(ladder[k + 1] / (3 * n)))
+        if sems[k + 1] <= sems[k] * (1 + allowance) + atol:
+            return ladder[k], sems[k], True
+    return ladder[-1], sems[-1], False
+
+
+def batch_means(influence, estimate, batch_size=None, min_batch=1, tol=0.05):
+    """
+    Estimate with OBM error bar from its (zero-mean) influence series
+
+    Returns:
+    --------
+    summary : dict
+        'mean', 'sem', 'batch_size', 'n_batches' (n / batch_size) and
+        'plateau' (see select_batch_size; True for a fixed batch_size)
+    """
+    if batch_size is None:
+        batch_size, sem, plateau = select_batch_size(influence, min_batch, tol=tol)
+    else:
+        sem, plateau = obm_sem(influence, batch_size), True
+    return {
+        'mean': float(estimate),
+        'sem': sem,
+        'batch_size': int(batch_size),
+        'n_batches': len(influence) / batch_size,
+        'plateau': plateau
+    }
+
+
+def moments_batch_means(dtheta, angles, transient=0, batch_size=None, min_batch=1, tol=0.05):
+    """
+    |S| and PLI of a trajectory with OBM error bars
+
+    S is linear in the circular moments, so its per-step series is
+    s_t = S(cos Δθ_t, sin Δθ_t) and |S̄| has influence sign(S̄)(s_t − S̄).
+    PLI = |⟨exp(iΔθ)⟩| has influence (C̄ cos Δθ_t + S̄n sin Δθ_t) / PLI − PLI.
+
+    Returns:
+    --------
+    summary : dict
+        {'abs_S': batch_means(...), 'PLI': batch_means(...)}
+    """
+    delta = np.asarray(dtheta, dtype=float)[transient:]
+    cos, sin = np.cos(delta), np.sin(delta)
+    moments = CircularMoments(cos.mean(), sin.mean())
+    S = moments.chsh(angles)[1]
+    s = CircularMoments(cos, sin).chsh(angles)[1]
+    pli = float(moments.pli)
+
+    pli_influence = (moments.C * cos + moments.Sn * sin) / pli - pli if pli > 0 else np.zeros_like(delta)
+    return {
+        'abs_S': batch_means(np.sign(S) * (s - S), abs(S), batch_size, min_batch, tol),
+        'PLI': batch_means(pli_influence, pli, batch_size, min_batch, tol)
+    }
+
+
+def autocorr_batch_means(S_series, lag, batch_size=None, min_batch=1, tol=0.05):
+    """
+    ρ_S(τ) of one S(t) series with an OBM error bar
+
+    Same estimator as rut_core.autocorr_S(S_series, lag)[lag]. With x, y the
+    standardized S[:N−τ] and S[τ:], ρ = ⟨xy⟩ and its influence series is
+    x_t y_t − ρ (x_t² + y_t²) / 2.
+
+    Returns:
+    --------
+    summary : dict
+        batch_means(...) of ρ_S(τ)
+    """
+    S = np.asarray(S_series, dtype=float)
+    head, tail = S[:S.size - lag], S[lag:]
+    x = (head - head.mean()) / head.std()
+    y = (tail - tail.mean()) / tail.std()
+    rho = np.mean(x * y)
+    return batch_means(x * y - 0.5 * rho * (x**2 + y**2), rho, batch_size, min_batch, tol)
+
+
+def run_batch_means_experiment(params, seed=None, experiment_id=None, initial_state=None,
+                               n_segments=1, min_batch=1, tol=0.05):
+    """
+    One long trajectory, equilibrated once, with batch-means error bars
+
+    Parameters:
+    -----------
+    params : dict
+        As in run_single_experiment; T covers the single transient plus the
+        whole measured run. ρ_S(τ) is estimated when params['autocorr_tau']
+        (steps) is set, over S(t) windows of params['S_window'] steps.
+    seed, experiment_id, initial_state :
+        As in run_single_experiment
+    n_segments : int
+        Also split the measured run into this many equal segments and
+        report |S| and PLI per segment (e.g. n_seeds, for a per-seed
+        violation rate)
+    min_batch, tol :
+        Passed to select_batch_size
+
+    Returns:
+    --------
+    results : dict
+        run_single_experiment results with 'batch_means' ({'abs_S', 'PLI'
+        [, 'rho_S']}, see batch_means) and 'segments' ({'abs_S', 'PLI'}
+        lists) added
+    dtheta : array
+        Δθ = θ2 − θ1 over the whole run
+    """
+    results, dtheta, _ = run_single_experiment(params, seed, experiment_id, initial_state, return_state=True)
+    transient = results['transient_used']
+    angles = params['angles']
+
+    summary = moments_batch_means(dtheta, angles, transient, min_batch=min_batch, tol=tol)
+    tau = params.get('autocorr_tau')
+    if tau is not None:
+        S_series = rolling_chsh(dtheta, angles, params.get('S_window', 1), transient)
+        summary['rho_S'] = autocorr_batch_means(S_series, tau, min_batch=min_batch, tol=tol)
+
+    segments = [CircularMoments.from_dtheta(s) for s in np.array_split(dtheta[transient:], n_segments)]
+    results['batch_means'] = summary
+    results['segments'] = {
+        'abs_S': [abs(m.chsh(angles)[1]) for m in segments],
+        'PLI': [float(m.pli) for m in segments]
+    }
+    return results, dtheta
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Append-only sweep journal for checkpoint/resume
+
+A JSON-lines file: the first line is a header describing the sweep (its
+config and run metadata such as run_id), every further line one completed
+task {"key": ..., "result": ...}, flushed to disk as soon as the task
+finishes. Re-opening the journal after a crash restores the completed
+results and the original run metadata, so the resumed sweep writes the
+same output as an uninterrupted one. The header is synced to disk on
+creation; an empty or torn header (a crash while the journal was being
+created) is treated as no journal at all.
+
+Results are stored through a JSON round trip (numpy scalars and arrays
+become floats and lists) and handed back in that form both when appended
+and when restored, so resumed and fresh results are indistinguishable.
+"""
+
+import os
+import json
+from pathlib import Path
+import numpy as np
+
+
+def _to_json(obj):
+    """json.dump default for numpy types"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj):
+    return json.dumps(obj, default=_to_json, sort_keys=True, separators=(',', ':'))
+
+
+class SweepJournal:
+    """
+    Completed-task log of one sweep
+
+    Parameters:
+    -----------
+    path : str or Path
+        Journal file (created if missing)
+    sweep : JSON-like
+        Description of the sweep, e.g. its config. Resuming with a different
+        description raises ValueError instead of mixing two sweeps.
+    meta : dict, optional
+        Run metadata stored in a new journal (run_id, timestamps). On resume
+        the stored metadata is returned instead.
+    """
+
+    def __init__(self, path, sweep, meta=None):
+        self.path = Path(path)
+        self.records = {}
+        sweep = json.loads(_dumps(sweep))
+
+        header = None
+        if self.path.exists():
+            with open(self.path) as f:
+                text = f.read()
+            lines = text.split('\n')[:-1]
+            if not text.endswith('\n'):
+                # A crash mid-write leaves a partial last line; drop it and rerun that task
+                with open(self.path, 'w') as f:
+                    f.write(''.join(line + '\n' for line in lines))
+
+            try:
+                header = json.loads(lines[0])
+            except (IndexError, json.JSONDecodeError):
+                # Empty or torn header: the crash came before the journal was
+                # complete, so no task was logged; start a fresh journal
+                header = None
+
+        if header is not None:
+            if header['sweep'] != sweep:
+                raise ValueError(f"Journal {self.path} belongs to a different sweep; "
+                                 f"delete it to start over")
+            self.meta = header['meta']
+
+            for line in lines[1:]:
+                entry = json.loads(line)
+                self.records[_dumps(entry['key'])] = entry['result']
+        else:
+            self.meta = json.loads(_dumps(meta or {}))
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'w') as f:
+                f.write(_dumps({'sweep': sweep, 'meta': self.meta}) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, key):
+        return _dumps(key) in self.records
+
+    def __getitem__(self, key):
+        return self.records[_dumps(key)]
+
+    def append(self, key, result):
+        """Log one completed task and return its result as stored"""
+        line = _dumps({'key': key, 'result': result})
+        with open(self.path, 'a') as f:
+            f.write(line + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+        result = json.loads(line)['result']
+        self.records[_dumps(key)] = result
+        return result
+
+    def finish(self):
+        """Remove the journal once the sweep's outputs are written"""
+        self.path.unlink(missing_ok=True)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Common-random-number noise tapes shared across a σ (and K) scan
+
+Normally every (K, σ, seed) trajectory draws its own noise (seed_streams),
+so the difference between neighbouring σ points is dominated by seed noise
+and finite-difference surfaces such as χ = ∂S*/∂σ need many seeds. A tape
+holds one seed's initial phases and standard-normal increments, drawn once
+and reused, scaled by σ√dt, at every σ (and, with share_K, every K) of the
+scan. Neighbouring points then see the same Brownian path and their
+difference is smooth in σ.
+
+Each tape is a plain .npy file written once (atomically) and opened with
+mmap_mode='r', so worker processes share it through the page cache instead
+of each holding a copy. For rut_core's engines, tape_increments turns a
+tape into the increments=(dW, dZ) argument of kuramoto_with_noise.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+import numpy as np
+
+from seed_streams import stream_key, trajectory_rng, initial_phases
+
+
+def tape_increments(normals, sigma, dt, scheme='euler'):
+    """
+    σ·ΔW (and σ·ΔZ for 'srk') from a tape, as rut_core.brownian_increments
+
+    Parameters:
+    -----------
+    normals : array, shape (n, 2) or (n, 4)
+        Tape rows; 'srk' needs the two extra columns
+    sigma, dt : float
+        Noise strength and time step
+    scheme : str
+        rut_core integration scheme
+
+    Returns:
+    --------
+    dW, dZ : arrays, shape (n, 2) (dZ None unless scheme == 'srk')
+    """
+    noise_scale = sigma * np.sqrt(dt)
+    dW = noise_scale * np.asarray(normals[:, :2])
+    dZ = None
+    if scheme == 'srk':
+        dZ = 0.5 * dt * (dW + noise_scale * np.asarray(normals[:, 2:4]) / np.sqrt(3))
+    return dW, dZ
+
+
+class NoiseTapes:
+    """
+    Directory of memory-mapped noise tapes, one per seed (or per (K, seed))
+
+    Tape (K, seed) is drawn from the seed stream
+    (experiment_id, ('tape',) or ('tape', K), seed): first the two initial
+    phases, then n_steps × n_cols standard normals, in the order
+    rng.standard_normal((n_steps, n_cols)) would give them.
+
+    Parameters:
+    -----------
+    root : str or Path
+        Tape directory (created if missing)
+    experiment_id : str
+        Seed-stream namespace
+    n_steps : int
+        Longest run the tapes must cover, in steps
+    n_cols : int
+        Normals per step (2 oscillators; 4 with the 'srk' ΔZ columns)
+    share_K : bool
+        One tape per seed for the whole (K, σ) scan instead of one per K
+    block_size : int
+        Rows drawn and written at a time
+    """
+
+    def __init__(self, root, experiment_id, n_steps, n_cols=2, share_K=False, block_size=100000):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.experiment_id = experiment_id
+        self.n_steps = n_steps
+        self.n_cols = n_cols
+        self.share_K = share_K
+        self.block_size = block_size
+        self._open = {}
+
+    def point(self, K):
+        """Seed-stream point of the tape used at coupling K"""
+        return ('tape',) if self.share_K else ('tape', K)
+
+    def path(self, K, seed):
+        key = stream_key(self.experiment_id, self.point(K), seed)
+        name = ''.join(f"{word:016x}" for word in key)
+        return self.root / f"{name}_{self.n_steps}x{self.n_cols}.npy"
+
+    def _write(self, K, seed, path):
+        rng = trajectory_rng(self.experiment_id, self.point(K), seed)
+        phases = initial_phases(rng)
+
+        # Write to a temporary file and rename, so concurrent writers and
+        # readers never see a partial tape
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix='.npy.tmp')
+        os.close(fd)
+        try:
+            tape = np.lib.format.open_memmap(tmp, mode='w+', dtype=float, shape=(self.n_steps + 1, self.n_cols))
+            # Row 0: initial phases (padded), then the increments
+            tape[0] = 0.0
+            tape[0, :2] = phases
+            for start in range(0, self.n_steps, self.block_size):
+                n = min(self.block_size, self.n_steps - start)
+                tape[1 + start:1 + start + n] = rng.standard_normal((n, self.n_cols))
+            tape.flush()
+            del tape
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+    def open(self, K, seed):
+        """
+        Initial phases and memory-mapped normals of one tape, written first if missing
+
+        Returns:
+        --------
+        phases : array, shape (2,)
+        normals : np.memmap, shape (n_steps, n_cols)
+        """
+        path = self.path(K, seed)
+        if path not in self._open:
+            if not path.exists():
+                self._write(K, seed, path)
+            tape = np.load(path, mmap_mode='r')
+            self._open[path] = (np.array(tape[0, :2]), tape[1:])
+        return self._open[path]
+
+    def prepare(self, K_values, seeds):
+        """Write every tape the scan needs up front (in the parent process)"""
+        K_values = [K_values[0]] if self.share_K else list(K_values)
+        for K in K_values:
+            for seed in seeds:
+                path = self.path(K, seed)
+                if not path.exists():
+                    self._write(K, seed, path)
+
+    def clear(self):
+        """Delete the tapes of this directory"""
+        self._open.clear()
+        for path in self.root.glob('*.npy'):
+            path.unlink()
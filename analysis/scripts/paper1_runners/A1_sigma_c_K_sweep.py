@@ -13,6 +13,30 @@ Outputs:
 - Full (K, σ) grid of |S| and PLI statistics
 - Data for Paper 1 Figure: "Noise-Coupling Scaling Law"
 
+With "threshold_search": {"enabled": true, ...} in the config parameters,
+σ_c(K) is instead located adaptively (threshold.find_crossing): the σ grid
+is only scanned up to the first |S| < 2.3 point, the bracket is refined by
+secant/bisection, and extra seeds go only to points near the crossing.
+
+With "adaptive_mesh": {"enabled": true, ...}, the (K, σ) landscape is
+sampled by quadtree refinement (adaptive_mesh) instead of the uniform grid
+and written to A1_adaptive_landscape in the same grid_results layout.
+
+With "dt_convergence": {"enabled": true, "points": [[K, σ], ...], ...}, the
+listed points are run at dt, 2dt and 4dt on shared Brownian paths
+(sweep.run_convergence_sweep) and the Richardson bias of |S|, PLI and ρ_S(τ)
+is written to A1_dt_convergence, to choose the largest dt within "tol".
+
+With "batch_means": {"enabled": true, ...}, each grid point is one
+trajectory equilibrated once and run for n_seeds × the measured steps
+(batch_means.run_batch_means_experiment) instead of n_seeds separate runs;
+|S|, PLI and ρ_S(τ) error bars come from overlapping batch means and the
+violation rate from n_seeds equal segments of the run.
+
+Results are written as columnar stores (result_store): A1_sigma_c_K_sweep.cols
+and A1_adaptive_landscape.cols; "json_export": true also writes the JSON
+document for archival.
+
 Expected Result:
 ----------------
 Linear fit: σ_c = slope × K + intercept
@@ -29,7 +53,12 @@ from scipy.interpolate import interp1d
 # Add rut_core to path
 SCRIPT_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(SCRIPT_DIR))
-from rut_core import run_single_experiment
+from rut_core import run_ensemble_experiment, dt_convergence, SCHEME_ORDER
+from sweep import run_sweep, run_convergence_sweep
+from threshold import find_crossing
+from adaptive_mesh import adaptive_mesh
+from result_store import save_columnar, export_json, STORE_SUFFIX
+from batch_means import run_batch_means_experiment
 
 def load_config():
     """Load A1 configuration"""
@@ -37,9 +66,9 @@ def load_config():
     with open(config_path) as f:
         return json.load(f)
 
-def run_single_point(K, sigma, config):
-    """Run all seeds for a single (K, σ) point"""
-    params = {
+def point_params(K, sigma, config):
+    """rut_core parameter dict for one (K, σ) point"""
+    return {
         'K': K,
         'delta_omega': config['parameters']['delta_omega'],
         'sigma': sigma,
@@ -48,20 +77,43 @@ def run_single_point(K, sigma, config):
         'dt': config['parameters']['dt'],
         'transient': config['parameters']['transient_steps'],
         'omega1': config['parameters']['omega1'],
-        'K_modulation': None
+        'K_modulation': None,
+        'scheme': config['parameters'].get('scheme', 'euler'),
+        'transient_window': config['parameters'].get('transient_window', 1000),
+        'auto_transient': config['parameters'].get('auto_transient', False),
+        'report_transient': config['parameters'].get('report_transient', False)
     }
 
+def save_output(output_data, name, config):
+    """
+    Write an A1 result document as a columnar store (result_store), plus a
+    compact JSON copy for archival when the config sets "json_export": true
+    """
+    output_dir = Path(__file__).parent.parent.parent / "data" / "paper1"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = save_columnar(output_dir / f"{name}{STORE_SUFFIX}", output_data)
+    if config['parameters'].get('json_export', False):
+        export_json(output_file)
+    return output_file
+
+def run_single_point(K, sigma, config):
+    """Run all seeds for a single (K, σ) point"""
+    params = point_params(K, sigma, config)
     n_seeds = config['parameters']['n_seeds']
-    results = []
 
-    for seed in range(1, n_seeds + 1):
-        result = run_single_experiment(params, seed=seed)
-        results.append(result)
+    # All seeds in one ensemble call; set "bit_exact": true in the config to
+    # reproduce the legacy per-seed RNG stream
+    bit_exact = config['parameters'].get('bit_exact', False)
+    results = run_ensemble_experiment(
+        params, seeds=range(1, n_seeds + 1), bit_exact=bit_exact,
+        experiment_id=config['experiment_id']
+    )
 
     # Compute statistics
     abs_S_vals = [r['abs_S'] for r in results]
     PLI_vals = [r['PLI'] for r in results]
     violations = sum(1 for r in results if r['violation'])
+    detected = [r['transient_detected'] for r in results]
 
     return {
         'K': K,
@@ -74,9 +126,88 @@ def run_single_point(K, sigma, config):
         'PLI_std': float(np.std(PLI_vals, ddof=1)),
         'violation_count': violations,
         'violation_rate': violations / n_seeds,
+        'transient_detected_max': None if None in detected else max(detected),
         'individual_results': results
     }
 
+def batch_means_point(K, sigma, config):
+    """One equilibrated trajectory per (K, σ), as long as all seeds' measured runs together"""
+    parameters = config['parameters']
+    settings = parameters['batch_means']
+    n_seeds = parameters['n_seeds']
+    params = point_params(K, sigma, config)
+    params.update(
+        T=params['transient'] + n_seeds * (params['T'] - params['transient']),
+        autocorr_tau=max(int(round(settings.get('tau', 25.0) / params['dt'])), 1),
+        S_window=max(int(round(settings.get('window', 100.0) / params['dt'])), 1)
+    )
+
+    result, _ = run_batch_means_experiment(
+        params, seed=1, experiment_id=config['experiment_id'], n_segments=n_seeds,
+        min_batch=settings.get('min_batch', 1), tol=settings.get('tol', 0.05)
+    )
+    estimates = result['batch_means']
+    segments = result['segments']
+    violations = sum(1 for abs_S in segments['abs_S'] if abs_S > 2.0)
+
+    return {
+        'K': K,
+        'sigma': sigma,
+        'n_seeds': 1,
+        'n_segments': n_seeds,
+        'abs_S_mean': estimates['abs_S']['mean'],
+        'abs_S_std': float(np.std(segments['abs_S'], ddof=1)),
+        'abs_S_sem': estimates['abs_S']['sem'],
+        'PLI_mean': estimates['PLI']['mean'],
+        'PLI_std': float(np.std(segments['PLI'], ddof=1)),
+        'PLI_sem': estimates['PLI']['sem'],
+        'rho_S_mean': estimates['rho_S']['mean'],
+        'rho_S_sem': estimates['rho_S']['sem'],
+        'batch_size': estimates['abs_S']['batch_size'],
+        'batch_plateau': all(estimate['plateau'] for estimate in estimates.values()),
+        'violation_count': violations,
+        'violation_rate': violations / n_seeds,
+        'transient_detected_max': result['transient_detected'],
+        'individual_results': [result]
+    }
+
+def convergence_point(K, sigma, config, factors):
+    """Seed-mean |S|, PLI and ρ_S(τ) of one point at dt·factor, shared Brownian paths"""
+    settings = config['parameters']['dt_convergence']
+    check = dt_convergence(
+        point_params(K, sigma, config), factors, seeds=range(1, config['parameters']['n_seeds'] + 1),
+        experiment_id=config['experiment_id'], window=settings.get('window', 100.0),
+        tau=settings.get('tau', 25.0)
+    )
+    return {name: check[name]['value'] for name in ['abs_S', 'PLI', 'rho_S']}
+
+def search_sigma_c(K, config, threshold_S=2.3):
+    """
+    Adaptive σ_c(K): first σ where the seed-averaged |S| drops below threshold_S
+
+    Returns find_crossing's result (estimate, confidence interval, visited
+    points and simulation count).
+    """
+    parameters = config['parameters']
+    search = parameters['threshold_search']
+    bit_exact = parameters.get('bit_exact', False)
+
+    def evaluate(sigma, seeds):
+        results = run_ensemble_experiment(
+            point_params(K, sigma, config), seeds=seeds, bit_exact=bit_exact,
+            experiment_id=config['experiment_id']
+        )
+        return [r['abs_S'] for r in results]
+
+    return find_crossing(
+        evaluate, parameters['sigma_values'], threshold_S,
+        n_seeds=parameters['n_seeds'],
+        max_seeds=search.get('max_seeds', 4 * parameters['n_seeds']),
+        tol=search.get('tol', 0.01),
+        method=search.get('method', 'secant'),
+        first_seed=1
+    )
+
 def find_sigma_c(K_results, threshold_S=2.3, threshold_viol_rate=0.5):
     """
     Find σ_c for a given K by interpolation
@@ -124,6 +255,197 @@ def find_sigma_c(K_results, threshold_S=2.3, threshold_viol_rate=0.5):
     else:
         return None, 'indeterminate'
 
+def fit_scaling_law(K_for_fit, sigma_c_values):
+    """Linear fit σ_c = slope × K + intercept; returns (slope, intercept, R²) or Nones"""
+    if len(K_for_fit) < 2:
+        return None, None, None
+
+    coeffs = np.polyfit(K_for_fit, sigma_c_values, 1)
+    slope, intercept = coeffs
+
+    y_fit = np.polyval(coeffs, K_for_fit)
+    ss_res = np.sum((np.array(sigma_c_values) - y_fit)**2)
+    ss_tot = np.sum((np.array(sigma_c_values) - np.mean(sigma_c_values))**2)
+    r_squared = 1 - (ss_res / ss_tot)
+    return float(slope), float(intercept), float(r_squared)
+
+def run_threshold_search(config):
+    """A1 in threshold-search mode: adaptive σ_c(K) with confidence intervals"""
+    parameters = config['parameters']
+    K_values = parameters['K_values']
+    search = parameters['threshold_search']
+
+    print(f"Threshold search: tol = {search.get('tol', 0.01)}, "
+          f"seeds {parameters['n_seeds']} → {search.get('max_seeds', 4 * parameters['n_seeds'])} near the crossing")
+    print(f"Full-grid equivalent: {len(K_values) * len(parameters['sigma_values']) * parameters['n_seeds']} runs")
+    print()
+    print("=" * 80)
+
+    def report(index, task, result):
+        K = task[0]
+        if result['sigma'] is not None:
+            low, high = result['ci']
+            print(f"K = {K}: σ_c = {result['sigma']:.4f} [{low:.4f}, {high:.4f}] "
+                  f"({result['n_simulations']} runs, {len(result['points'])} σ points)")
+        else:
+            print(f"K = {K}: σ_c indeterminate in this range ({result['n_simulations']} runs)")
+
+    searches = run_sweep(search_sigma_c, [(K, config) for K in K_values],
+                         max_workers=parameters.get('n_workers'), on_result=report)
+
+    K_for_fit = [K for K, s in zip(K_values, searches) if s['sigma'] is not None]
+    sigma_c_values = [s['sigma'] for s in searches if s['sigma'] is not None]
+    slope, intercept, r_squared = fit_scaling_law(K_for_fit, sigma_c_values)
+    n_simulations = sum(s['n_simulations'] for s in searches)
+
+    print("\n" + "=" * 80)
+    print("SCALING LAW ANALYSIS")
+    print("=" * 80)
+    print(f"Total runs: {n_simulations}")
+    if slope is not None:
+        print(f"\nLinear fit: σ_c = {slope:.3f} × K + {intercept:.3f}")
+        print(f"R² = {r_squared:.4f}")
+
+    output_data = {
+        'experiment_id': config['experiment_id'],
+        'timestamp': datetime.now().isoformat(),
+        'config': config,
+        'threshold_search': [dict(search_result, K=K) for K, search_result in zip(K_values, searches)],
+        'n_simulations': n_simulations,
+        'sigma_c_analysis': {
+            'K_values': K_for_fit,
+            'sigma_c_values': sigma_c_values,
+            'sigma_c_ci': [s['ci'] for s in searches if s['sigma'] is not None],
+            'linear_fit': {
+                'slope': slope,
+                'intercept': intercept,
+                'r_squared': r_squared
+            }
+        }
+    }
+
+    output_file = save_output(output_data, "A1_sigma_c_K_sweep", config)
+
+    print(f"\n{'='*80}")
+    print(f"✅ A1 Complete")
+    print(f"Results saved to: {output_file}")
+    print(f"{'='*80}\n")
+
+def run_adaptive_landscape(config):
+    """A1 landscape by quadtree refinement: scattered points, dense along σ_c"""
+    parameters = config['parameters']
+    mesh = parameters['adaptive_mesh']
+    K_values = parameters['K_values']
+    sigma_values = parameters['sigma_values']
+
+    K_range = mesh.get('K_range', [min(K_values), max(K_values)])
+    sigma_range = mesh.get('sigma_range', [min(sigma_values), max(sigma_values)])
+    tolerances = mesh.get('tolerances', {'abs_S_mean': 0.05})
+    max_points = mesh.get('max_points', len(K_values) * len(sigma_values))
+
+    print(f"Adaptive mesh: K ∈ {K_range}, σ ∈ {sigma_range}, start {mesh.get('initial', [5, 5])}, "
+          f"depth ≤ {mesh.get('max_depth', 4)}, ≤ {max_points} points")
+    print(f"Refining on: {tolerances}")
+    print()
+    print("=" * 80)
+
+    point_count = 0
+
+    def report(index, task, result):
+        nonlocal point_count
+        point_count += 1
+        print(f"[{point_count}] K = {task[0]:.4f}, σ = {task[1]:.4f}: "
+              f"|S| = {result['abs_S_mean']:.3f}±{result['abs_S_sem']:.3f}, PLI = {result['PLI_mean']:.3f}")
+
+    records, cells = adaptive_mesh(
+        run_single_point, (config,), K_range, sigma_range, tolerances,
+        initial=tuple(mesh.get('initial', [5, 5])), max_depth=mesh.get('max_depth', 4),
+        max_points=max_points, max_workers=parameters.get('n_workers'), on_result=report
+    )
+
+    depths = [cell['depth'] for cell in cells]
+    print(f"\n{len(records)} points, {len(cells)} cells, depth {min(depths)}–{max(depths)}")
+
+    output_data = {
+        'experiment_id': config['experiment_id'],
+        'timestamp': datetime.now().isoformat(),
+        'config': config,
+        'grid_results': records,
+        'mesh': {
+            'K_range': K_range,
+            'sigma_range': sigma_range,
+            'tolerances': tolerances,
+            'cells': cells
+        }
+    }
+
+    output_file = save_output(output_data, "A1_adaptive_landscape", config)
+
+    print(f"\n{'='*80}")
+    print(f"✅ A1 Complete")
+    print(f"Results saved to: {output_file}")
+    print(f"{'='*80}\n")
+
+def run_dt_convergence(config):
+    """A1 in dt-convergence mode: discretization bias at selected (K, σ) points"""
+    parameters = config['parameters']
+    settings = parameters['dt_convergence']
+    points = [tuple(point) for point in settings['points']]
+    factors = settings.get('factors', [1, 2, 4])
+    scheme = parameters.get('scheme', 'euler')
+    order = settings.get('order', SCHEME_ORDER[scheme]['weak'])
+    tol = settings.get('tol')
+
+    print(f"dt convergence: {len(points)} points at dt × {factors} (dt = {parameters['dt']}, "
+          f"{scheme}, weak order {order}), {parameters['n_seeds']} shared Brownian paths each")
+    print()
+    print("=" * 80)
+
+    def report(index, task, result):
+        print(f"K = {task[0]}, σ = {task[1]}: |S| = {result['abs_S'][0]:.4f}, PLI = {result['PLI'][0]:.4f}, "
+              f"ρ_S = {result['rho_S'][0]:.4f}")
+
+    results = run_convergence_sweep(
+        convergence_point, [(K, sigma, config) for K, sigma in points], factors=factors, order=order,
+        tol=tol, extrapolate=settings.get('extrapolate', False),
+        max_workers=parameters.get('n_workers'), on_result=report
+    )
+
+    print("\n" + "=" * 80)
+    print("ESTIMATED BIAS at dt × factor")
+    print("=" * 80)
+    for (K, sigma), result in zip(points, results):
+        print(f"K = {K}, σ = {sigma}:")
+        for metric, bias in result['bias'].items():
+            print(f"  {metric:<6} " + "  ".join(f"{f}dt: {b:+.2e}" for f, b in zip(factors, bias)))
+        if tol is not None:
+            factor_max = result['factor_max']
+            print(f"  largest dt within {tol}: "
+                  f"{'none' if factor_max is None else factor_max * parameters['dt']}")
+
+    output_data = {
+        'experiment_id': config['experiment_id'],
+        'timestamp': datetime.now().isoformat(),
+        'config': config,
+        'grid_results': [dict(result, K=K, sigma=sigma) for (K, sigma), result in zip(points, results)],
+        'dt_convergence': {
+            'dt': parameters['dt'],
+            'scheme': scheme,
+            'order': order,
+            'tol': tol,
+            # Largest dt that meets the tolerance at every listed point
+            'dt_max': (min(r['factor_max'] for r in results) * parameters['dt']
+                       if tol is not None and all(r['factor_max'] for r in results) else None)
+        }
+    }
+
+    output_file = save_output(output_data, "A1_dt_convergence", config)
+
+    print(f"\n{'='*80}")
+    print(f"✅ A1 Complete")
+    print(f"Results saved to: {output_file}")
+    print(f"{'='*80}\n")
+
 def main():
     """Run A1: High-precision σ_c(K) sweep"""
     print("=" * 80)
@@ -137,6 +459,16 @@ def main():
     print(f"Purpose: {config['purpose']}")
     print()
 
+    if config['parameters'].get('threshold_search', {}).get('enabled', False):
+        run_threshold_search(config)
+        return
+    if config['parameters'].get('adaptive_mesh', {}).get('enabled', False):
+        run_adaptive_landscape(config)
+        return
+    if config['parameters'].get('dt_convergence', {}).get('enabled', False):
+        run_dt_convergence(config)
+        return
+
     K_values = config['parameters']['K_values']
     sigma_values = config['parameters']['sigma_values']
     delta_omega = config['parameters']['delta_omega']
@@ -144,39 +476,44 @@ def main():
     print(f"K values: {K_values}")
     print(f"σ values: {sigma_values}")
     print(f"Δω = {delta_omega}")
-    print(f"Seeds per point: {config['parameters']['n_seeds']}")
-    print(f"Total runs: {len(K_values) * len(sigma_values) * config['parameters']['n_seeds']}")
+    batch_means = config['parameters'].get('batch_means', {}).get('enabled', False)
+    if batch_means:
+        print(f"Batch means: one run per point, {config['parameters']['n_seeds']} × the measured steps")
+        print(f"Total runs: {len(K_values) * len(sigma_values)}")
+    else:
+        print(f"Seeds per point: {config['parameters']['n_seeds']}")
+        print(f"Total runs: {len(K_values) * len(sigma_values) * config['parameters']['n_seeds']}")
     print()
     print("=" * 80)
 
-    # Run full grid
-    all_results = []
-    total_points = len(K_values) * len(sigma_values)
+    # Run full grid, one (K, σ) point per task across all cores
+    point_fn = batch_means_point if batch_means else run_single_point
+    tasks = [(K, sigma, config) for K in K_values for sigma in sigma_values]
+    total_points = len(tasks)
     point_count = 0
 
-    for K in K_values:
-        print(f"\n{'='*80}")
-        print(f"K = {K}")
-        print(f"{'='*80}")
+    def report(index, task, result):
+        nonlocal point_count
+        point_count += 1
 
-        K_results = []
+        abs_S = result['abs_S_mean']
+        abs_S_sem = result['abs_S_sem']
+        PLI = result['PLI_mean']
+        viol_rate = result['violation_rate']
 
-        for sigma in sigma_values:
-            point_count += 1
-            print(f"\n[{point_count}/{total_points}] Running σ = {sigma:.2f}...")
+        violation_marker = "✓" if viol_rate > 0.5 else "·"
+        print(f"[{point_count}/{total_points}] K = {task[0]}, σ = {task[1]:.2f}: "
+              f"{violation_marker} |S| = {abs_S:.3f}±{abs_S_sem:.3f}, PLI = {PLI:.3f}, violations = {viol_rate:.1%}")
 
-            result = run_single_point(K, sigma, config)
-            K_results.append(result)
-            all_results.append(result)
+    all_results = run_sweep(point_fn, tasks,
+                            max_workers=config['parameters'].get('n_workers'), on_result=report)
 
-            # Report
-            abs_S = result['abs_S_mean']
-            abs_S_sem = result['abs_S_sem']
-            PLI = result['PLI_mean']
-            viol_rate = result['violation_rate']
+    for i, K in enumerate(K_values):
+        print(f"\n{'='*80}")
+        print(f"K = {K}")
+        print(f"{'='*80}")
 
-            violation_marker = "✓" if viol_rate > 0.5 else "·"
-            print(f"  {violation_marker} |S| = {abs_S:.3f}±{abs_S_sem:.3f}, PLI = {PLI:.3f}, violations = {viol_rate:.1%}")
+        K_results = all_results[i * len(sigma_values):(i + 1) * len(sigma_values)]
 
         # Find σ_c for this K
         sigma_c, method = find_sigma_c(K_results)
@@ -204,26 +541,36 @@ def main():
             print(f"K = {K:.1f}  →  σ_c = {sigma_c:.3f}")
 
     # Linear fit
-    if len(K_for_fit) >= 2:
-        coeffs = np.polyfit(K_for_fit, sigma_c_values, 1)
-        slope, intercept = coeffs
-
-        # R-squared
-        y_fit = np.polyval(coeffs, K_for_fit)
-        ss_res = np.sum((sigma_c_values - y_fit)**2)
-        ss_tot = np.sum((sigma_c_values - np.mean(sigma_c_values))**2)
-        r_squared = 1 - (ss_res / ss_tot)
-
+    slope, intercept, r_squared = fit_scaling_law(K_for_fit, sigma_c_values)
+    if slope is not None:
         print(f"\nLinear fit: σ_c = {slope:.3f} × K + {intercept:.3f}")
         print(f"R² = {r_squared:.4f}")
         print(f"\nExpected: σ_c ≈ 0.9 × K")
         print(f"Observed slope: {slope:.3f}")
 
-    # Save results
-    output_dir = Path(__file__).parent.parent.parent / "data" / "paper1"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    output_file = output_dir / "A1_sigma_c_K_sweep.json"
+    # Equilibration actually needed, per run, against the configured transient
+    # (only when the runs were asked to detect it)
+    transient_detection = None
+    if config['parameters'].get('auto_transient', False) or config['parameters'].get('report_transient', False):
+        detected = [r['transient_detected'] for point in all_results for r in point['individual_results']]
+        settled = [d for d in detected if d is not None]
+        transient_detection = {
+            'configured': config['parameters']['transient_steps'],
+            'max_detected': max(settled, default=None),
+            'median_detected': float(np.median(settled)) if settled else None,
+            'n_unsettled': len(detected) - len(settled),
+            'n_runs': len(detected)
+        }
+        print(f"\nDetected transient: median {transient_detection['median_detected']}, "
+              f"max {transient_detection['max_detected']} steps "
+              f"(configured {transient_detection['configured']}); "
+              f"{transient_detection['n_unsettled']}/{len(detected)} runs not settled")
+    if batch_means:
+        n_open = sum(1 for point in all_results if not point['batch_plateau'])
+        print(f"Batch means: {n_open}/{len(all_results)} points without a batch-size plateau "
+              f"(their SEM is a lower bound)")
 
+    # Save results
     output_data = {
         'experiment_id': config['experiment_id'],
         'timestamp': datetime.now().isoformat(),
@@ -233,15 +580,15 @@ def main():
             'K_values': K_for_fit,
             'sigma_c_values': sigma_c_values,
             'linear_fit': {
-                'slope': float(slope) if len(K_for_fit) >= 2 else None,
-                'intercept': float(intercept) if len(K_for_fit) >= 2 else None,
-                'r_squared': float(r_squared) if len(K_for_fit) >= 2 else None
+                'slope': slope,
+                'intercept': intercept,
+                'r_squared': r_squared
             }
-        }
+        },
+        'transient_detection': transient_detection
     }
 
-    with open(output_file, 'w') as f:
-        json.dump(output_data, f, indent=2)
+    output_file = save_output(output_data, "A1_sigma_c_K_sweep", config)
 
     print(f"\n{'='*80}")
     print(f"✅ A1 Complete")
@@ -12,6 +12,9 @@ Outputs:
 - Precise location of maximum with uncertainties
 - Ridge contour data
 
+Results are written as a columnar store (result_store) A2_angle_ridge.cols;
+"json_export": true in the config parameters also writes the JSON document.
+
 Expected Result:
 ----------------
 Maximum |S| near (Δα*, Δβ*) ≈ (98°, 82°)
@@ -27,7 +30,9 @@ from datetime import datetime
 # Add rut_core to path
 SCRIPT_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(SCRIPT_DIR))
-from rut_core import run_single_experiment
+from rut_core import run_ensemble_experiment, classify_regime
+from sweep import run_sweep
+from result_store import save_columnar, export_json, STORE_SUFFIX
 
 def load_config():
     """Load A2 configuration"""
@@ -35,15 +40,15 @@ def load_config():
     with open(config_path) as f:
         return json.load(f)
 
-def run_angle_point(delta_alpha, delta_beta, config):
-    """Run all seeds for a single angle pair"""
+def build_params(delta_alpha, delta_beta, config):
+    """Experiment parameters for a single angle pair"""
     # Baseline angles: a=0°, b=45°
     a = 0.0
     b = 45.0
     a_prime = a + delta_alpha
     b_prime = b + delta_beta
 
-    params = {
+    return {
         'K': config['parameters']['K'],
         'delta_omega': config['parameters']['delta_omega'],
         'sigma': config['parameters']['sigma'],
@@ -60,11 +65,50 @@ def run_angle_point(delta_alpha, delta_beta, config):
         'K_modulation': None
     }
 
+def run_seed(seed, config):
+    """Simulate one seed and keep its circular moments"""
+    params = build_params(
+        config['parameters']['delta_alpha_range'][0],
+        config['parameters']['delta_beta_range'][0],
+        config
+    )
+    bit_exact = config['parameters'].get('bit_exact', False)
+
+    return run_ensemble_experiment(
+        params, seeds=[seed], bit_exact=bit_exact, return_moments=True,
+        experiment_id=config['experiment_id']
+    )[0]
+
+def run_seeds(config):
+    """
+    Simulate every seed once, one seed per worker process
+
+    K, σ and Δω are fixed across the angle grid, so each seed's trajectory is
+    shared by all (Δα, Δβ) cells; it is kept only as its circular moments.
+    """
+    n_seeds = config['parameters']['n_seeds']
+    tasks = [(seed, config) for seed in range(1, n_seeds + 1)]
+
+    return run_sweep(run_seed, tasks, max_workers=config['parameters'].get('n_workers'))
+
+def run_angle_point(delta_alpha, delta_beta, config, seed_runs):
+    """Evaluate all seeds for a single angle pair from their circular moments"""
+    params = build_params(delta_alpha, delta_beta, config)
+
     n_seeds = config['parameters']['n_seeds']
     results = []
 
-    for seed in range(1, n_seeds + 1):
-        result = run_single_experiment(params, seed=seed)
+    for run in seed_runs:
+        correlations, S = run['moments'].chsh(params['angles'])
+        result = {key: value for key, value in run.items() if key != 'moments'}
+        result.update({
+            'parameters': params.copy(),
+            'S': S,
+            'abs_S': abs(S),
+            'correlations': correlations,
+            'violation': abs(S) > 2.0,
+            'regime': classify_regime(run['PLI'], abs(S))
+        })
         results.append(result)
 
     # Compute statistics
@@ -101,11 +145,16 @@ def main():
     print(f"Δα range: {delta_alpha_range}")
     print(f"Δβ range: {delta_beta_range}")
     print(f"Seeds per point: {config['parameters']['n_seeds']}")
-    print(f"Total runs: {len(delta_alpha_range) * len(delta_beta_range) * config['parameters']['n_seeds']}")
+    print(f"Total runs: {config['parameters']['n_seeds']} (one trajectory per seed, shared by all "
+          f"{len(delta_alpha_range) * len(delta_beta_range)} angle cells)")
     print()
     print("=" * 80)
 
-    # Run full grid
+    # Simulate each seed once
+    print("\nSimulating seeds...")
+    seed_runs = run_seeds(config)
+
+    # Evaluate the full angle grid
     all_results = []
     total_points = len(delta_alpha_range) * len(delta_beta_range)
     point_count = 0
@@ -113,9 +162,9 @@ def main():
     for delta_alpha in delta_alpha_range:
         for delta_beta in delta_beta_range:
             point_count += 1
-            print(f"\n[{point_count}/{total_points}] Running (Δα={delta_alpha:.0f}°, Δβ={delta_beta:.0f}°)...")
+            print(f"\n[{point_count}/{total_points}] Evaluating (Δα={delta_alpha:.0f}°, Δβ={delta_beta:.0f}°)...")
 
-            result = run_angle_point(delta_alpha, delta_beta, config)
+            result = run_angle_point(delta_alpha, delta_beta, config, seed_runs)
             all_results.append(result)
 
             abs_S = result['abs_S_mean']
@@ -137,7 +186,6 @@ def main():
     # Save results
     output_dir = Path(__file__).parent.parent.parent / "data" / "paper1"
     output_dir.mkdir(parents=True, exist_ok=True)
-    output_file = output_dir / "A2_angle_ridge.json"
 
     output_data = {
         'experiment_id': config['experiment_id'],
@@ -147,8 +195,9 @@ def main():
         'maximum': best
     }
 
-    with open(output_file, 'w') as f:
-        json.dump(output_data, f, indent=2)
+    output_file = save_columnar(output_dir / f"A2_angle_ridge{STORE_SUFFIX}", output_data)
+    if config['parameters'].get('json_export', False):
+        export_json(output_file)
 
     print(f"\n{'='*80}")
     print(f"✅ A2 Complete")
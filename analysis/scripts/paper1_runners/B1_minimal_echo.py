@@ -25,36 +25,33 @@ from datetime import datetime
 # Add rut_core to path
 SCRIPT_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(SCRIPT_DIR))
-from rut_core import run_single_experiment
+from rut_core import trajectory_dtheta, CircularMoments, autocorr_S
+from trajectory_cache import TrajectoryCache
 
-def compute_S_inst(theta1, theta2, angles):
-    """Compute instantaneous CHSH field"""
+def compute_S_inst(dtheta, angles):
+    """Compute instantaneous CHSH field from Δθ = θ2 − θ1"""
     a = np.deg2rad(angles['a'])
     a_prime = np.deg2rad(angles['a_prime'])
     b = np.deg2rad(angles['b'])
     b_prime = np.deg2rad(angles['b_prime'])
 
-    # Instantaneous correlations
-    E_ab = np.cos((theta1 + a) - (theta2 + b))
-    E_ab_prime = np.cos((theta1 + a) - (theta2 + b_prime))
-    E_a_prime_b = np.cos((theta1 + a_prime) - (theta2 + b))
-    E_a_prime_b_prime = np.cos((theta1 + a_prime) - (theta2 + b_prime))
+    # Instantaneous correlations: cos((θ1 + a) − (θ2 + b)) = cos(a − b − Δθ)
+    E_ab = np.cos(a - b - dtheta)
+    E_ab_prime = np.cos(a - b_prime - dtheta)
+    E_a_prime_b = np.cos(a_prime - b - dtheta)
+    E_a_prime_b_prime = np.cos(a_prime - b_prime - dtheta)
 
     # Instantaneous S
     S_inst = E_ab - E_ab_prime + E_a_prime_b + E_a_prime_b_prime
 
     return S_inst
 
-def compute_rho_S_autocorr(theta1, theta2, angles, tau, transient):
+def compute_rho_S_autocorr(dtheta, angles, tau, transient):
     """Compute temporal coherence of S_inst(t)"""
-    S_inst = compute_S_inst(theta1, theta2, angles)
+    S_inst = compute_S_inst(dtheta, angles)
     S = S_inst[transient:]
 
-    T = len(S) - tau
-    S_t = S[:T]
-    S_t_plus_tau = S[tau:T+tau]
-
-    rho = np.corrcoef(S_t, S_t_plus_tau)[0, 1]
+    rho = autocorr_S(S, tau)[tau]
     return float(rho)
 
 def load_config():
@@ -80,33 +77,25 @@ def run_sigma_point(sigma_name, sigma, config):
     n_seeds = config['parameters']['n_seeds']
     tau = config['parameters']['autocorr_tau']
 
-    # Need to run trajectories and compute custom ρ_S metric
+    # One trajectory per seed (same as run_single_experiment's), shared by
+    # the standard CHSH metrics and the custom ρ_S metric; reused from the
+    # trajectory cache when available
     all_abs_S = []
     all_PLI = []
     all_rho_S = []
 
-    from rut_core import kuramoto_with_noise, compute_pli
+    cache = TrajectoryCache() if config['parameters'].get('use_cache', True) else None
     for seed in range(1, n_seeds + 1):
-        # Run trajectory
-        omega1 = params['omega1']
-        omega2 = omega1 + params['delta_omega']
-        np.random.seed(seed)
-        theta1_0 = np.random.uniform(0, 2*np.pi)
-        theta2_0 = np.random.uniform(0, 2*np.pi)
-
-        theta1, theta2 = kuramoto_with_noise(
-            theta1_0, theta2_0, omega1, omega2,
-            params['K'], params['sigma'], params['T'], params['dt'],
-            seed=seed
-        )
+        dtheta = trajectory_dtheta(params, seed=seed, cache=cache)
 
         # Compute standard CHSH
-        result = run_single_experiment(params, seed=seed)
-        all_abs_S.append(result['abs_S'])
-        all_PLI.append(result['PLI'])
+        moments = CircularMoments.from_dtheta(dtheta, params['transient'])
+        _, S = moments.chsh(params['angles'])
+        all_abs_S.append(abs(S))
+        all_PLI.append(float(moments.pli))
 
         # Compute ρ_S_autocorr
-        rho_S = compute_rho_S_autocorr(theta1, theta2, params['angles'], tau, params['transient'])
+        rho_S = compute_rho_S_autocorr(dtheta, params['angles'], tau, params['transient'])
         all_rho_S.append(rho_S)
 
     return {
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Columnar result store for sweep outputs
+
+Sweep runners used to write one indented JSON document per experiment in
+which every grid point embeds its per-seed results, each with a full copy of
+the parameter dict. Figure scripts then parse the whole document to pull a
+few columns.
+
+A store is a directory (by convention NAME.cols) holding:
+
+    meta.json         everything that is not a table (config, analyses, ...),
+                      the column schema, and the shared parameter table
+    points/COL.npy    one typed array per grid-point field (K, sigma, ...)
+    seeds/COL.npy     one typed array per per-seed field, plus 'point' (row
+                      in points) and 'parameters' (row in the parameter table)
+
+Nested dicts are flattened to dotted column names ('correlations.E_ab').
+Every column is a plain .npy file, so load_columns memory-maps only the
+columns asked for. The loaders also accept the legacy JSON documents, so
+figure scripts work on old and new outputs alike, and export_json writes the
+original document back out for archival.
+"""
+
+import json
+import shutil
+from pathlib import Path
+import numpy as np
+
+STORE_SUFFIX = '.cols'
+STORE_FORMAT = 'rut-columnar-1'
+
+
+def _plain(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _flatten(record, prefix=''):
+    """Nested dicts -> {'a.b': leaf}"""
+    flat = {}
+    for key, value in record.items():
+        name = prefix + key
+        if isinstance(value, dict) and value:
+            flat.update(_flatten(value, name + '.'))
+        else:
+            flat[name] = _plain(value)
+    return flat
+
+
+def _unflatten(flat):
+    record = {}
+    for name, value in flat.items():
+        *parents, leaf = name.split('.')
+        node = record
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[leaf] = value
+    return record
+
+
+def _encode(values):
+    """List of JSON leaves -> (typed array, {'kind', 'nullable'})"""
+    present = [v for v in values if v is not None]
+    nullable = len(present) < len(values)
+
+    if present and all(isinstance(v, bool) for v in present):
+        kind = 'bool'
+    elif present and all(isinstance(v, int) and not isinstance(v, bool) for v in present):
+        kind = 'int'
+    elif present and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+        kind = 'float'
+    elif present and not nullable and all(isinstance(v, str) for v in present):
+        kind = 'str'
+    else:
+        kind = 'json'
+
+    if kind == 'bool' and not nullable:
+        array = np.array(values, dtype=bool)
+    elif kind == 'int' and not nullable:
+        array = np.array(values, dtype=np.int64)
+    elif kind in ('bool', 'int', 'float'):
+        # Missing values become NaN
+        array = np.array([np.nan if v is None else v for v in values], dtype=float)
+    elif kind == 'str':
+        array = np.array(values, dtype=str)
+    else:
+        array = np.array([json.dumps(v) for v in values], dtype=str)
+    return array, {'kind': kind, 'nullable': nullable}
+
+
+def _decode(value, spec):
+    """One array element -> JSON leaf"""
+    kind = spec['kind']
+    if kind == 'json':
+        return json.loads(str(value))
+    if spec['nullable'] and np.isnan(value):
+        return None
+    if kind == 'bool':
+        return bool(value)
+    if kind == 'int':
+        return int(value)
+    if kind == 'float':
+        return float(value)
+    return str(value)
+
+
+def _tables(data, records_key, seeds_key):
+    """Split a result document into (meta, {table: {column: values}}, parameter table)"""
+    meta = {key: value for key, value in data.items() if key != records_key}
+    records = data.get(records_key, [])
+
+    points = [_flatten({k: v for k, v in r.items() if k != seeds_key}) for r in records]
+    seeds = []
+    parameters = {}
+    for i, record in enumerate(records):
+        for result in record.get(seeds_key, []):
+            row = _flatten({k: v for k, v in result.items() if k != 'parameters'})
+            row['point'] = i
+            if 'parameters' in result:
+                key = json.dumps(result['parameters'], sort_keys=True, default=_plain)
+                row['parameters'] = parameters.setdefault(key, len(parameters))
+            seeds.append(row)
+
+    tables = {}
+    for table, rows in [('points', points), ('seeds', seeds)]:
+        if rows:
+            names = list(dict.fromkeys(name for row in rows for name in row))
+            tables[table] = {name: [row.get(name) for row in rows] for name in names}
+    return meta, tables, [json.loads(key) for key in parameters]
+
+
+def save_columnar(path, data, records_key='grid_results', seeds_key='individual_results'):
+    """
+    Write a result document as a columnar store
+
+    Parameters:
+    -----------
+    path : str or Path
+        Store directory (replaced if it already holds a store)
+    data : dict
+        Result document, e.g. {'experiment_id', 'config', 'grid_results', ...}
+    records_key : str
+        Key of the list of grid-point records
+    seeds_key : str
+        Key of the per-seed result list inside each grid-point record
+
+    Returns:
+    --------
+    path : Path
+        The store directory
+    """
+    path = Path(path)
+    if (path / 'meta.json').exists():
+        shutil.rmtree(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    meta, tables, parameters = _tables(data, records_key, seeds_key)
+    schema = {}
+    for table, columns in tables.items():
+        (path / table).mkdir()
+        schema[table] = {'n_rows': len(next(iter(columns.values()))), 'columns': {}}
+        for name, values in columns.items():
+            array, spec = _encode(values)
+            np.save(path / table / f"{name}.npy", array)
+            schema[table]['columns'][name] = spec
+
+    header = {
+        'format': STORE_FORMAT,
+        'records_key': records_key,
+        'seeds_key': seeds_key,
+        'tables': schema,
+        'parameters': parameters,
+        'meta': meta
+    }
+    with open(path / 'meta.json', 'w') as f:
+        json.dump(header, f, default=_plain)
+    return path
+
+
+def resolve_results(path):
+    """
+    Locate a result: the path itself, else PATH.cols, else PATH.json
+
+    Figure scripts pass the stem (data_dir / "A1_sigma_c_K_sweep") and get
+    the store when a runner has written one, the legacy JSON otherwise.
+    """
+    path = Path(path)
+    if path.exists():
+        return path
+    for suffix in (STORE_SUFFIX, '.json'):
+        candidate = path.with_name(path.name + suffix)
+        if candidate.exists():
+            return candidate
+    raise FileNotFoundError(f"No result store or JSON for {path}")
+
+
+def _header(path):
+    with open(path / 'meta.json') as f:
+        return json.load(f)
+
+
+def load_columns(path, columns=None, table='points', mmap=True,
+                 records_key='grid_results', seeds_key='individual_results'):
+    """
+    Read columns of one table as arrays
+
+    Parameters:
+    -----------
+    path : str or Path
+        Store, legacy JSON document, or stem (see resolve_results)
+    columns : list of str, optional
+        Columns to read (default: all)
+    table : str
+        'points' (one row per grid point) or 'seeds' (one row per seed)
+    mmap : bool
+        Memory-map the .npy files instead of reading them
+    records_key, seeds_key :
+        Layout of a legacy JSON document
+
+    Returns:
+    --------
+    columns : dict
+        {name: array}; missing values are NaN in numeric columns
+    """
+    path = resolve_results(path)
+
+    if path.is_dir():
+        schema = _header(path)['tables'][table]['columns']
+        names = list(schema) if columns is None else list(columns)
+        return {name: np.load(path / table / f"{name}.npy", mmap_mode='r' if mmap else None)
+                for name in names}
+
+    with open(path) as f:
+        data = json.load(f)
+    tables = _tables(data, records_key, seeds_key)[1][table]
+    names = list(tables) if columns is None else list(columns)
+    return {name: _encode(tables[name])[0] for name in names}
+
+
+def load_meta(path, records_key='grid_results'):
+    """Non-tabular part of a result (config, analyses, ...) as a dict"""
+    path = resolve_results(path)
+    if path.is_dir():
+        return _header(path)['meta']
+    with open(path) as f:
+        data = json.load(f)
+    return {key: value for key, value in data.items() if key != records_key}
+
+
+def load_results(path):
+    """
+    Rebuild the full result document (grid-point records with their
+    per-seed results and parameter dicts) from a store or JSON
+    """
+    path = resolve_results(path)
+    if not path.is_dir():
+        with open(path) as f:
+            return json.load(f)
+
+    header = _header(path)
+    schema = header['tables']
+    rows = {}
+    for table, spec in schema.items():
+        columns = {name: np.load(path / table / f"{name}.npy") for name in spec['columns']}
+        rows[table] = [
+            {name: _decode(columns[name][i], spec['columns'][name]) for name in columns}
+            for i in range(spec['n_rows'])
+        ]
+
+    records = [_unflatten(row) for row in rows.get('points', [])]
+    if 'seeds' in rows:
+        for record in records:
+            record[header['seeds_key']] = []
+        for row in rows['seeds']:
+            point = row.pop('point')
+            result = _unflatten(row)
+            if 'parameters' in row:
+                result['parameters'] = header['parameters'][row['parameters']]
+            records[point][header['seeds_key']].append(result)
+
+    data = dict(header['meta'])
+    data[header['records_key']] = records
+    return data
+
+
+def export_json(path, out_path=None, indent=None):
+    """
+    Write a store back out as a single JSON document for archival
+
+    Parameters:
+    -----------
+    path : str or Path
+        Store (or stem)
+    out_path : str or Path, optional
+        Output file (default: the store path with a .json suffix)
+    indent : int, optional
+        json.dump indentation (default: compact)
+
+    Returns:
+    --------
+    out_path : Path
+    """
+    path = resolve_results(path)
+    if out_path is None:
+        out_path = path.with_suffix('.json')
+    with open(out_path, 'w') as f:
+        json.dump(load_results(path), f, indent=indent)
+    return Path(out_path)
+
+
+def convert_json(json_path, store_path=None, records_key='grid_results',
+                 seeds_key='individual_results'):
+    """Convert a legacy JSON result document to a store next to it"""
+    json_path = Path(json_path)
+    if store_path is None:
+        store_path = json_path.with_suffix(STORE_SUFFIX)
+    with open(json_path) as f:
+        data = json.load(f)
+    return save_columnar(store_path, data, records_key, seeds_key)
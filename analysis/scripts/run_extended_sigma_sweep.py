@@ -14,54 +14,50 @@ from datetime import datetime
 # Add rut_core to path
 SCRIPT_DIR = Path(__file__).parent
 sys.path.insert(0, str(SCRIPT_DIR))
-from rut_core import run_single_experiment
+from rut_core import kuramoto_grid
 
-def run_sigma_sweep_for_K(K_val, sigma_values, n_seeds=10):
-    """Run σ sweep for a single K value"""
+def run_sigma_grid(K_values, sigma_values, n_seeds=10):
+    """Run the full (K, σ) grid × seeds in one lockstep grid-engine call"""
 
     # Parameters from A1 config
-    params_template = {
-        'K': K_val,
-        'delta_omega': 0.2,
-        'angles': {
-            'a': 0.0,
-            'a_prime': 95.0,
-            'b': 45.0,
-            'b_prime': 129.0
-        },
-        'T': 100000,
-        'dt': 0.01,
-        'transient': 20000,
-        'omega1': 1.0,
-        'K_modulation': None
+    angles = {
+        'a': 0.0,
+        'a_prime': 95.0,
+        'b': 45.0,
+        'b_prime': 129.0
     }
 
-    results = []
-
-    for sigma in sigma_values:
-        print(f"  σ={sigma:.2f}...", end='', flush=True)
-
-        params = params_template.copy()
-        params['sigma'] = sigma
+    metrics = kuramoto_grid(
+        K=np.asarray(K_values)[:, None],
+        sigma=np.asarray(sigma_values)[None, :],
+        delta_omega=0.2,
+        seeds=range(1, n_seeds + 1),
+        T=100000,
+        dt=0.01,
+        transient=20000,
+        angles=angles,
+        omega1=1.0,
+        # A1's seed streams, so (K, σ) points shared with A1 replay its noise
+        experiment_id='A1-SIGMA-C-K-SWEEP'
+    )
+    abs_S = metrics['abs_S']
 
-        # Run seeds
-        seed_results = []
-        for seed in range(1, n_seeds + 1):
-            result = run_single_experiment(params, seed=seed)
-            seed_results.append(result)
+    results = []
 
-        # Compute statistics
-        abs_S_vals = [r['abs_S'] for r in seed_results]
+    for i, K_val in enumerate(K_values):
+        print(f"\nK = {K_val}")
+        for j, sigma in enumerate(sigma_values):
+            abs_S_vals = abs_S[i, j]
 
-        results.append({
-            'K': K_val,
-            'sigma': sigma,
-            'abs_S_mean': float(np.mean(abs_S_vals)),
-            'abs_S_std': float(np.std(abs_S_vals, ddof=1)),
-            'abs_S_sem': float(np.std(abs_S_vals, ddof=1) / np.sqrt(n_seeds))
-        })
+            results.append({
+                'K': K_val,
+                'sigma': sigma,
+                'abs_S_mean': float(np.mean(abs_S_vals)),
+                'abs_S_std': float(np.std(abs_S_vals, ddof=1)),
+                'abs_S_sem': float(np.std(abs_S_vals, ddof=1) / np.sqrt(n_seeds))
+            })
 
-        print(f" |S|={results[-1]['abs_S_mean']:.3f}")
+            print(f"  σ={sigma:.2f}... |S|={results[-1]['abs_S_mean']:.3f}")
 
     return results
 
@@ -84,13 +80,8 @@ def main():
     print(f"Total runs: {len(new_K_values) * len(sigma_values) * n_seeds} = {len(new_K_values)}×{len(sigma_values)}×{n_seeds}")
     print()
 
-    # Run sweeps
-    all_results = []
-
-    for i, K_val in enumerate(new_K_values, 1):
-        print(f"\n[{i}/{len(new_K_values)}] K = {K_val}")
-        K_results = run_sigma_sweep_for_K(K_val, sigma_values, n_seeds)
-        all_results.extend(K_results)
+    # Run the whole grid in lockstep
+    all_results = run_sigma_grid(new_K_values, sigma_values, n_seeds)
 
     # Save results
     output_dir = SCRIPT_DIR.parent / "data" / "paper1"
@@ -5,8 +5,26 @@ Extracted from run_experiment.py for reproducibility framework
 """
 
 import numpy as np
+from scipy.fft import next_fast_len
+from scipy.signal import lfilter
 
-def kuramoto_with_noise(theta1_0, theta2_0, omega1, omega2, K, sigma, T, dt, seed=None, K_modulation=None):
+from seed_streams import trajectory_rng, point_of, initial_phases
+
+# Part of every trajectory cache key; bump when the integrator's output changes
+ENGINE_VERSION = 'euler-maruyama-1'
+
+# Integration schemes for the additive-noise SDE (see sde_step)
+SDE_SCHEMES = ('euler', 'milstein', 'heun', 'srk')
+# Strong and weak order of convergence of each scheme for additive noise
+SCHEME_ORDER = {
+    'euler': {'strong': 1.0, 'weak': 1.0},
+    'milstein': {'strong': 1.0, 'weak': 1.0},
+    'heun': {'strong': 1.0, 'weak': 2.0},
+    'srk': {'strong': 1.5, 'weak': 2.0}
+}
+
+def kuramoto_with_noise(theta1_0, theta2_0, omega1, omega2, K, sigma, T, dt, seed=None, K_modulation=None,
+                        scheme='euler', increments=None, tangents=False):
     """
     Kuramoto coupling with optional noise and time-varying coupling
 
@@ -24,18 +42,62 @@ def kuramoto_with_noise(theta1_0, theta2_0, omega1, omega2, K, sigma, T, dt, see
         Number of time steps
     dt : float
         Time step
-    seed : int, optional
-        Random seed for reproducibility
+    seed : int or np.random.Generator, optional
+        Random seed for the legacy global RNG, or a per-trajectory stream
+        (see seed_streams.trajectory_rng) from which the noise is drawn in
+        one block without touching global state
     K_modulation : dict, optional
         If provided: {'amplitude': A, 'frequency': omega} for K(t) = K + A*sin(omega*t)
+    scheme : str
+        Integration scheme, one of SDE_SCHEMES (see sde_step). The default
+        Euler–Maruyama path is unchanged; the other schemes draw their
+        increments with brownian_increments, so 'heun' and 'srk' see the
+        same ΔW as Euler–Maruyama for a given stream.
+    increments : (dW, dZ), optional
+        Pre-drawn increments from brownian_increments / coarsen_increments,
+        used instead of drawing (T is then len(dW) + 1)
+    tangents : bool
+        Also integrate the variational equations of Δθ = θ2 − θ1 with
+        respect to σ and K along the path (Euler–Maruyama only); the
+        trajectory itself is unchanged
 
     Returns:
     --------
     theta1, theta2 : arrays
         Phase trajectories
+    tangents : dict, only if tangents=True
+        {'sigma': ∂Δθ/∂σ, 'K': ∂Δθ/∂K}, arrays of shape (T,)
     """
-    if seed is not None:
-        np.random.seed(seed)
+    if scheme not in SDE_SCHEMES:
+        raise ValueError(f"Unknown scheme {scheme!r}, expected one of {SDE_SCHEMES}")
+
+    if tangents:
+        if scheme not in ('euler', 'milstein') or increments is not None:
+            raise ValueError("Tangents are integrated for the Euler–Maruyama scheme on drawn noise")
+        return _euler_with_tangents(theta1_0, theta2_0, omega1, omega2, K, sigma, T, dt, seed, K_modulation)
+
+    if increments is not None or scheme not in ('euler', 'milstein'):
+        if increments is None:
+            increments = brownian_increments(seed, sigma, T, dt, scheme)
+        dW, dZ = increments
+        theta1 = np.zeros(len(dW) + 1)
+        theta2 = np.zeros(len(dW) + 1)
+        theta1[0] = theta1_0
+        theta2[0] = theta2_0
+        for t in range(len(dW)):
+            K_t, K_next, dK = _coupling_at(K, K_modulation, t, dt)
+            theta1[t+1], theta2[t+1] = sde_step(
+                theta1[t], theta2[t], omega1, omega2, K_t, sigma, dt, dW[t],
+                None if dZ is None else dZ[t], scheme, K_next, dK
+            )
+        return theta1, theta2
+
+    if isinstance(seed, np.random.Generator):
+        noise = seed.normal(0, sigma * np.sqrt(dt), size=(T - 1, 2))
+    else:
+        noise = None
+        if seed is not None:
+            np.random.seed(seed)
 
     theta1 = np.zeros(T)
     theta2 = np.zeros(T)
@@ -54,8 +116,11 @@ def kuramoto_with_noise(theta1_0, theta2_0, omega1, omega2, K, sigma, T, dt, see
         coupling2 = K_t * np.sin(theta1[t] - theta2[t])
 
         # Gaussian noise with proper √dt scaling (Wiener process)
-        eta1 = np.random.normal(0, sigma * np.sqrt(dt))
-        eta2 = np.random.normal(0, sigma * np.sqrt(dt))
+        if noise is None:
+            eta1 = np.random.normal(0, sigma * np.sqrt(dt))
+            eta2 = np.random.normal(0, sigma * np.sqrt(dt))
+        else:
+            eta1, eta2 = noise[t]
 
         # Update: deterministic part (×dt) + stochastic part (already scaled)
         theta1[t+1] = theta1[t] + dt * (omega1 + coupling1) + eta1
@@ -64,6 +129,619 @@ def kuramoto_with_noise(theta1_0, theta2_0, omega1, omega2, K, sigma, T, dt, see
     return theta1, theta2
 
 
+def _euler_with_tangents(theta1_0, theta2_0, omega1, omega2, K, sigma, T, dt, seed, K_modulation):
+    """
+    kuramoto_with_noise plus the tangents u = ∂Δθ/∂σ, v = ∂Δθ/∂K
+
+    Differentiating the Euler step of Δθ = θ2 − θ1 along a fixed Brownian
+    path gives the linear recursions
+
+        u[t+1] = (1 − 2K dt cos Δθ) u[t] + √dt (ξ2 − ξ1)
+        v[t+1] = (1 − 2K dt cos Δθ) v[t] − 2 dt sin Δθ
+
+    from u = v = 0 (the initial phases do not depend on σ or K). The noise is
+    drawn as standard normals ξ and scaled, which gives the same numbers as
+    the plain engine, so the tangents also exist at σ = 0.
+    """
+    if isinstance(seed, np.random.Generator):
+        xi = seed.standard_normal((T - 1, 2))
+    else:
+        if seed is not None:
+            np.random.seed(seed)
+        xi = np.random.standard_normal((T - 1, 2))
+    noise = sigma * np.sqrt(dt) * xi
+    drive = np.sqrt(dt) * (xi[:, 1] - xi[:, 0])
+
+    theta1 = np.zeros(T)
+    theta2 = np.zeros(T)
+    u = np.zeros(T)
+    v = np.zeros(T)
+    theta1[0] = theta1_0
+    theta2[0] = theta2_0
+
+    for t in range(T - 1):
+        K_t = _coupling_at(K, K_modulation, t, dt)[0]
+        delta = theta2[t] - theta1[t]
+
+        coupling1 = K_t * np.sin(theta2[t] - theta1[t])
+        coupling2 = K_t * np.sin(theta1[t] - theta2[t])
+        theta1[t+1] = theta1[t] + dt * (omega1 + coupling1) + noise[t, 0]
+        theta2[t+1] = theta2[t] + dt * (omega2 + coupling2) + noise[t, 1]
+
+        contraction = 1 - 2 * K_t * dt * np.cos(delta)
+        u[t+1] = contraction * u[t] + drive[t]
+        v[t+1] = contraction * v[t] - 2 * dt * np.sin(delta)
+
+    return theta1, theta2, {'sigma': u, 'K': v}
+
+
+def _coupling_at(K, K_modulation, t, dt):
+    """K(t), K(t + dt) and dK/dt at step t"""
+    if K_modulation is None:
+        return K, K, 0.0
+    amplitude, frequency = K_modulation['amplitude'], K_modulation['frequency']
+    return (K + amplitude * np.sin(frequency * t * dt),
+            K + amplitude * np.sin(frequency * (t + 1) * dt),
+            amplitude * frequency * np.cos(frequency * t * dt))
+
+
+def sde_step(theta1, theta2, omega1, omega2, K_t, sigma, dt, dW, dZ=None, scheme='euler',
+             K_next=None, dK=0.0):
+    """
+    One step of the two-oscillator Kuramoto SDE
+
+        dθ1 = (ω1 + K sin(θ2 − θ1)) dt + σ dW1
+        dθ2 = (ω2 − K sin(θ2 − θ1)) dt + σ dW2
+
+    The noise is additive, so the Milstein correction (∝ ∂b/∂θ) vanishes and
+    'milstein' is Euler–Maruyama. The schemes:
+
+        'euler', 'milstein'  strong order 1, weak order 1
+        'heun'               stochastic Heun (predictor–corrector on the
+                             drift, same ΔW): weak order 2
+        'srk'                order-1.5 strong Itô–Taylor scheme for additive
+                             noise (Kloeden & Platen 10.4), written out with
+                             the analytic drift derivatives: strong order 1.5,
+                             weak order 2. Needs the double integral
+                             ΔZ = ∫∫ dW ds on top of ΔW.
+
+    Works on scalars and on arrays of trajectories alike.
+
+    Parameters:
+    -----------
+    theta1, theta2 : float or array
+        Phases at the start of the step
+    omega1, omega2 : float or array
+        Natural frequencies
+    K_t : float or array
+        Coupling at the start of the step
+    sigma : float or array
+        Noise strength
+    dt : float
+        Time step
+    dW : array, shape (..., 2)
+        σ·ΔW of both oscillators
+    dZ : array, shape (..., 2), optional
+        σ·ΔZ of both oscillators ('srk' only)
+    scheme : str
+        One of SDE_SCHEMES
+    K_next : float or array, optional
+        Coupling at the end of the step ('heun'; default K_t)
+    dK : float
+        dK/dt at the start of the step ('srk')
+
+    Returns:
+    --------
+    theta1, theta2 : phases at the end of the step
+    """
+    dW1, dW2 = dW[..., 0], dW[..., 1]
+    s = np.sin(theta2 - theta1)
+
+    if scheme in ('euler', 'milstein'):
+        return theta1 + dt * (omega1 + K_t * s) + dW1, theta2 + dt * (omega2 - K_t * s) + dW2
+
+    if scheme == 'heun':
+        if K_next is None:
+            K_next = K_t
+        a1 = omega1 + K_t * s
+        a2 = omega2 - K_t * s
+        s_pred = np.sin((theta2 + dt * a2 + dW2) - (theta1 + dt * a1 + dW1))
+        return (theta1 + 0.5 * dt * (a1 + omega1 + K_next * s_pred) + dW1,
+                theta2 + 0.5 * dt * (a2 + omega2 - K_next * s_pred) + dW2)
+
+    if scheme == 'srk':
+        # The drift is ±K sin(θ2 − θ1) + ω, so every derivative is ±K cos or ±K sin:
+        # L⁰a = ∂a/∂t + Σ a_j ∂a/∂θ_j + ½σ² Σ ∂²a/∂θ_j², and σ Σ ∂a/∂θ_j ΔZ_j
+        c = np.cos(theta2 - theta1)
+        L0 = dK * s + K_t * c * (omega2 - omega1 - 2 * K_t * s) - sigma**2 * K_t * s
+        correction = K_t * c * (dZ[..., 1] - dZ[..., 0]) + 0.5 * dt**2 * L0
+        return (theta1 + dt * (omega1 + K_t * s) + dW1 + correction,
+                theta2 + dt * (omega2 - K_t * s) + dW2 - correction)
+
+    raise ValueError(f"Unknown scheme {scheme!r}, expected one of {SDE_SCHEMES}")
+
+
+def brownian_increments(seed, sigma, T, dt, scheme='euler'):
+    """
+    Noise increments of one trajectory for sde_step
+
+    σ·ΔW is drawn exactly as kuramoto_with_noise draws its noise, so every
+    scheme sees the same Brownian path for a given stream. 'srk' also needs
+    an independent ΔV ~ N(0, dt) per step for the double integral
+
+        ΔZ = ½ dt (ΔW + ΔV/√3)
+
+    which has the right variance dt³/3 and covariance dt²/2 with ΔW. For a
+    Generator, ΔV comes from a jumped copy of the stream (_srk_stream), so
+    the realisation does not depend on how the draws are split into blocks
+    (kuramoto_ensemble draws the same ΔW and ΔV block by block). The legacy
+    global RNG draws all ΔV after all ΔW.
+
+    Parameters:
+    -----------
+    seed : int or np.random.Generator, optional
+        Seed for the legacy global RNG, or a per-trajectory stream
+    sigma, T, dt :
+        As in kuramoto_with_noise
+    scheme : str
+        ΔZ is only drawn for 'srk'
+
+    Returns:
+    --------
+    dW : array, shape (T-1, 2)
+        σ·ΔW
+    dZ : array, shape (T-1, 2), or None
+        σ·ΔZ
+    """
+    if isinstance(seed, np.random.Generator):
+        normal = seed.normal
+        extra_normal = _srk_stream(seed).normal
+    else:
+        if seed is not None:
+            np.random.seed(seed)
+        normal = extra_normal = np.random.normal
+
+    noise_scale = sigma * np.sqrt(dt)
+    dW = normal(0, noise_scale, size=(T - 1, 2))
+    dZ = None
+    if scheme == 'srk':
+        dZ = 0.5 * dt * (dW + extra_normal(0, noise_scale, size=(T - 1, 2)) / np.sqrt(3))
+    return dW, dZ
+
+
+def _srk_stream(rng):
+    """
+    Stream of the 'srk' ΔV increments belonging to trajectory stream rng
+
+    A copy of rng's bit generator jumped far ahead (bit_generator.jumped),
+    taken before any ΔW is drawn. It does not overlap ΔW in practice and
+    leaves rng itself untouched.
+    """
+    return np.random.Generator(rng.bit_generator.jumped())
+
+
+def coarsen_increments(dW, dZ, factor, dt):
+    """
+    Increments of the same Brownian path on a grid `factor` times coarser
+
+    ΔW of a coarse step is the sum of its fine ΔW; its double integral is
+
+        ΔZ = Σ_i [ΔZ_i + dt·(W(t_i) − W(t_0))]
+
+    over the fine steps i it contains. A trailing partial step is dropped.
+
+    Parameters:
+    -----------
+    dW, dZ : arrays, shape (n, ...), dZ may be None
+        Fine-grid σ·ΔW and σ·ΔZ (brownian_increments)
+    factor : int
+        Fine steps per coarse step
+    dt : float
+        Fine time step
+
+    Returns:
+    --------
+    dW, dZ : arrays, shape (n // factor, ...) (dZ None if not given)
+    """
+    n = len(dW) // factor
+    blocks = np.asarray(dW)[:n * factor].reshape((n, factor) + np.shape(dW)[1:])
+    coarse_dW = blocks.sum(axis=1)
+    if dZ is None:
+        return coarse_dW, None
+    # W(t_i) − W(t_0) at the start of each fine step
+    walked = np.cumsum(blocks, axis=1) - blocks
+    coarse_dZ = np.asarray(dZ)[:n * factor].reshape(blocks.shape).sum(axis=1) + dt * walked.sum(axis=1)
+    return coarse_dW, coarse_dZ
+
+
+def kuramoto_ensemble(theta1_0, theta2_0, omega1, omega2, K, sigma, T, dt, seeds=None,
+                      K_modulation=None, bit_exact=False, block_size=10000, scheme='euler'):
+    """
+    Seed-ensemble version of kuramoto_with_noise
+
+    Advances all trajectories of the ensemble together, one vectorized step
+    at a time, with noise pre-drawn in blocks of `block_size` steps from one
+    np.random.Generator per seed. The realisation differs from the legacy
+    global-RNG path but the statistics are the same; pass bit_exact=True to
+    reproduce kuramoto_with_noise seed-for-seed.
+
+    Parameters:
+    -----------
+    theta1_0, theta2_0 : arrays, shape (n_seeds,)
+        Initial phases. Alternatively pass a single (n_seeds, 2) array as
+        theta1_0 and leave theta2_0 as None.
+    omega1, omega2 : float
+        Natural frequencies
+    K : float
+        Coupling strength
+    sigma : float
+        Noise strength
+    T : int
+        Number of time steps
+    dt : float
+        Time step
+    seeds : sequence of int or np.random.Generator, optional
+        One seed or stream per trajectory (default: unseeded generators)
+    K_modulation : dict, optional
+        Same as kuramoto_with_noise
+    bit_exact : bool
+        Integrate each trajectory with kuramoto_with_noise instead
+    block_size : int
+        Number of steps of noise drawn per block
+    scheme : str
+        Integration scheme, one of SDE_SCHEMES (see sde_step)
+
+    Returns:
+    --------
+    theta1, theta2 : arrays, shape (n_seeds, T)
+        Phase trajectories
+    """
+    if scheme not in SDE_SCHEMES:
+        raise ValueError(f"Unknown scheme {scheme!r}, expected one of {SDE_SCHEMES}")
+
+    if theta2_0 is None:
+        state0 = np.array(theta1_0, dtype=float).reshape(-1, 2)
+    else:
+        state0 = np.column_stack([np.atleast_1d(theta1_0), np.atleast_1d(theta2_0)]).astype(float)
+    n_seeds = state0.shape[0]
+
+    if seeds is None:
+        seeds = [None] * n_seeds
+    seeds = list(seeds)
+    if len(seeds) != n_seeds:
+        raise ValueError(f"Got {len(seeds)} seeds for {n_seeds} trajectories")
+
+    if bit_exact:
+        theta1 = np.zeros((n_seeds, T))
+        theta2 = np.zeros((n_seeds, T))
+        for i, seed in enumerate(seeds):
+            theta1[i], theta2[i] = kuramoto_with_noise(
+                state0[i, 0], state0[i, 1], omega1, omega2, K, sigma, T, dt,
+                seed=seed, K_modulation=K_modulation, scheme=scheme
+            )
+        return theta1, theta2
+
+    rngs = [np.random.default_rng(seed) for seed in seeds]
+    theta1 = np.zeros((n_seeds, T))
+    theta2 = np.zeros((n_seeds, T))
+    theta1[:, 0], theta2[:, 0] = state0[:, 0], state0[:, 1]
+
+    for start, states in _ensemble_blocks(state0, omega1, omega2, K, sigma, T, dt, rngs,
+                                          K_modulation, block_size, scheme):
+        theta1[:, start:start + len(states)] = states[:, :, 0].T
+        theta2[:, start:start + len(states)] = states[:, :, 1].T
+
+    return theta1, theta2
+
+
+def _ensemble_blocks(state0, omega1, omega2, K, sigma, T, dt, rngs, K_modulation=None,
+                     block_size=10000, scheme='euler'):
+    """
+    Integrate a seed ensemble one block of noise at a time
+
+    Yields (start, states) per block, states[k] being the (n_seeds, 2)
+    phases at step start + k for k = 0 … n_steps; consecutive blocks share
+    their boundary step. Only the current block is held in memory, so
+    callers that reduce the blocks (_ensemble_metrics) never store the
+    trajectories.
+    """
+    noise_scale = sigma * np.sqrt(dt)
+    state = np.array(state0, dtype=float)
+    if scheme == 'srk':
+        extra_rngs = [_srk_stream(rng) for rng in rngs]
+
+    for start in range(0, T - 1, block_size):
+        n_steps = min(block_size, T - 1 - start)
+        noise = np.stack([rng.normal(0, noise_scale, size=(n_steps, 2)) for rng in rngs], axis=1)
+
+        # Time-major storage so each step writes one contiguous (n_seeds, 2) slab
+        states = np.empty((n_steps + 1,) + state.shape)
+        states[0] = state
+
+        if scheme not in ('euler', 'milstein'):
+            if scheme == 'srk':
+                extra = np.stack([rng.normal(0, noise_scale, size=(n_steps, 2)) for rng in extra_rngs], axis=1)
+                double = 0.5 * dt * (noise + extra / np.sqrt(3))
+            for k in range(n_steps):
+                t = start + k
+                K_t, K_next, dK = _coupling_at(K, K_modulation, t, dt)
+                state[:, 0], state[:, 1] = sde_step(
+                    state[:, 0], state[:, 1], omega1, omega2, K_t, sigma, dt, noise[k],
+                    double[k] if scheme == 'srk' else None, scheme, K_next, dK
+                )
+                states[k + 1] = state
+            yield start, states
+            continue
+
+        for k in range(n_steps):
+            t = start + k
+            if K_modulation is not None:
+                K_t = K + K_modulation['amplitude'] * np.sin(K_modulation['frequency'] * t * dt)
+            else:
+                K_t = K
+
+            coupling = K_t * np.sin(state[:, 1] - state[:, 0])
+
+            state[:, 0] += dt * (omega1 + coupling) + noise[k, :, 0]
+            state[:, 1] += dt * (omega2 - coupling) + noise[k, :, 1]
+            states[k + 1] = state
+        yield start, states
+
+
+def _ensemble_metrics(blocks, state0, T, transient, lambda_decay=0.9):
+    """
+    Circular moments and echo density of every trajectory of _ensemble_blocks
+
+    The same sums over t ≥ transient as CircularMoments.from_trajectories and
+    compute_echo_density, accumulated block by block (the echo filter state
+    is carried across blocks).
+
+    Returns:
+    --------
+    moments : CircularMoments
+        C and Sn of shape (n_seeds,)
+    rho_echo : array, shape (n_seeds,)
+    """
+    n_seeds = state0.shape[0]
+    b = [1 - lambda_decay]
+    a = [1, -lambda_decay]
+    zi = np.zeros((1, n_seeds, 2), dtype=complex)
+    cos_sum = np.zeros(n_seeds)
+    sin_sum = np.zeros(n_seeds)
+    cross_sum = np.zeros(n_seeds, dtype=complex)
+
+    if transient == 0:
+        cos_sum += np.cos(state0[:, 1] - state0[:, 0])
+        sin_sum += np.sin(state0[:, 1] - state0[:, 0])
+
+    for start, states in blocks:
+        # states[1 + k] is step start + 1 + k
+        first = max(transient - start - 1, 0)
+        E, zi = lfilter(b, a, np.exp(1j * np.diff(states, axis=0)), axis=0, zi=zi)
+        if first < len(states) - 1:
+            dtheta = states[1 + first:, :, 1] - states[1 + first:, :, 0]
+            cos_sum += np.sum(np.cos(dtheta), axis=0)
+            sin_sum += np.sum(np.sin(dtheta), axis=0)
+            cross_sum += np.sum(E[first:, :, 0] * np.conj(E[first:, :, 1]), axis=0)
+
+    n_avg = T - transient
+    return CircularMoments(cos_sum / n_avg, sin_sum / n_avg, n_samples=n_avg), np.abs(cross_sum / n_avg)
+
+
+def kuramoto_grid(K, sigma, delta_omega, seeds, T, dt, transient, angles, omega1=1.0,
+                  echo=True, lambda_decay=0.9, sample_interval=None, block_size=1000,
+                  experiment_id='rut_core'):
+    """
+    Integrate a whole (K, σ, Δω) parameter grid × seeds in lockstep
+
+    K, sigma and delta_omega are broadcast against each other into a grid of
+    points; every point is run for every seed, so the state is one
+    (n_points, n_seeds) tensor per oscillator. Metrics are accumulated on the
+    fly after the transient, so no trajectory is stored.
+
+    Each (point, seed) trajectory draws its initial phases and then its
+    noise, in blocks of `block_size` steps, from its own seed stream keyed by
+    (experiment_id, (K, σ, Δω), seed). A point's result therefore does not
+    depend on which other points share the grid.
+
+    Parameters:
+    -----------
+    K, sigma, delta_omega : float or array
+        Grid axes, broadcast together (e.g. K[:, None], sigma[None, :])
+    seeds : sequence of int
+        Random seeds, shared by all grid points
+    T, dt, transient : int, float, int
+        As in run_single_experiment
+    angles : dict
+        CHSH measurement angles in degrees
+    omega1 : float
+        Natural frequency of oscillator 1 (omega2 = omega1 + Δω)
+    echo : bool
+        Also accumulate the cross-echo density ρ_echo
+    lambda_decay : float
+        Echo smoothing constant (see compute_echo_density)
+    sample_interval : int, optional
+        If given, also return Δθ = θ2 − θ1 sampled every `sample_interval`
+        steps after the transient
+    block_size : int
+        Number of steps of noise drawn per block
+    experiment_id : str
+        Seed-stream namespace (see seed_streams.trajectory_rng)
+
+    Returns:
+    --------
+    metrics : dict
+        'K', 'sigma', 'delta_omega' : broadcast grid, shape grid_shape
+        'PLI', 'S', 'abs_S', 'E_ab', 'E_ab_prime', 'E_a_prime_b',
+        'E_a_prime_b_prime', 'rho_echo' : shape grid_shape + (n_seeds,)
+        'dtheta_samples' : shape grid_shape + (n_seeds, n_samples), if requested
+    """
+    K, sigma, delta_omega = np.broadcast_arrays(
+        np.asarray(K, dtype=float), np.asarray(sigma, dtype=float), np.asarray(delta_omega, dtype=float)
+    )
+    grid_shape = K.shape
+    seeds = list(seeds)
+    n_points = K.size
+    n_seeds = len(seeds)
+
+    K_col = K.reshape(-1, 1)
+    omega2_col = omega1 + delta_omega.reshape(-1, 1)
+    noise_scale = (sigma.reshape(-1) * np.sqrt(dt))[:, None, None]
+
+    points = zip(K.reshape(-1), sigma.reshape(-1), delta_omega.reshape(-1))
+    rngs = [trajectory_rng(experiment_id, point, seed) for point in points for seed in seeds]
+
+    theta0 = np.array([initial_phases(rng) for rng in rngs]).reshape(n_points, n_seeds, 2)
+    theta1 = theta0[:, :, 0].copy()
+    theta2 = theta0[:, :, 1].copy()
+
+    # Running sums over post-transient steps
+    cos_sum = np.zeros((n_points, n_seeds))
+    sin_sum = np.zeros((n_points, n_seeds))
+    echo_sum = np.zeros((n_points, n_seeds), dtype=complex)
+    E_A = np.zeros((n_points, n_seeds), dtype=complex)
+    E_B = np.zeros((n_points, n_seeds), dtype=complex)
+
+    if sample_interval is not None:
+        n_samples = len(range(transient, T, sample_interval))
+        samples = np.zeros((n_samples, n_points, n_seeds))
+
+    def accumulate(t):
+        dtheta = theta2 - theta1
+        cos_sum[...] += np.cos(dtheta)
+        sin_sum[...] += np.sin(dtheta)
+        if echo:
+            echo_sum[...] += E_A * np.conj(E_B)
+        if sample_interval is not None and (t - transient) % sample_interval == 0:
+            samples[(t - transient) // sample_interval] = dtheta
+
+    if transient == 0:
+        accumulate(0)
+
+    for start in range(0, T - 1, block_size):
+        n_steps = min(block_size, T - 1 - start)
+        noise = np.stack([rng.standard_normal((n_steps, 2)) for rng in rngs], axis=1)
+        noise = noise.reshape(n_steps, n_points, n_seeds, 2) * noise_scale
+
+        for k in range(n_steps):
+            t = start + k + 1
+            coupling = K_col * np.sin(theta2 - theta1)
+
+            dtheta1 = dt * (omega1 + coupling) + noise[k, :, :, 0]
+            dtheta2 = dt * (omega2_col - coupling) + noise[k, :, :, 1]
+            theta1 += dtheta1
+            theta2 += dtheta2
+
+            if echo:
+                E_A[...] = lambda_decay * E_A + (1 - lambda_decay) * np.exp(1j * dtheta1)
+                E_B[...] = lambda_decay * E_B + (1 - lambda_decay) * np.exp(1j * dtheta2)
+
+            if t >= transient:
+                accumulate(t)
+
+    n_avg = T - transient
+    moments = CircularMoments(cos_sum / n_avg, sin_sum / n_avg, n_samples=n_avg)
+    correlations, S = moments.chsh(angles)
+
+    out_shape = grid_shape + (n_seeds,)
+    metrics = {
+        'K': K.copy(),
+        'sigma': sigma.copy(),
+        'delta_omega': delta_omega.copy(),
+        'PLI': moments.pli.reshape(out_shape),
+        'S': S.reshape(out_shape),
+        'abs_S': np.abs(S).reshape(out_shape)
+    }
+    for name, E in correlations.items():
+        metrics[name] = E.reshape(out_shape)
+    if echo:
+        metrics['rho_echo'] = np.abs(echo_sum / n_avg).reshape(out_shape)
+    if sample_interval is not None:
+        metrics['dtheta_samples'] = np.moveaxis(samples, 0, -1).reshape(out_shape + (n_samples,))
+
+    return metrics
+
+
+def phase_difference_sde(dtheta0, delta_omega, K, sigma, T, dt, seed=None, increments=None):
+    """
+    Reduced engine: integrate only the phase difference Δθ = θ2 − θ1
+
+    With symmetric coupling the pair (θ1, θ2) of kuramoto_with_noise closes
+    on the 1-D SDE
+
+        dΔθ = (Δω − 2K·sin Δθ) dt + √2·σ dW
+
+    which is all that PLI and the CHSH correlations depend on. Half the work
+    and half the trajectory storage of the full engine.
+
+    Parameters:
+    -----------
+    dtheta0 : float or array, shape (n,)
+        Initial phase difference(s); an array integrates an ensemble
+    delta_omega : float
+        Frequency mismatch omega2 − omega1
+    K : float
+        Coupling strength
+    sigma : float
+        Noise strength of each oscillator
+    T : int
+        Number of time steps
+    dt : float
+        Time step
+    seed : int, np.random.Generator or sequence of these, optional
+        Seed(s) or seed stream(s), one per trajectory. A single int for an
+        ensemble is spawned into n independent streams
+        (np.random.SeedSequence.spawn); a single Generator is drawn from
+        for each trajectory in turn
+    increments : array, shape (T-1,) or (n, T-1), optional
+        Pre-drawn noise increments of Δθ (already scaled), used instead of
+        drawing; see legacy_difference_increments
+
+    Returns:
+    --------
+    dtheta : array, shape (T,) or (n, T)
+        Phase-difference trajectory
+    """
+    dtheta0 = np.asarray(dtheta0, dtype=float)
+    n = dtheta0.size
+    if np.ndim(seed):
+        seeds = list(seed)
+    elif n > 1 and seed is not None and not isinstance(seed, np.random.Generator):
+        seeds = np.random.SeedSequence(seed).spawn(n)
+    else:
+        seeds = [seed] * n
+
+    if increments is None:
+        noise_scale = np.sqrt(2) * sigma * np.sqrt(dt)
+        increments = np.stack([
+            np.random.default_rng(s).normal(0, noise_scale, size=T - 1) for s in seeds
+        ])
+    increments = np.asarray(increments, dtype=float).reshape(n, T - 1)
+
+    dtheta = np.zeros((T, n))
+    dtheta[0] = dtheta0.reshape(n)
+    for t in range(T - 1):
+        dtheta[t+1] = dtheta[t] + dt * (delta_omega - 2 * K * np.sin(dtheta[t])) + increments[:, t]
+
+    if dtheta0.ndim == 0:
+        return dtheta[:, 0]
+    return dtheta.T
+
+
+def legacy_difference_increments(sigma, T, dt, seed=None):
+    """
+    Δθ noise increments η2 − η1 as drawn by kuramoto_with_noise
+
+    Reproduces the legacy global-RNG draw order, so that
+    phase_difference_sde(..., increments=...) follows the exact same noise
+    path as the full two-oscillator engine.
+    """
+    if seed is not None:
+        np.random.seed(seed)
+    eta = np.random.normal(0, sigma * np.sqrt(dt), size=(T - 1, 2))
+    return eta[:, 1] - eta[:, 0]
+
+
 def compute_pli(theta1, theta2, transient=0):
     """Compute Phase Lock Index"""
     delta = theta2[transient:] - theta1[transient:]
@@ -71,23 +749,322 @@ def compute_pli(theta1, theta2, transient=0):
     return pli
 
 
-def compute_echo_density(theta1, theta2, transient=0, lambda_decay=0.9):
-    """Compute cross-echo density (simplified version)"""
-    # Echo signals via exponential smoothing
-    T = len(theta1)
-    E_A = np.zeros(T, dtype=complex)
-    E_B = np.zeros(T, dtype=complex)
+def compute_echo_density(theta1, theta2, transient=0, lambda_decay=0.9, block_size=65536):
+    """
+    Compute cross-echo density (simplified version)
+
+    The echo signals are exponential smoothings of the per-step phase
+    increments,
+
+        E[t] = λ·E[t−1] + (1 − λ)·exp(i·(θ[t] − θ[t−1])),   E[0] = 0
+
+    i.e. a first-order IIR filter. It is run with scipy.signal.lfilter over
+    blocks of `block_size` steps, carrying the filter state between blocks,
+    so no T-length complex buffer is allocated.
+
+    Parameters:
+    -----------
+    theta1, theta2 : arrays, shape (T,) or (..., T)
+        Phase trajectories; leading axes are a batch (e.g. seeds)
+    transient : int
+        Steps excluded from the average
+    lambda_decay : float
+        Smoothing constant λ
+    block_size : int
+        Steps filtered per block
+
+    Returns:
+    --------
+    rho_echo : float or array of shape theta1.shape[:-1]
+        |⟨E_A · conj(E_B)⟩| over t ≥ transient
+    """
+    theta1 = np.asarray(theta1, dtype=float)
+    theta2 = np.asarray(theta2, dtype=float)
+    T = theta1.shape[-1]
+    batch = theta1.shape[:-1]
+
+    b = [1 - lambda_decay]
+    a = [1, -lambda_decay]
+    zi_A = np.zeros(batch + (1,), dtype=complex)
+    zi_B = np.zeros(batch + (1,), dtype=complex)
+    cross_sum = np.zeros(batch, dtype=complex)
 
-    for t in range(1, T):
-        dtheta1 = theta1[t] - theta1[t-1]
-        dtheta2 = theta2[t] - theta2[t-1]
+    # E[0] = 0 adds nothing to the sum, so filtering starts at t = 1
+    for start in range(1, T, block_size):
+        stop = min(start + block_size, T)
+        E_A, zi_A = lfilter(b, a, np.exp(1j * np.diff(theta1[..., start - 1:stop], axis=-1)), zi=zi_A)
+        E_B, zi_B = lfilter(b, a, np.exp(1j * np.diff(theta2[..., start - 1:stop], axis=-1)), zi=zi_B)
 
-        E_A[t] = lambda_decay * E_A[t-1] + (1 - lambda_decay) * np.exp(1j * dtheta1)
-        E_B[t] = lambda_decay * E_B[t-1] + (1 - lambda_decay) * np.exp(1j * dtheta2)
+        first = max(transient - start, 0)
+        if first < stop - start:
+            cross_sum += np.sum(E_A[..., first:] * np.conj(E_B[..., first:]), axis=-1)
 
     # Cross-echo density
-    rho_echo = np.abs(np.mean(E_A[transient:] * np.conj(E_B[transient:])))
-    return rho_echo
+    rho_echo = np.abs(cross_sum / (T - transient))
+    return float(rho_echo) if rho_echo.ndim == 0 else rho_echo
+
+
+def autocorr_S(S_series, max_lag):
+    """
+    Autocorrelation ρ_S(τ) of an S(t) series at every lag τ = 0 … max_lag
+
+    Same estimator as the per-lag Pearson correlation
+
+        ρ_S(τ) = corr(S[:N−τ], S[τ:])
+
+    but all lags at once: the lagged cross sums come from one FFT of the
+    zero-padded series (O(N log N)) and the segment means/variances from
+    cumulative sums.
+
+    Parameters:
+    -----------
+    S_series : array, shape (N,) or (..., N)
+        S(t) after the transient; leading axes are a batch (e.g. seeds)
+    max_lag : int
+        Largest lag, in samples
+
+    Returns:
+    --------
+    rho_S : array of shape S_series.shape[:-1] + (max_lag + 1,)
+        ρ_S(0) = 1; NaN where fewer than two pairs exist or S is constant
+    """
+    S = np.asarray(S_series, dtype=float)
+    N = S.shape[-1]
+    lags = np.arange(max_lag + 1)
+
+    # Pearson correlation is shift invariant; centering keeps the sums well conditioned
+    x = S - S.mean(axis=-1, keepdims=True)
+
+    n_fft = next_fast_len(N + max_lag)
+    spectrum = np.fft.rfft(x, n_fft, axis=-1)
+    cross = np.fft.irfft(spectrum * np.conj(spectrum), n_fft, axis=-1)[..., :max_lag + 1]
+
+    zero = np.zeros(S.shape[:-1] + (1,))
+    c1 = np.concatenate([zero, np.cumsum(x, axis=-1)], axis=-1)
+    c2 = np.concatenate([zero, np.cumsum(x**2, axis=-1)], axis=-1)
+    # S[:N−τ] and S[τ:] (lags ≥ N leave empty segments)
+    m = np.clip(N - lags, 0, N)
+    head_1, head_2 = c1[..., m], c2[..., m]
+    tail_1, tail_2 = c1[..., N:] - c1[..., N - m], c2[..., N:] - c2[..., N - m]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean_x = head_1 / m
+        mean_y = tail_1 / m
+        var_x = head_2 / m - mean_x**2
+        var_y = tail_2 / m - mean_y**2
+        cov = cross / m - mean_x * mean_y
+        rho = np.where((m >= 2) & (var_x > 0) & (var_y > 0), cov / np.sqrt(var_x * var_y), np.nan)
+
+    rho[..., 0] = np.where(var_x[..., 0] > 0, 1.0, np.nan)
+    return rho
+
+
+def ensemble_autocorr_S(S_series, max_lag):
+    """
+    Seed-averaged ρ_S(τ) curve
+
+    Parameters:
+    -----------
+    S_series : array, shape (n_seeds, N)
+        One post-transient S(t) series per seed
+    max_lag : int
+        Largest lag, in samples
+
+    Returns:
+    --------
+    rho_S_mean, rho_S_sem : arrays, shape (max_lag + 1,)
+        Mean over seeds and its standard error
+    """
+    rho_S_all = autocorr_S(S_series, max_lag)
+    n_seeds = rho_S_all.shape[0]
+    rho_S_mean = np.mean(rho_S_all, axis=0)
+    rho_S_sem = np.std(rho_S_all, axis=0, ddof=1) / np.sqrt(n_seeds) if n_seeds > 1 else np.zeros_like(rho_S_mean)
+    return rho_S_mean, rho_S_sem
+
+
+def autocorr_S_tangent(S_series, dS_series, lag):
+    """
+    Derivative of autocorr_S(S_series, lag)[lag] along a tangent dS of S(t)
+
+    With x = S[:N−τ], y = S[τ:] (centred) and ρ = ⟨xy⟩ / √(⟨x²⟩⟨y²⟩):
+
+        dρ = (⟨x dy⟩ + ⟨dx y⟩) / √(⟨x²⟩⟨y²⟩) − ρ (⟨x dx⟩/⟨x²⟩ + ⟨y dy⟩/⟨y²⟩)
+
+    Returns:
+    --------
+    rho, drho : float
+        ρ_S(lag) and its derivative (NaN where ρ_S is undefined)
+    """
+    S = np.asarray(S_series, dtype=float)
+    dS = np.asarray(dS_series, dtype=float)
+    N = S.shape[-1]
+    x, y = S[..., :N - lag], S[..., lag:]
+    dx, dy = dS[..., :N - lag], dS[..., lag:]
+    x = x - x.mean(axis=-1, keepdims=True)
+    y = y - y.mean(axis=-1, keepdims=True)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        var_x = np.mean(x**2, axis=-1)
+        var_y = np.mean(y**2, axis=-1)
+        norm = np.sqrt(var_x * var_y)
+        rho = np.mean(x * y, axis=-1) / norm
+        drho = ((np.mean(x * dy, axis=-1) + np.mean(dx * y, axis=-1)) / norm
+                - rho * (np.mean(x * dx, axis=-1) / var_x + np.mean(y * dy, axis=-1) / var_y))
+    return rho, drho
+
+
+class CircularMoments:
+    """
+    First circular moments of the phase difference Δθ = θ2 − θ1
+
+    C = ⟨cos Δθ⟩ and Sn = ⟨sin Δθ⟩ are all the CHSH correlations depend on:
+
+        E(a,b) = ⟨cos((θ1 + a) − (θ2 + b))⟩ = C·cos(a−b) + Sn·sin(a−b)
+
+    so one pass over a trajectory is enough to evaluate S for any number of
+    angle sets in O(1) each. C and Sn may be arrays (e.g. one entry per seed
+    or grid point); everything below broadcasts.
+    """
+
+    def __init__(self, C, Sn, n_samples=None):
+        self.C = C
+        self.Sn = Sn
+        self.n_samples = n_samples
+
+    @classmethod
+    def from_dtheta(cls, dtheta, transient=0):
+        """Reduce a Δθ trajectory (last axis = time) after `transient` steps"""
+        delta = np.asarray(dtheta)[..., transient:]
+        return cls(np.mean(np.cos(delta), axis=-1), np.mean(np.sin(delta), axis=-1),
+                   n_samples=delta.shape[-1])
+
+    @classmethod
+    def from_trajectories(cls, theta1, theta2, transient=0):
+        """Reduce a pair of phase trajectories after `transient` steps"""
+        return cls.from_dtheta(np.asarray(theta2)[..., transient:] - np.asarray(theta1)[..., transient:])
+
+    @classmethod
+    def from_tangent(cls, dtheta, tangent, transient=0):
+        """
+        Derivatives (∂C, ∂Sn) along a tangent ∂Δθ of the same trajectory
+
+        C and Sn enter E(a,b) and S linearly, so .chsh() and .correlation()
+        of the result are the derivatives of S and E.
+        """
+        delta = np.asarray(dtheta)[..., transient:]
+        du = np.asarray(tangent)[..., transient:]
+        return cls(np.mean(-np.sin(delta) * du, axis=-1), np.mean(np.cos(delta) * du, axis=-1),
+                   n_samples=delta.shape[-1])
+
+    @property
+    def pli(self):
+        """Phase Lock Index |⟨exp(iΔθ)⟩|"""
+        return np.hypot(self.C, self.Sn)
+
+    def correlation(self, angle_a, angle_b):
+        """E(a,b) for angles in radians (same convention as compute_bell_correlation)"""
+        diff = np.asarray(angle_a) - np.asarray(angle_b)
+        return self.C * np.cos(diff) + self.Sn * np.sin(diff)
+
+    def chsh(self, angles):
+        """
+        CHSH correlations and S for an angle dict in degrees
+
+        Returns the same (correlations, S) pair as compute_chsh_correlations.
+        """
+        a = np.deg2rad(angles['a'])
+        a_prime = np.deg2rad(angles['a_prime'])
+        b = np.deg2rad(angles['b'])
+        b_prime = np.deg2rad(angles['b_prime'])
+
+        E_ab = self.correlation(a, b)
+        E_ab_prime = self.correlation(a, b_prime)
+        E_a_prime_b = self.correlation(a_prime, b)
+        E_a_prime_b_prime = self.correlation(a_prime, b_prime)
+
+        S = E_ab - E_ab_prime + E_a_prime_b + E_a_prime_b_prime
+
+        if np.ndim(S) == 0:
+            E_ab, E_ab_prime = float(E_ab), float(E_ab_prime)
+            E_a_prime_b, E_a_prime_b_prime = float(E_a_prime_b), float(E_a_prime_b_prime)
+            S = float(S)
+
+        correlations = {
+            'E_ab': E_ab,
+            'E_ab_prime': E_ab_prime,
+            'E_a_prime_b': E_a_prime_b,
+            'E_a_prime_b_prime': E_a_prime_b_prime
+        }
+
+        return correlations, S
+
+
+def optimize_angles_analytic(moments, a=0.0, verify=False, verify_step=5.0):
+    """
+    Closed-form maximum of S over (a, a', b, b') given the circular moments
+
+    With E(a,b) = R·cos(a − b − ψ), R = PLI and ψ = atan2(Sn, C), the four
+    arguments of S are tied by one linear constraint and the maximum is the
+    Tsirelson-type value S* = 2√2·R, reached at
+
+        a' = a + 90°,  b = a − ψ + 45°,  b' = a − ψ + 135°
+
+    (a is a free gauge). Moments may be arrays; the result broadcasts.
+
+    Parameters:
+    -----------
+    moments : CircularMoments
+        Summary of the trajectory
+    a : float
+        Gauge choice for angle a, in degrees
+    verify : bool
+        Also brute-force S over a grid of (a', b, b') at fixed a and report
+        the gap to the analytic optimum (scalar moments only)
+    verify_step : float
+        Grid step in degrees for the verification search
+
+    Returns:
+    --------
+    optimum : dict
+        'S_star' : maximal S
+        'angles' : {'a', 'a_prime', 'b', 'b_prime'} in degrees, in [0, 360)
+        'verification' : {'S_grid', 'angles_grid', 'gap'} if verify
+    """
+    R = moments.pli
+    psi = np.rad2deg(np.arctan2(moments.Sn, moments.C))
+
+    angles = {
+        'a': np.mod(a, 360.0),
+        'a_prime': np.mod(a + 90.0, 360.0),
+        'b': np.mod(a - psi + 45.0, 360.0),
+        'b_prime': np.mod(a - psi + 135.0, 360.0)
+    }
+    S_star = 2 * np.sqrt(2) * R
+
+    if np.ndim(S_star) == 0:
+        S_star = float(S_star)
+        angles = {key: float(value) for key, value in angles.items()}
+
+    optimum = {'S_star': S_star, 'angles': angles}
+
+    if verify:
+        grid = np.arange(0.0, 360.0, verify_step)
+        a_prime, b, b_prime = np.meshgrid(grid, grid, grid, indexing='ij')
+        _, S_grid = moments.chsh({'a': a, 'a_prime': a_prime, 'b': b, 'b_prime': b_prime})
+        best = np.unravel_index(np.argmax(S_grid), S_grid.shape)
+
+        optimum['verification'] = {
+            'S_grid': float(S_grid[best]),
+            'angles_grid': {
+                'a': float(a),
+                'a_prime': float(grid[best[0]]),
+                'b': float(grid[best[1]]),
+                'b_prime': float(grid[best[2]])
+            },
+            'gap': float(S_star - S_grid[best])
+        }
+
+    return optimum
 
 
 def compute_bell_correlation(theta_A, theta_B, angle_a, angle_b):
@@ -98,7 +1075,12 @@ def compute_bell_correlation(theta_A, theta_B, angle_a, angle_b):
            = ⟨cos(Δθ + (a - b))⟩
 
     This is the CORRECT formula for coupled oscillators.
+
+    theta_A may also be a CircularMoments summary (theta_B is then ignored).
     """
+    if isinstance(theta_A, CircularMoments):
+        return float(theta_A.correlation(angle_a, angle_b))
+
     # Apply measurement offsets
     measured_A = theta_A + angle_a
     measured_B = theta_B + angle_b
@@ -110,14 +1092,15 @@ def compute_bell_correlation(theta_A, theta_B, angle_a, angle_b):
     return float(correlation)
 
 
-def compute_chsh_correlations(theta1, theta2, angles, transient=0):
+def compute_chsh_correlations(theta1, theta2=None, angles=None, transient=0):
     """
     Compute CHSH correlations E(a,b) for given measurement angles
 
     Parameters:
     -----------
     theta1, theta2 : arrays
-        Phase trajectories
+        Phase trajectories. theta1 may instead be a CircularMoments summary,
+        in which case theta2 and transient are ignored.
     angles : dict
         {'a': angle_a, 'a_prime': angle_a_prime, 'b': angle_b, 'b_prime': angle_b_prime}
         Angles in degrees
@@ -131,36 +1114,197 @@ def compute_chsh_correlations(theta1, theta2, angles, transient=0):
     S : float
         CHSH statistic
     """
-    # Convert angles to radians
-    a = np.deg2rad(angles['a'])
-    a_prime = np.deg2rad(angles['a_prime'])
-    b = np.deg2rad(angles['b'])
-    b_prime = np.deg2rad(angles['b_prime'])
-
-    # Trim transient
-    th1 = theta1[transient:]
-    th2 = theta2[transient:]
-
-    # Compute correlations using CORRECT formula
-    E_ab = compute_bell_correlation(th1, th2, a, b)
-    E_ab_prime = compute_bell_correlation(th1, th2, a, b_prime)
-    E_a_prime_b = compute_bell_correlation(th1, th2, a_prime, b)
-    E_a_prime_b_prime = compute_bell_correlation(th1, th2, a_prime, b_prime)
-
-    # CHSH statistic
-    S = E_ab - E_ab_prime + E_a_prime_b + E_a_prime_b_prime
-
-    correlations = {
-        'E_ab': E_ab,
-        'E_ab_prime': E_ab_prime,
-        'E_a_prime_b': E_a_prime_b,
-        'E_a_prime_b_prime': E_a_prime_b_prime
+    if isinstance(theta1, CircularMoments):
+        moments = theta1
+    else:
+        # One pass reduces the trajectory to (⟨cos Δθ⟩, ⟨sin Δθ⟩)
+        moments = CircularMoments.from_trajectories(theta1, theta2, transient)
+
+    return moments.chsh(angles)
+
+
+def compute_chsh_dtheta(dtheta, angles, transient=0):
+    """
+    compute_chsh_correlations for a phase-difference trajectory Δθ = θ2 − θ1
+
+    Returns the same (correlations, S) pair as the two-trajectory version.
+    """
+    return CircularMoments.from_dtheta(dtheta, transient).chsh(angles)
+
+
+def rolling_chsh(dtheta, angles, windows, transient=0):
+    """
+    Windowed CHSH series S(t) from a phase-difference trajectory Δθ = θ2 − θ1
+
+    S(t) is compute_chsh_dtheta over Δθ[t : t + window]. The window means
+    of cos Δθ and sin Δθ are differences of two prefix sums, so each window
+    size costs O(N) vectorized work however long the window is, and the
+    prefix sums are shared by all window sizes.
+
+    Parameters:
+    -----------
+    dtheta : array, shape (N,) or (..., N)
+        Phase difference; leading axes are a batch (e.g. seeds)
+    angles : dict
+        CHSH measurement angles in degrees
+    windows : int or sequence of int
+        Window length(s) in samples, each between 1 and N − transient
+        (ValueError otherwise)
+    transient : int
+        Samples dropped before the first window
+
+    Returns:
+    --------
+    S_series : array of shape (..., N − transient − window + 1), or a dict
+        {window: S_series} when several windows are given
+    """
+    delta = np.asarray(dtheta, dtype=float)[..., transient:]
+    zero = np.zeros(delta.shape[:-1] + (1,))
+    cos_sum = np.concatenate([zero, np.cumsum(np.cos(delta), axis=-1)], axis=-1)
+    sin_sum = np.concatenate([zero, np.cumsum(np.sin(delta), axis=-1)], axis=-1)
+
+    S_by_window = {}
+    for window in np.atleast_1d(windows):
+        window = int(window)
+        if not 1 <= window <= delta.shape[-1]:
+            raise ValueError(f"window = {window} must be between 1 and the {delta.shape[-1]} samples "
+                             f"after the transient ({transient})")
+        moments = CircularMoments(
+            (cos_sum[..., window:] - cos_sum[..., :-window]) / window,
+            (sin_sum[..., window:] - sin_sum[..., :-window]) / window,
+            n_samples=window
+        )
+        S_by_window[window] = moments.chsh(angles)[1]
+
+    if np.ndim(windows) == 0:
+        return S_by_window[int(windows)]
+    return S_by_window
+
+
+def rolling_chsh_tangent(dtheta, tangent, angles, window, transient=0):
+    """
+    Derivative of rolling_chsh(dtheta, angles, window) along a tangent ∂Δθ
+
+    Window means of −sin Δθ·∂Δθ and cos Δθ·∂Δθ replace those of cos Δθ
+    and sin Δθ (see CircularMoments.from_tangent).
+
+    Returns:
+    --------
+    dS_series : array, same shape as rolling_chsh's S_series
+    """
+    delta = np.asarray(dtheta, dtype=float)[..., transient:]
+    du = np.asarray(tangent, dtype=float)[..., transient:]
+    zero = np.zeros(delta.shape[:-1] + (1,))
+    dC = np.concatenate([zero, np.cumsum(-np.sin(delta) * du, axis=-1)], axis=-1)
+    dSn = np.concatenate([zero, np.cumsum(np.cos(delta) * du, axis=-1)], axis=-1)
+    moments = CircularMoments((dC[..., window:] - dC[..., :-window]) / window,
+                              (dSn[..., window:] - dSn[..., :-window]) / window, n_samples=window)
+    return moments.chsh(angles)[1]
+
+
+def run_reduced_experiment(params, seed=None, experiment_id=None):
+    """
+    run_single_experiment on the reduced Δθ engine
+
+    Same parameters, initial conditions and result layout; 'rho_echo' is
+    None because the echo density needs the individual phases.
+    """
+    # Random initial conditions, drawn as in run_single_experiment
+    theta1_0, theta2_0, rng = _initial_state(params, seed, experiment_id)
+
+    dtheta = phase_difference_sde(
+        theta2_0 - theta1_0, params['delta_omega'], params['K'], params['sigma'],
+        params['T'], params['dt'], seed=rng
+    )
+
+    moments = CircularMoments.from_dtheta(dtheta, params['transient'])
+    pli = float(moments.pli)
+    correlations, S = moments.chsh(params['angles'])
+
+    return {
+        'seed': seed,
+        'parameters': params.copy(),
+        'PLI': pli,
+        'rho_echo': None,
+        'S': S,
+        'abs_S': abs(S),
+        'correlations': correlations,
+        'violation': abs(S) > 2.0,
+        'regime': classify_regime(pli, abs(S))
     }
 
-    return correlations, S
 
+def _initial_state(params, seed, experiment_id, initial_state=None):
+    """
+    Initial phases and noise source of one run_single_experiment trajectory
+
+    Returns (theta1_0, theta2_0, rng) where rng is the seed stream, or the
+    seed itself on the legacy global-RNG path. A given initial_state
+    (θ1, θ2) replaces the random phases; they are still drawn, so the noise
+    that follows is the same as for a cold start.
+    """
+    if experiment_id is not None:
+        rng = trajectory_rng(experiment_id, point_of(params), seed)
+        theta1_0, theta2_0 = initial_phases(rng)
+    else:
+        if seed is not None:
+            np.random.seed(seed)
+        theta1_0 = np.random.uniform(0, 2*np.pi)
+        theta2_0 = np.random.uniform(0, 2*np.pi)
+        rng = seed
+
+    if initial_state is not None:
+        theta1_0, theta2_0 = initial_state
+    return theta1_0, theta2_0, rng
 
-def run_single_experiment(params, seed=None):
+
+def trajectory_dtheta(params, seed=None, experiment_id=None, cache=None):
+    """
+    Δθ = θ2 − θ1 of run_single_experiment's trajectory, through an optional cache
+
+    The full-length Δθ is enough for PLI, every CHSH value and the S(t)
+    autocorrelation, so it is what gets stored: a cached trajectory can be
+    reused by any runner or figure script with the same dynamics parameters,
+    seed and RNG namespace, whatever its angles or transient.
+
+    Parameters:
+    -----------
+    params : dict
+        Same as run_single_experiment (angles and transient are not used)
+    seed : int, optional
+        Random seed
+    experiment_id : str, optional
+        Seed-stream namespace (default: legacy global RNG)
+    cache : trajectory_cache.TrajectoryCache, optional
+        Disk cache to read from and write to
+
+    Returns:
+    --------
+    dtheta : array, shape (T,)
+    """
+    def simulate():
+        theta1_0, theta2_0, rng = _initial_state(params, seed, experiment_id)
+        omega1 = 1.0
+        theta1, theta2 = kuramoto_with_noise(
+            theta1_0, theta2_0, omega1, omega1 + params['delta_omega'], params['K'],
+            params['sigma'], params['T'], params['dt'],
+            seed=rng, K_modulation=params.get('K_modulation', None),
+            scheme=params.get('scheme', 'euler')
+        )
+        return {'dtheta': theta2 - theta1}
+
+    if cache is None:
+        return simulate()['dtheta']
+
+    dynamics = {name: params.get(name) for name in ['K', 'delta_omega', 'sigma', 'T', 'dt', 'K_modulation']}
+    if params.get('scheme', 'euler') != 'euler':
+        dynamics['scheme'] = params['scheme']
+    key = cache.key('dtheta', dynamics, seed, experiment_id or 'legacy', ENGINE_VERSION)
+    return cache.fetch(key, simulate)['dtheta']
+
+
+def run_single_experiment(params, seed=None, experiment_id=None, initial_state=None,
+                          return_state=False):
     """
     Run a single experiment with given parameters
 
@@ -176,13 +1320,34 @@ def run_single_experiment(params, seed=None):
         - dt: time step
         - transient: transient cutoff
         - K_modulation: optional time-varying coupling
+        - scheme: optional integration scheme (default 'euler', see sde_step)
+        - sensitivities: optional, also return pathwise ∂/∂σ and ∂/∂K of
+          PLI, S, |S| (and ρ_S at lag 'autocorr_tau' over 'S_window'-step
+          windows, if autocorr_tau is set); Euler–Maruyama only
+        - transient_window: optional detect_transient window (default 1000)
+        - auto_transient: optional, measure from the detected transient
+          instead of `transient` (kept when none is detected)
+        - report_transient: optional, run detect_transient and record the
+          result without applying it (implied by auto_transient)
     seed : int, optional
         Random seed
+    experiment_id : str, optional
+        If given, draw initial phases and noise from the seed stream
+        (experiment_id, (K, σ, Δω), seed) instead of the legacy global RNG
+    initial_state : (float, float), optional
+        Start from these phases (θ1, θ2) instead of random ones, e.g. a
+        converged state of a neighbouring parameter point
+    return_state : bool
+        Also return the final phases (θ1, θ2)
 
     Returns:
     --------
     results : dict
-        Complete experimental results
+        Complete experimental results, including the detected transient
+        (steps; None unless detection ran and found one) and the applied one
+    dtheta : array, only if return_state=True
+        Δθ = θ2 − θ1 over the whole run
+    final_state : (float, float), only if return_state=True
     """
     # Extract parameters
     K = params['K']
@@ -199,21 +1364,28 @@ def run_single_experiment(params, seed=None):
     omega2 = omega1 + delta_omega
 
     # Random initial conditions
-    if seed is not None:
-        np.random.seed(seed)
-    theta1_0 = np.random.uniform(0, 2*np.pi)
-    theta2_0 = np.random.uniform(0, 2*np.pi)
+    theta1_0, theta2_0, rng = _initial_state(params, seed, experiment_id, initial_state)
 
     # Run simulation
-    theta1, theta2 = kuramoto_with_noise(
+    simulation = kuramoto_with_noise(
         theta1_0, theta2_0, omega1, omega2, K, sigma, T, dt,
-        seed=seed, K_modulation=K_mod
+        seed=rng, K_modulation=K_mod, scheme=params.get('scheme', 'euler'),
+        tangents=params.get('sensitivities', False)
     )
+    theta1, theta2 = simulation[:2]
 
-    # Compute metrics
-    pli = compute_pli(theta1, theta2, transient)
+    dtheta = theta2 - theta1
+    transient_detected = None
+    if params.get('auto_transient', False) or params.get('report_transient', False):
+        transient_detected = detect_transient(dtheta, params.get('transient_window', 1000))
+    if params.get('auto_transient', False) and transient_detected is not None:
+        transient = transient_detected
+
+    # Compute metrics (PLI and CHSH share one pass over Δθ)
+    moments = CircularMoments.from_trajectories(theta1, theta2, transient)
+    pli = float(moments.pli)
     rho_echo = compute_echo_density(theta1, theta2, transient)
-    correlations, S = compute_chsh_correlations(theta1, theta2, angles, transient)
+    correlations, S = compute_chsh_correlations(moments, angles=angles)
 
     # Package results
     results = {
@@ -225,12 +1397,427 @@ def run_single_experiment(params, seed=None):
         'abs_S': abs(S),
         'correlations': correlations,
         'violation': abs(S) > 2.0,
-        'regime': classify_regime(pli, abs(S))
+        'regime': classify_regime(pli, abs(S)),
+        'transient_detected': transient_detected,
+        'transient_used': transient
     }
+    if params.get('sensitivities', False):
+        results['sensitivities'] = pathwise_sensitivities(
+            dtheta, simulation[2], angles, transient, tau=params.get('autocorr_tau'),
+            window=params.get('S_window', 1)
+        )
 
+    if return_state:
+        return results, dtheta, (float(theta1[-1]), float(theta2[-1]))
     return results
 
 
+def pathwise_sensitivities(dtheta, tangents, angles, transient=0, tau=None, window=1):
+    """
+    Pathwise derivatives of PLI, S, |S| and ρ_S(τ) from tangent trajectories
+
+    Each metric is a smooth function of the post-transient Δθ, so its
+    derivative along ∂Δθ/∂p (kuramoto_with_noise(..., tangents=True)) is
+    the derivative of that run's metric with respect to p on a fixed noise
+    path; averaged over seeds it estimates ∂E[metric]/∂p without
+    neighbouring grid points. In the locked regime the phase-difference
+    dynamics contract and the tangents stay bounded; while the phases slip,
+    ∂Δθ/∂K grows with the accumulated slip and the estimate gets noisier.
+
+    Parameters:
+    -----------
+    dtheta : array, shape (T,)
+        Phase difference Δθ = θ2 − θ1
+    tangents : dict
+        {parameter: ∂Δθ/∂parameter}, arrays of shape (T,)
+    angles : dict
+        CHSH measurement angles in degrees
+    transient : int
+        Steps dropped before averaging
+    tau : int, optional
+        Lag of ρ_S (in steps); ρ_S is skipped if None
+    window : int
+        S(t) window for ρ_S (1 = instantaneous S)
+
+    Returns:
+    --------
+    sensitivities : dict
+        {parameter: {'PLI', 'S', 'abs_S'[, 'rho_S']}}
+    """
+    moments = CircularMoments.from_dtheta(dtheta, transient)
+    pli = float(moments.pli)
+    S = moments.chsh(angles)[1]
+    if tau is not None:
+        S_series = rolling_chsh(dtheta, angles, window, transient)
+
+    sensitivities = {}
+    for name, tangent in tangents.items():
+        d = CircularMoments.from_tangent(dtheta, tangent, transient)
+        dS = d.chsh(angles)[1]
+        sensitivity = {
+            'PLI': float((moments.C * d.C + moments.Sn * d.Sn) / pli) if pli > 0 else 0.0,
+            'S': dS,
+            'abs_S': float(np.sign(S) * dS)
+        }
+        if tau is not None:
+            dS_series = rolling_chsh_tangent(dtheta, tangent, angles, window, transient)
+            sensitivity['rho_S'] = float(autocorr_S_tangent(S_series, dS_series, tau)[1])
+        sensitivities[name] = sensitivity
+    return sensitivities
+
+
+def stationarity_check(dtheta, n_windows=4, tol=0.05):
+    """
+    Running-PLI stationarity diagnostic of a post-transient Δθ
+
+    The series is cut into n_windows consecutive windows and the PLI of the
+    first window is compared with the PLI of the rest: a run that has not
+    finished relaxing shows up as a first window out of line with the
+    remainder.
+
+    Parameters:
+    -----------
+    dtheta : array
+        Phase difference after the (re-)equilibration period
+    n_windows : int
+        Number of windows
+    tol : float
+        Largest accepted |PLI(first window) − PLI(rest)|
+
+    Returns:
+    --------
+    check : dict
+        pli_windows (PLI per window), drift, stationary
+    """
+    windows = np.array_split(np.asarray(dtheta), n_windows)
+    pli_windows = [float(CircularMoments.from_dtheta(w).pli) for w in windows]
+    drift = abs(pli_windows[0] - float(CircularMoments.from_dtheta(np.concatenate(windows[1:])).pli))
+    return {'pli_windows': pli_windows, 'drift': drift, 'stationary': bool(drift <= tol)}
+
+
+def detect_transient(dtheta, window=1000, tol=1e-3, max_fraction=0.5):
+    """
+    Equilibration length of a trajectory from its running phase locking
+
+    Δθ is cut into windows and the PLI of each window is the running
+    phase-lock statistic. The truncation point follows the MSER rule
+    (marginal standard error): dropping the first d windows, the standard
+    error of the mean of the remaining ones is smallest once the relaxation
+    is gone and grows again when stationary data is thrown away. The
+    earliest d whose standard error is within tol of that minimum is taken,
+    so a locked run with a slow exponential tail is not truncated for a
+    negligible gain. Truncations are searched up to three quarters of the
+    run; an optimum beyond max_fraction means the run has not settled.
+
+    Parameters:
+    -----------
+    dtheta : array
+        Phase difference from the start of the run
+    window : int
+        Steps (samples) per window
+    tol : float
+        Accepted excess standard error of the windowed PLI mean
+    max_fraction : float
+        Largest transient, as a fraction of the run, that counts as settled
+
+    Returns:
+    --------
+    transient : int or None
+        Steps (samples) to discard; None if the running PLI has not settled
+        within max_fraction of the run
+    """
+    dtheta = np.asarray(dtheta, dtype=float)
+    n_windows = dtheta.size // window
+    if n_windows < 4:
+        return None
+
+    pli = np.abs(np.exp(1j * dtheta[:n_windows * window]).reshape(n_windows, window).mean(axis=1))
+
+    # Sums over windows d..end for every truncation d, keeping at least a quarter
+    tail_sum = np.cumsum(pli[::-1])[::-1]
+    tail_sq = np.cumsum((pli**2)[::-1])[::-1]
+    n = np.arange(n_windows, 0, -1)
+    d_last = n_windows - n_windows // 4
+    mser = np.maximum(tail_sq - tail_sum**2 / n, 0)[:d_last + 1] / n[:d_last + 1]**2
+
+    sem = np.sqrt(mser)
+    d = int(np.argmax(sem <= sem.min() + tol))
+    if d > n_windows * max_fraction:
+        return None
+    return d * window
+
+
+def run_sigma_continuation(params, sigma_values, seed=None, experiment_id='rut_core',
+                           rerun_transient=None, n_windows=4, tol=0.05):
+    """
+    σ-sweep by continuation: each point starts from the previous converged state
+
+    The first σ is a cold start with the full params['transient']. Every
+    later σ starts from the final state of the previous one and only
+    re-equilibrates for rerun_transient steps, keeping the same number of
+    measured (post-transient) steps. Each warm start is checked with
+    stationarity_check; if the running PLI has not settled, the point is
+    rerun cold with the full transient.
+
+    Parameters:
+    -----------
+    params : dict
+        As in run_single_experiment (sigma is overridden)
+    sigma_values : sequence of float
+        σ values, in sweep order (neighbours should be close)
+    seed : int, optional
+        Random seed (same for every σ)
+    experiment_id : str
+        Seed-stream namespace
+    rerun_transient : int, optional
+        Re-equilibration steps after a warm start (default transient / 10)
+    n_windows, tol :
+        Passed to stationarity_check
+
+    Returns:
+    --------
+    results : list of dict
+        run_single_experiment results, each with 'warm_start' and
+        'stationarity' added
+    """
+    transient = params['transient']
+    measured = params['T'] - transient
+    if rerun_transient is None:
+        rerun_transient = transient // 10
+
+    results = []
+    state = None
+    for sigma in sigma_values:
+        point = dict(params, sigma=sigma)
+        warm = state is not None
+        if warm:
+            point.update(T=rerun_transient + measured, transient=rerun_transient)
+
+        result, dtheta, final_state = run_single_experiment(
+            point, seed, experiment_id, initial_state=state, return_state=True
+        )
+        check = stationarity_check(dtheta[result['transient_used']:], n_windows, tol)
+
+        if warm and not check['stationary']:
+            point = dict(params, sigma=sigma)
+            result, dtheta, final_state = run_single_experiment(point, seed, experiment_id, return_state=True)
+            check = stationarity_check(dtheta[result['transient_used']:], n_windows, tol)
+            warm = False
+
+        result.update(warm_start=warm, stationarity=check)
+        results.append(result)
+        state = final_state
+
+    return results
+
+
+def run_ensemble_experiment(params, seeds, bit_exact=False, return_moments=False,
+                            experiment_id='rut_core'):
+    """
+    Run run_single_experiment for a whole list of seeds in one ensemble call
+
+    Each trajectory draws its initial phases and noise from the seed stream
+    (experiment_id, (K, σ, Δω), seed), i.e. the same path as
+    run_single_experiment(params, seed, experiment_id) up to rounding. With
+    bit_exact=True the legacy global RNG is used instead and the returned
+    list is identical to [run_single_experiment(params, seed=s) for s in seeds].
+
+    The seeds run in lockstep and their metrics are accumulated block by
+    block, so no trajectory is stored. With bit_exact=True, or when the
+    transient is detected (auto_transient / report_transient, which need
+    each whole Δθ), the seeds run one at a time instead.
+
+    Parameters:
+    -----------
+    params : dict
+        Same as run_single_experiment
+    seeds : sequence of int
+        Random seeds, one trajectory each
+    bit_exact : bool
+        Reproduce the legacy per-seed RNG stream
+    return_moments : bool
+        Add each seed's CircularMoments under 'moments', so other angle sets
+        can be evaluated without re-simulating
+    experiment_id : str
+        Seed-stream namespace (ignored with bit_exact=True)
+
+    Returns:
+    --------
+    results : list of dict
+        One run_single_experiment-style result per seed
+    """
+    K = params['K']
+    delta_omega = params['delta_omega']
+    sigma = params['sigma']
+    angles = params['angles']
+    T = params['T']
+    dt = params['dt']
+    transient = params['transient']
+    K_mod = params.get('K_modulation', None)
+
+    omega1 = 1.0
+    omega2 = omega1 + delta_omega
+
+    seeds = list(seeds)
+    theta0 = np.zeros((len(seeds), 2))
+    if bit_exact:
+        # Same initial conditions as run_single_experiment
+        streams = seeds
+        for i, seed in enumerate(seeds):
+            if seed is not None:
+                np.random.seed(seed)
+            theta0[i] = np.random.uniform(0, 2*np.pi, size=2)
+    else:
+        streams = [trajectory_rng(experiment_id, point_of(params), seed) for seed in seeds]
+        for i, rng in enumerate(streams):
+            theta0[i] = initial_phases(rng)
+
+    scheme = params.get('scheme', 'euler')
+    detect = params.get('auto_transient', False) or params.get('report_transient', False)
+    transients = [None] * len(seeds)
+    used = [transient] * len(seeds)
+    if bit_exact or detect:
+        # Per-seed integration, or detection, which needs each whole Δθ:
+        # one stored trajectory at a time
+        moments = []
+        rho_echos = []
+        for i in range(len(seeds)):
+            theta1, theta2 = kuramoto_ensemble(
+                theta0[i:i + 1], None, omega1, omega2, K, sigma, T, dt,
+                seeds=streams[i:i + 1], K_modulation=K_mod, bit_exact=bit_exact, scheme=scheme
+            )
+            if detect:
+                transients[i] = detect_transient(theta2[0] - theta1[0], params.get('transient_window', 1000))
+            if params.get('auto_transient', False) and transients[i] is not None:
+                used[i] = transients[i]
+            moments.append(CircularMoments.from_trajectories(theta1[0], theta2[0], used[i]))
+            rho_echos.append(compute_echo_density(theta1[0], theta2[0], used[i]))
+    else:
+        # All seeds in lockstep, reduced block by block
+        blocks = _ensemble_blocks(theta0, omega1, omega2, K, sigma, T, dt, streams, K_mod, scheme=scheme)
+        ensemble, rho_echos = _ensemble_metrics(blocks, theta0, T, transient)
+        moments = [CircularMoments(float(C), float(Sn), n_samples=ensemble.n_samples)
+                   for C, Sn in zip(ensemble.C, ensemble.Sn)]
+
+    results = []
+    for i, seed in enumerate(seeds):
+        pli = float(moments[i].pli)
+        rho_echo = float(rho_echos[i])
+        correlations, S = compute_chsh_correlations(moments[i], angles=angles)
+
+        result = {
+            'seed': seed,
+            'parameters': params.copy(),
+            'PLI': pli,
+            'rho_echo': rho_echo,
+            'S': S,
+            'abs_S': abs(S),
+            'correlations': correlations,
+            'violation': abs(S) > 2.0,
+            'regime': classify_regime(pli, abs(S)),
+            'transient_detected': transients[i],
+            'transient_used': used[i]
+        }
+        if return_moments:
+            result['moments'] = moments[i]
+        results.append(result)
+
+    return results
+
+
+def dt_convergence(params, factors=(1, 2, 5, 10), seeds=(0, 1, 2, 3), experiment_id='rut_core',
+                   window=100.0, tau=25.0, tol=None):
+    """
+    Time-step convergence check of |S|, PLI and ρ_S(τ) for params['scheme']
+
+    Each seed's Brownian path is drawn once on the grid params['dt'] and
+    integrated at dt·factor for every factor from coarsened increments
+    (coarsen_increments), all runs starting from the same initial phases
+    and covering the same physical time T·dt. The metrics are evaluated on
+    the common sampling grid of the coarsest run, so the differences between
+    time steps are integration error only, not sampling or noise.
+
+    Parameters:
+    -----------
+    params : dict
+        Same as run_single_experiment; dt, T and transient are the finest grid
+    factors : sequence of int
+        Time-step multipliers; the smallest is the reference
+    seeds : sequence of int
+        Brownian paths to average over
+    experiment_id : str
+        Seed-stream namespace
+    window : float
+        S(t) window for ρ_S, in time units
+    tau : float
+        ρ_S lag, in time units
+    tol : float, optional
+        If given, report the largest dt whose error is within tol for every
+        metric
+
+    Returns:
+    --------
+    convergence : dict
+        'scheme', 'dt' (one per factor), per metric {'value': seed-mean per dt,
+        'error': |value − reference|, 'path_error': seed-mean of the pathwise
+        |x − x_reference|, 'order': fitted slope of log path_error vs log dt},
+        and 'dt_max' when tol is given
+    """
+    scheme = params.get('scheme', 'euler')
+    dt = params['dt']
+    factors = sorted(int(f) for f in factors)
+    omega1 = 1.0
+    omega2 = omega1 + params['delta_omega']
+
+    # Common sampling grid: every `stride` fine steps, a multiple of every factor
+    stride = int(np.lcm.reduce(factors))
+    start = -(-params['transient'] // stride)
+    n_window = max(int(round(window / (stride * dt))), 1)
+    n_tau = max(int(round(tau / (stride * dt))), 1)
+
+    names = ['abs_S', 'PLI', 'rho_S']
+    values = {name: np.zeros((len(factors), len(seeds))) for name in names}
+    for j, seed in enumerate(seeds):
+        rng = trajectory_rng(experiment_id, point_of(params), seed)
+        theta1_0, theta2_0 = initial_phases(rng)
+        dW, dZ = brownian_increments(rng, params['sigma'], params['T'], dt, scheme)
+
+        for i, factor in enumerate(factors):
+            increments = coarsen_increments(dW, dZ, factor, dt)
+            theta1, theta2 = kuramoto_with_noise(
+                theta1_0, theta2_0, omega1, omega2, params['K'], params['sigma'],
+                len(increments[0]) + 1, dt * factor, K_modulation=params.get('K_modulation', None),
+                scheme=scheme, increments=increments
+            )
+            samples = (theta2 - theta1)[::stride // factor]
+            moments = CircularMoments.from_dtheta(samples, start)
+            values['abs_S'][i, j] = abs(moments.chsh(params['angles'])[1])
+            values['PLI'][i, j] = moments.pli
+            S_series = rolling_chsh(samples, params['angles'], n_window, start)
+            values['rho_S'][i, j] = autocorr_S(S_series, n_tau)[n_tau]
+
+    convergence = {'scheme': scheme, 'dt': [dt * f for f in factors]}
+    log_dt = np.log(factors[1:])
+    for name in names:
+        value = values[name].mean(axis=1)
+        path_error = np.abs(values[name] - values[name][0]).mean(axis=1)
+        fit = (log_dt.size >= 2) and np.all(path_error[1:] > 0)
+        convergence[name] = {
+            'value': value.tolist(),
+            'error': np.abs(value - value[0]).tolist(),
+            'path_error': path_error.tolist(),
+            'order': float(np.polyfit(log_dt, np.log(path_error[1:]), 1)[0]) if fit else None
+        }
+
+    if tol is not None:
+        within = [all(convergence[name]['error'][i] <= tol for name in names) for i in range(len(factors))]
+        # Largest dt such that it and every finer dt meet the tolerance
+        n_ok = within.index(False) if False in within else len(factors)
+        convergence['dt_max'] = convergence['dt'][n_ok - 1] if n_ok else None
+
+    return convergence
+
+
 def classify_regime(pli, abs_S):
     """Classify into Tsirelson ridge, RUT plateau, or classical"""
     if abs_S <= 2.0:
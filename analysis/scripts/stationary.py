@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Stationary Fokker–Planck solution for the reduced Δθ dynamics
+
+With symmetric coupling the phase difference Δθ = θ2 − θ1 obeys
+
+    dΔθ = (Δω − 2K·sin Δθ) dt + √2·σ dW
+
+(see rut_core.phase_difference_sde). Its stationary density on the circle
+is the tilted von Mises solution
+
+    p(x) ∝ exp(φ(x)) ∫_x^{x+2π} exp(−φ(y)) dy,   φ(x) = (Δω·x + 2K·cos x) / σ²
+
+so ⟨cos Δθ⟩ and ⟨sin Δθ⟩, and with them PLI and every CHSH value, follow
+without simulation. stationary_moments takes them from the Fourier
+continued fraction of the same Fokker–Planck equation, vectorized over
+the whole (K, σ) grid; stationary_log_density evaluates p(x) itself.
+"""
+
+import numpy as np
+from scipy.optimize import brentq
+
+from rut_core import CircularMoments, optimize_angles_analytic, phase_difference_sde
+from seed_streams import trajectory_rng
+
+# Quadrature grid limits (points per 2π)
+N_GRID_MIN = 512
+N_GRID_MAX = 2**22
+
+# Continued-fraction truncation: first depth, cap, and convergence tolerance on ⟨exp(iΔθ)⟩
+N_TERMS_MIN = 64
+N_TERMS_MAX = 2**17
+TERMS_TOL = 1e-13
+
+
+def _grid_size(K, sigma, delta_omega):
+    """Quadrature points needed to resolve φ to ≲ 0.25 per step"""
+    n = 8 * np.pi * (abs(delta_omega) + 2 * abs(K)) / sigma**2
+    n = 2**int(np.ceil(np.log2(max(n, N_GRID_MIN))))
+    if n > N_GRID_MAX:
+        raise ValueError(f"σ = {sigma} needs {n} grid points to resolve φ (cap {N_GRID_MAX}); "
+                         f"pass n_grid explicitly to accept a coarser grid")
+    return n
+
+
+def stationary_log_density(K, sigma, delta_omega, n_grid=None):
+    """
+    Unnormalized log stationary density of Δθ on a uniform grid over [0, 2π)
+
+    Parameters:
+    -----------
+    K, sigma, delta_omega : float
+        Model parameters (sigma > 0)
+    n_grid : int, optional
+        Number of grid points (default: enough to resolve φ; ValueError
+        if that exceeds N_GRID_MAX)
+
+    Returns:
+    --------
+    x : array
+        Grid points
+    log_p : array
+        log p(x) up to an additive constant
+    """
+    if n_grid is None:
+        n_grid = _grid_size(K, sigma, delta_omega)
+
+    D = sigma**2
+    h = 2 * np.pi / n_grid
+    x = np.arange(n_grid + 1) * h
+    phi = (delta_omega * x + 2 * K * np.cos(x)) / D
+
+    # log of the trapezoid integral of exp(−φ) over each grid cell
+    seg = np.logaddexp(-phi[:-1], -phi[1:]) + np.log(h / 2)
+
+    # ∫_x^{x+2π} exp(−φ) = ∫_x^{2π} exp(−φ) + exp(−2πΔω/D) ∫_0^x exp(−φ),
+    # both sums of positive terms, kept in log space
+    head = np.concatenate([[-np.inf], np.logaddexp.accumulate(seg)[:-1]])
+    tail = np.logaddexp.accumulate(seg[::-1])[::-1]
+    log_integral = np.logaddexp(tail, head - 2 * np.pi * delta_omega / D)
+
+    return x[:-1], phi[:-1] + log_integral
+
+
+def _deterministic_moments(K, delta_omega):
+    """σ = 0 limit: locked fixed point, or the drifting time average"""
+    a = 2 * K
+    if abs(delta_omega) <= a:
+        if a == 0:
+            return 1.0, 0.0
+        sin_star = delta_omega / a
+        return np.sqrt(1 - sin_star**2), sin_star
+
+    # Drifting: p(x) ∝ 1/|Δω − 2K·sin x| gives ⟨cos⟩ = 0 and
+    # ⟨sin⟩ = (Δω − sign(Δω)·√(Δω² − 4K²)) / 2K
+    if a == 0:
+        return 0.0, 0.0
+    root = np.sqrt(delta_omega**2 - a**2)
+    return 0.0, (delta_omega - np.sign(delta_omega) * root) / a
+
+
+def _continued_fraction(K, D, delta_omega, n_terms):
+    """r_1 = c_1 / c_0 from the recursion truncated at r_{n_terms + 1} = 0"""
+    r = np.zeros(K.shape, dtype=complex)
+    for n in range(n_terms, 0, -1):
+        r = K / (D * n + 1j * delta_omega + K * r)
+    return r
+
+
+def stationary_moments(K, sigma, delta_omega, n_terms=None):
+    """
+    Stationary circular moments of Δθ over a broadcast (K, σ, Δω) grid
+
+    The Fourier coefficients c_n of the stationary density satisfy the
+    three-term recursion of the Fokker–Planck equation (D = σ²)
+
+        K c_{n−1} − (D n + iΔω) c_n − K c_{n+1} = 0,
+
+    whose decaying solution is the continued fraction
+    r_n = c_n / c_{n−1} = K / (D n + iΔω + K r_{n+1}), and
+    ⟨cos Δθ⟩ + i⟨sin Δθ⟩ = conj(r_1). All points are evaluated together;
+    the depth is doubled from N_TERMS_MIN for the points whose r_1 still
+    moves by more than TERMS_TOL (small σ needs ~10·√(2K/σ²) terms).
+
+    Parameters:
+    -----------
+    K, sigma, delta_omega : float or array
+        Broadcast together (e.g. K[None, :], sigma[:, None])
+    n_terms : int, optional
+        Fixed truncation depth (default: adaptive per point; ValueError
+        if a point has not converged at N_TERMS_MAX)
+
+    Returns:
+    --------
+    moments : CircularMoments
+        C and Sn arrays with the broadcast shape
+    """
+    K, sigma, delta_omega = np.broadcast_arrays(
+        np.asarray(K, dtype=float), np.asarray(sigma, dtype=float), np.asarray(delta_omega, dtype=float)
+    )
+    z = np.zeros(K.shape, dtype=complex)
+
+    for idx in map(tuple, np.argwhere(sigma == 0)):
+        C, Sn = _deterministic_moments(K[idx], delta_omega[idx])
+        z[idx] = C - 1j * Sn
+
+    noisy = sigma != 0
+    K_n, D_n, dw_n = K[noisy], sigma[noisy]**2, delta_omega[noisy]
+    if n_terms is not None:
+        z[noisy] = _continued_fraction(K_n, D_n, dw_n, n_terms)
+    else:
+        # Points still moving between depths n and 2n get the next doubling
+        pending = np.arange(K_n.size)
+        r_n = _continued_fraction(K_n, D_n, dw_n, N_TERMS_MIN)
+        n = N_TERMS_MIN
+        r = np.zeros(K_n.size, dtype=complex)
+        while pending.size:
+            if 2 * n > N_TERMS_MAX:
+                first = pending[0]
+                raise ValueError(f"Stationary moments at K = {K_n[first]}, σ = {np.sqrt(D_n[first])} "
+                                 f"not converged at {N_TERMS_MAX} terms")
+            r_2n = _continued_fraction(K_n[pending], D_n[pending], dw_n[pending], 2 * n)
+            done = np.abs(r_2n - r_n) < TERMS_TOL
+            r[pending[done]] = r_2n[done]
+            pending, r_n, n = pending[~done], r_2n[~done], 2 * n
+        z[noisy] = r
+
+    return CircularMoments(z.real, -z.imag)
+
+
+def stationary_landscape(K, sigma, delta_omega, angles):
+    """
+    |S|, PLI and the angle-optimized S* over a (K, σ, Δω) grid
+
+    Returns:
+    --------
+    landscape : dict
+        'PLI', 'S', 'abs_S', 'S_star' and the four correlations, all with
+        the broadcast grid shape
+    """
+    moments = stationary_moments(K, sigma, delta_omega)
+    correlations, S = moments.chsh(angles)
+
+    landscape = {
+        'PLI': moments.pli,
+        'S': S,
+        'abs_S': np.abs(S),
+        'S_star': optimize_angles_analytic(moments)['S_star']
+    }
+    landscape.update(correlations)
+    return landscape
+
+
+def sigma_c(K, delta_omega, angles, threshold_S=2.3, sigma_max=5.0, n_scan=200):
+    """
+    Collapse boundary σ_c(K): the noise level where |S| crosses threshold_S
+
+    Uses the same |S| threshold as A1's find_sigma_c. The first crossing
+    on a geometric σ scan (evaluated in one vectorized call) is bracketed
+    and refined with brentq.
+
+    Returns:
+    --------
+    sigma_c : float or None
+        None if |S| never crosses the threshold in (0, sigma_max]
+    """
+    def excess(sigma):
+        _, S = stationary_moments(K, sigma, delta_omega).chsh(angles)
+        return float(np.abs(S)) - threshold_S
+
+    if excess(0.0) <= 0:
+        return None
+
+    sigmas = np.geomspace(1e-3, sigma_max, n_scan)
+    _, S = stationary_moments(K, sigmas, delta_omega).chsh(angles)
+    crossed = np.nonzero(np.abs(S) - threshold_S <= 0)[0]
+    if crossed.size == 0:
+        return None
+
+    first = crossed[0]
+    lo = sigmas[first - 1] if first > 0 else 0.0
+    return float(brentq(excess, lo, sigmas[first], xtol=1e-6))
+
+
+def cross_check_monte_carlo(K, sigma, delta_omega, angles, seeds=range(1, 11),
+                            T=100000, dt=0.01, transient=20000):
+    """
+    Compare the stationary solution with the Monte Carlo Δθ engine
+
+    Returns:
+    --------
+    check : dict
+        For 'C', 'Sn', 'PLI' and 'abs_S': {'stationary', 'mc_mean', 'mc_sem', 'z'}
+        where z = (mc_mean − stationary) / mc_sem
+    """
+    streams = [trajectory_rng('stationary', (K, sigma, delta_omega), s) for s in seeds]
+    dtheta0 = np.array([rng.uniform(-np.pi, np.pi) for rng in streams])
+
+    dtheta = phase_difference_sde(dtheta0, delta_omega, K, sigma, T, dt, seed=streams)
+    mc = CircularMoments.from_dtheta(dtheta, transient)
+    exact = stationary_moments(K, sigma, delta_omega)
+
+    mc_values = {
+        'C': mc.C,
+        'Sn': mc.Sn,
+        'PLI': mc.pli,
+        'abs_S': np.abs(mc.chsh(angles)[1])
+    }
+    exact_values = {
+        'C': float(exact.C),
+        'Sn': float(exact.Sn),
+        'PLI': float(exact.pli),
+        'abs_S': float(np.abs(exact.chsh(angles)[1]))
+    }
+
+    check = {}
+    for name, values in mc_values.items():
+        mean = float(np.mean(values))
+        sem = float(np.std(values, ddof=1) / np.sqrt(len(values)))
+        check[name] = {
+            'stationary': exact_values[name],
+            'mc_mean': mean,
+            'mc_sem': sem,
+            'z': (mean - exact_values[name]) / sem if sem > 0 else 0.0
+        }
+
+    return check
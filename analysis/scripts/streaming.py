@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Streaming engine: metrics accumulated on the fly, no stored trajectory
+
+kuramoto_stream integrates exactly like kuramoto_with_noise (same noise
+draws, same arithmetic) but keeps only one block of `block_size` steps in
+memory. After each block the states are handed to a set of accumulators,
+
+    acc.update(t0, theta1, theta2)    # phases at steps t0 … t0+n−1
+    acc.result()
+
+which reduce them incrementally, so a run needs O(block_size + lags)
+memory whatever T is. Blocks arrive in order starting at t0 = 0; every
+accumulator ignores steps before its transient.
+"""
+
+import numpy as np
+from scipy.signal import lfilter
+
+from rut_core import CircularMoments, classify_regime, _initial_state
+
+
+class MomentsAccumulator:
+    """Circular moments of Δθ over t ≥ transient (PLI and every CHSH value)"""
+
+    def __init__(self, transient=0):
+        self.transient = transient
+        self.cos_sum = 0.0
+        self.sin_sum = 0.0
+        self.n = 0
+
+    def update(self, t0, theta1, theta2):
+        first = max(self.transient - t0, 0)
+        dtheta = theta2[first:] - theta1[first:]
+        self.cos_sum += np.sum(np.cos(dtheta))
+        self.sin_sum += np.sum(np.sin(dtheta))
+        self.n += dtheta.size
+
+    def result(self):
+        """CircularMoments of the post-transient Δθ"""
+        return CircularMoments(self.cos_sum / self.n, self.sin_sum / self.n, n_samples=self.n)
+
+
+class EchoAccumulator:
+    """Cross-echo density ρ_echo, as rut_core.compute_echo_density"""
+
+    def __init__(self, transient=0, lambda_decay=0.9):
+        self.transient = transient
+        self.b = [1 - lambda_decay]
+        self.a = [1, -lambda_decay]
+        self.zi_A = np.zeros(1, dtype=complex)
+        self.zi_B = np.zeros(1, dtype=complex)
+        self.last = None
+        self.cross_sum = 0j
+        self.n = 0
+
+    def update(self, t0, theta1, theta2):
+        if self.last is None:
+            # E[0] = 0: counts towards the average but adds nothing
+            self.n += int(self.transient <= 0)
+            self.last = (theta1[0], theta2[0])
+            theta1, theta2, t0 = theta1[1:], theta2[1:], t0 + 1
+        if theta1.size == 0:
+            return
+
+        inc1 = np.diff(theta1, prepend=self.last[0])
+        inc2 = np.diff(theta2, prepend=self.last[1])
+        E_A, self.zi_A = lfilter(self.b, self.a, np.exp(1j * inc1), zi=self.zi_A)
+        E_B, self.zi_B = lfilter(self.b, self.a, np.exp(1j * inc2), zi=self.zi_B)
+        self.last = (theta1[-1], theta2[-1])
+
+        first = max(self.transient - t0, 0)
+        self.cross_sum += np.sum(E_A[first:] * np.conj(E_B[first:]))
+        self.n += max(E_A.size - first, 0)
+
+    def result(self):
+        """ρ_echo = |⟨E_A · conj(E_B)⟩|"""
+        return float(np.abs(self.cross_sum / self.n))
+
+
+class SAutocorrAccumulator:
+    """
+    Autocorrelation ρ_S(τ) of the instantaneous CHSH field over t ≥ transient
+
+    S(t) = E_ab(t) − E_ab'(t) + E_a'b(t) + E_a'b'(t) with
+    E_xy(t) = cos((θ1 + x) − (θ2 + y)), and
+
+        ρ_S(τ) = corr(S[t], S[t+τ]),   t = transient … T−1−τ
+
+    as in B1's compute_rho_S_autocorr. Only the first and last max(lags)
+    values of S are kept (lag buffer), plus running sums.
+    """
+
+    def __init__(self, angles, lags, transient=0):
+        self.transient = transient
+        self.lags = np.atleast_1d(np.asarray(lags, dtype=int))
+        self.max_lag = int(self.lags.max())
+        a, a_prime, b, b_prime = (np.deg2rad(angles[k]) for k in ['a', 'a_prime', 'b', 'b_prime'])
+        self.offsets = np.array([a - b, a - b_prime, a_prime - b, a_prime - b_prime])
+        self.signs = np.array([1.0, -1.0, 1.0, 1.0])
+
+        self.head = np.zeros(0)
+        self.tail = np.zeros(0)
+        self.cross = np.zeros(self.lags.size)
+        self.s_sum = 0.0
+        self.s2_sum = 0.0
+        self.n = 0
+
+    def s_inst(self, dtheta):
+        """Instantaneous S(t) from Δθ = θ2 − θ1"""
+        return np.cos(self.offsets[:, None] - dtheta[None, :]).T @ self.signs
+
+    def update(self, t0, theta1, theta2):
+        first = max(self.transient - t0, 0)
+        S = self.s_inst(theta2[first:] - theta1[first:])
+        if S.size == 0:
+            return
+
+        # Pairs (S[t−τ], S[t]) with t in this block, reaching back into the buffer
+        ext = np.concatenate([self.tail, S])
+        for i, lag in enumerate(self.lags):
+            start = max(self.tail.size, lag)
+            if start < ext.size:
+                self.cross[i] += np.dot(ext[start - lag:ext.size - lag], ext[start:])
+
+        if self.head.size < self.max_lag:
+            self.head = np.concatenate([self.head, S[:self.max_lag - self.head.size]])
+        self.tail = ext[-self.max_lag:] if self.max_lag > 0 else ext[:0]
+
+        self.s_sum += np.sum(S)
+        self.s2_sum += np.sum(S**2)
+        self.n += S.size
+
+    def result(self):
+        """ρ_S at each requested lag (NaN where fewer than two pairs exist)"""
+        rho = np.full(self.lags.size, np.nan)
+        for i, lag in enumerate(self.lags):
+            m = self.n - lag
+            if m < 2:
+                continue
+            if lag == 0:
+                x_sum, x2_sum, y_sum, y2_sum = self.s_sum, self.s2_sum, self.s_sum, self.s2_sum
+            else:
+                # S[:N−τ] drops the last τ values, S[τ:] the first τ
+                x_sum = self.s_sum - np.sum(self.tail[-lag:])
+                x2_sum = self.s2_sum - np.sum(self.tail[-lag:]**2)
+                y_sum = self.s_sum - np.sum(self.head[:lag])
+                y2_sum = self.s2_sum - np.sum(self.head[:lag]**2)
+
+            cov = self.cross[i] / m - (x_sum / m) * (y_sum / m)
+            var_x = x2_sum / m - (x_sum / m)**2
+            var_y = y2_sum / m - (y_sum / m)**2
+            if var_x > 0 and var_y > 0:
+                rho[i] = cov / np.sqrt(var_x * var_y)
+        return rho
+
+
+class DthetaHistogram:
+    """Histogram of Δθ over t ≥ transient, on fixed bin edges"""
+
+    def __init__(self, edges=None, transient=0, wrap=True):
+        self.edges = np.linspace(-np.pi, np.pi, 73) if edges is None else np.asarray(edges)
+        self.transient = transient
+        self.wrap = wrap
+        self.counts = np.zeros(self.edges.size - 1, dtype=np.int64)
+
+    def update(self, t0, theta1, theta2):
+        first = max(self.transient - t0, 0)
+        dtheta = theta2[first:] - theta1[first:]
+        if self.wrap:
+            dtheta = np.mod(dtheta + np.pi, 2 * np.pi) - np.pi
+        self.counts += np.histogram(dtheta, bins=self.edges)[0]
+
+    def result(self):
+        """(edges, counts); wrapped into [−π, π) if wrap=True"""
+        return self.edges, self.counts.copy()
+
+
+def kuramoto_stream(theta1_0, theta2_0, omega1, omega2, K, sigma, T, dt, seed=None,
+                    K_modulation=None, accumulators=(), block_size=10000, store=False):
+    """
+    kuramoto_with_noise, feeding accumulators block by block
+
+    Same parameters and the same trajectory (bit for bit, for an int seed
+    or a seed stream) as kuramoto_with_noise; noise is drawn per block.
+
+    Parameters:
+    -----------
+    accumulators : sequence
+        Objects with update(t0, theta1, theta2) (see module docstring)
+    block_size : int
+        Steps held in memory at a time
+    store : bool
+        Also return the full trajectories
+
+    Returns:
+    --------
+    theta1, theta2 : arrays, only if store=True
+    """
+    if isinstance(seed, np.random.Generator):
+        draw = seed.normal
+    else:
+        if seed is not None:
+            np.random.seed(seed)
+        draw = np.random.normal
+    noise_scale = sigma * np.sqrt(dt)
+
+    if store:
+        stored1 = np.zeros(T)
+        stored2 = np.zeros(T)
+
+    block1 = np.zeros(block_size)
+    block2 = np.zeros(block_size)
+    th1, th2 = theta1_0, theta2_0
+
+    for t0 in range(0, T, block_size):
+        n = min(block_size, T - t0)
+        # Noise for the steps into t0 … t0+n−1 (none into t = 0)
+        n_draw = n - 1 if t0 == 0 else n
+        noise = draw(0, noise_scale, size=(n_draw, 2))
+
+        k0 = 0
+        if t0 == 0:
+            block1[0], block2[0] = th1, th2
+            k0 = 1
+        for k in range(k0, n):
+            t = t0 + k - 1
+            if K_modulation is not None:
+                K_t = K + K_modulation['amplitude'] * np.sin(K_modulation['frequency'] * t * dt)
+            else:
+                K_t = K
+
+            coupling1 = K_t * np.sin(th2 - th1)
+            coupling2 = K_t * np.sin(th1 - th2)
+            eta1, eta2 = noise[k - k0]
+
+            th1 = th1 + dt * (omega1 + coupling1) + eta1
+            th2 = th2 + dt * (omega2 + coupling2) + eta2
+            block1[k] = th1
+            block2[k] = th2
+
+        for acc in accumulators:
+            acc.update(t0, block1[:n], block2[:n])
+        if store:
+            stored1[t0:t0 + n] = block1[:n]
+            stored2[t0:t0 + n] = block2[:n]
+
+    if store:
+        return stored1, stored2
+    return None
+
+
+def run_streaming_experiment(params, seed=None, experiment_id=None, accumulators=(),
+                             block_size=10000):
+    """
+    run_single_experiment without storing the trajectory
+
+    Same initial conditions, noise and result layout (values agree to
+    rounding). Extra accumulators (e.g. SAutocorrAccumulator,
+    DthetaHistogram) ride along on the same pass.
+
+    Only the Euler–Maruyama scheme ('euler', or the identical 'milstein')
+    and the fixed params['transient'] are supported: transient detection
+    needs the whole Δθ, so auto_transient raises and transient_detected is
+    always None.
+    """
+    scheme = params.get('scheme', 'euler')
+    if scheme not in ('euler', 'milstein'):
+        raise ValueError(f"The streaming engine integrates Euler–Maruyama only, got scheme {scheme!r}")
+    if params.get('auto_transient', False):
+        raise ValueError("auto_transient needs the stored trajectory; use run_single_experiment")
+
+    moments_acc = MomentsAccumulator(params['transient'])
+    echo_acc = EchoAccumulator(params['transient'])
+
+    theta1_0, theta2_0, rng = _initial_state(params, seed, experiment_id)
+    omega1 = 1.0
+    kuramoto_stream(
+        theta1_0, theta2_0, omega1, omega1 + params['delta_omega'], params['K'],
+        params['sigma'], params['T'], params['dt'], seed=rng,
+        K_modulation=params.get('K_modulation', None),
+        accumulators=[moments_acc, echo_acc] + list(accumulators), block_size=block_size
+    )
+
+    moments = moments_acc.result()
+    pli = float(moments.pli)
+    correlations, S = moments.chsh(params['angles'])
+
+    return {
+        'seed': seed,
+        'parameters': params.copy(),
+        'PLI': pli,
+        'rho_echo': echo_acc.result(),
+        'S': S,
+        'abs_S': abs(S),
+        'correlations': correlations,
+        'violation': abs(S) > 2.0,
+        'regime': classify_regime(pli, abs(S)),
+        'transient_detected': None,
+        'transient_used': params['transient']
+    }
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Process-pool sweep executor
+
+Fans independent sweep tasks, typically one per (K, σ) point or per
+(K, σ, seed) trajectory, out to a ProcessPoolExecutor and hands the results
+back in task order, so a runner's nested loops can be replaced by one
+task list and the output does not depend on which worker finished first.
+
+Tasks must not share random state: use seed_streams (or a per-task
+np.random.seed) inside the task function. With a journal.SweepJournal,
+completed tasks are logged as they finish and skipped on restart.
+
+run_sequential_sweep layers a per-point seed budget on top: seeds are added
+to a point only while the SEM of its target metric is above a tolerance.
+
+run_convergence_sweep is the dt-convergence mode: selected points are run at
+dt, 2dt and 4dt on one Brownian path, and the discretization bias of every
+metric is estimated by Richardson extrapolation.
+"""
+
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+def default_workers():
+    """Number of worker processes: every core available to this process"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def run_sweep(fn, tasks, max_workers=None, on_result=None, journal=None, keys=None):
+    """
+    Run fn(*task) for every task, in parallel, and return results in task order
+
+    Parameters:
+    -----------
+    fn : callable
+        Module-level function (it is pickled to the workers)
+    tasks : iterable of tuple
+        Positional arguments, one tuple per call
+    max_workers : int, optional
+        Pool size (default: default_workers()); 1 runs inline without a pool
+    on_result : callable, optional
+        on_result(index, task, result), called in the parent process as each
+        task finishes (completion order), e.g. for progress
+    journal : journal.SweepJournal, optional
+        Tasks already in the journal are not rerun; new results are appended
+        as they finish. All results then come back in their journaled
+        (JSON round-tripped) form.
+    keys : sequence, optional
+        Journal key of each task, e.g. (K, sigma, seed); required with journal
+
+    Returns:
+    --------
+    results : list
+        results[i] = fn(*tasks[i])
+    """
+    tasks = [tuple(task) for task in tasks]
+    results = [None] * len(tasks)
+    pending = list(range(len(tasks)))
+
+    if journal is not None:
+        if keys is None or len(keys) != len(tasks):
+            raise ValueError("A journaled sweep needs one key per task")
+        keys = list(keys)
+        pending = [index for index in pending if keys[index] not in journal]
+        for index in set(range(len(tasks))) - set(pending):
+            results[index] = journal[keys[index]]
+
+    def finish(index, result):
+        if journal is not None:
+            result = journal.append(keys[index], result)
+        results[index] = result
+        if on_result is not None:
+            on_result(index, tasks[index], result)
+
+    if max_workers is None:
+        max_workers = default_workers()
+    max_workers = max(1, min(max_workers, len(pending)))
+
+    if max_workers == 1:
+        for index in pending:
+            finish(index, fn(*tasks[index]))
+        return results
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(fn, *tasks[index]): index for index in pending}
+        for future in as_completed(futures):
+            finish(futures[future], future.result())
+
+    return results
+
+
+def sem(values):
+    """Standard error of the mean (ddof=1); inf for fewer than two values"""
+    values = np.asarray(values, dtype=float)
+    if values.size < 2:
+        return np.inf
+    return float(np.std(values, ddof=1) / np.sqrt(values.size))
+
+
+def run_sequential_sweep(fn, points, metric, sem_tol=None, min_seeds=3, max_seeds=30,
+                         batch_size=None, first_seed=0, max_workers=None, on_result=None,
+                         journal=None, key=None):
+    """
+    Draw seeds per point until the SEM of a metric is below sem_tol
+
+    Runs in rounds: every point first gets min_seeds seeds, then each point
+    whose metric still has SEM > sem_tol gets batch_size more, until all
+    points are settled or at max_seeds. Each round is one run_sweep, so all
+    open points share the process pool. Quiet points (e.g. deep in the
+    locked ridge, where |S| barely varies between seeds) stop at min_seeds
+    while noisy ones near a threshold get up to max_seeds.
+
+    Parameters:
+    -----------
+    fn : callable
+        fn(*point, seed) -> result for one trajectory (module level)
+    points : iterable of tuple
+        Per-point arguments, e.g. (K, sigma) or (K, sigma, config)
+    metric : callable
+        metric(result) -> float whose SEM is controlled
+    sem_tol : float, optional
+        Target SEM; None runs exactly min_seeds seeds per point
+    min_seeds, max_seeds : int
+        Seeds per point before the first SEM check, and the cap
+    batch_size : int, optional
+        Seeds added per round to unsettled points (default min_seeds)
+    first_seed : int
+        Seeds are first_seed, first_seed + 1, … at every point
+    max_workers, on_result, journal :
+        As in run_sweep (on_result indices refer to the current round)
+    key : callable, optional
+        key(task) -> journal key of the task point + (seed,) (default: the
+        task itself)
+
+    Returns:
+    --------
+    results : list of list
+        results[i] = per-seed results at points[i], in seed order; its
+        length is the number of seeds that point used
+    """
+    points = [tuple(point) for point in points]
+    results = [[] for _ in points]
+    if sem_tol is None:
+        max_seeds = min_seeds
+    batch_size = batch_size or min_seeds
+
+    open_points = list(range(len(points)))
+    n_new = min_seeds
+    while open_points:
+        tasks = []
+        owners = []
+        for i in open_points:
+            start = first_seed + len(results[i])
+            for seed in range(start, start + min(n_new, max_seeds - len(results[i]))):
+                tasks.append(points[i] + (seed,))
+                owners.append(i)
+
+        keys = None
+        if journal is not None:
+            keys = [task if key is None else key(task) for task in tasks]
+        for i, result in zip(owners, run_sweep(fn, tasks, max_workers=max_workers, on_result=on_result,
+                                               journal=journal, keys=keys)):
+            results[i].append(result)
+
+        open_points = [
+            i for i in open_points
+            if len(results[i]) < max_seeds and sem([metric(r) for r in results[i]]) > sem_tol
+        ]
+        n_new = batch_size
+
+    return results
+
+
+def richardson(values, order, ratio=2):
+    """
+    Richardson estimate of the discretization bias of one metric
+
+    With x(h) = x* + c·h^p + …, the metric at h and ratio·h gives
+
+        bias(h) = c·h^p ≈ (x(ratio·h) − x(h)) / (ratio^p − 1)
+
+    and x* ≈ x(h) − bias(h). A third value at ratio²·h also gives the
+    observed order log((x3 − x2) / (x2 − x1)) / log(ratio).
+
+    Parameters:
+    -----------
+    values : sequence of float
+        Metric at h, ratio·h (and optionally ratio²·h)
+    order : float
+        Expected order p of the error in h (the scheme's weak order)
+    ratio : float
+        Step ratio between consecutive values
+
+    Returns:
+    --------
+    estimate : dict
+        'bias' (of values[0]), 'extrapolated', 'observed_order' (None if
+        fewer than three values or the differences change sign)
+    """
+    x = np.asarray(values, dtype=float)
+    bias = (x[1] - x[0]) / (ratio**order - 1)
+
+    observed = None
+    if x.size >= 3:
+        d1, d2 = x[1] - x[0], x[2] - x[1]
+        if d1 * d2 > 0:
+            observed = float(np.log(d2 / d1) / np.log(ratio))
+
+    return {'bias': float(bias), 'extrapolated': float(x[0] - bias), 'observed_order': observed}
+
+
+def run_convergence_sweep(fn, points, factors=(1, 2, 4), order=1.0, tol=None, extrapolate=False,
+                          max_workers=None, on_result=None):
+    """
+    dt-convergence mode: Richardson bias of every metric at selected points
+
+    Each point is one task, run by fn at all time steps dt·factor on the
+    same Brownian path (e.g. rut_core.dt_convergence, which coarsens one
+    set of fine increments), so the differences between time steps are
+    discretization error rather than sampling noise.
+
+    Parameters:
+    -----------
+    fn : callable
+        fn(*point, factors) -> {metric: [value at dt·factor for each factor]}
+        (module level)
+    points : iterable of tuple
+        Per-point arguments, e.g. (K, sigma, config)
+    factors : sequence of int
+        Geometric time-step multipliers, e.g. (1, 2, 4)
+    order : float
+        Expected error order in dt (weak order of the integration scheme)
+    tol : float, optional
+        Bias tolerance: report the largest factor whose estimated bias is
+        within tol for every metric
+    extrapolate : bool
+        Also return the Richardson-extrapolated (dt → 0) value of each metric
+    max_workers, on_result :
+        As in run_sweep
+
+    Returns:
+    --------
+    results : list of dict
+        One per point: 'factors', 'values', and per metric 'bias' (the
+        estimated bias at each factor, bias(dt)·factor^order) and
+        'observed_order'; 'extrapolated' and 'factor_max' when requested
+    """
+    factors = [int(f) for f in factors]
+    if len(factors) < 2:
+        raise ValueError(f"Richardson extrapolation needs at least two refinement factors, got {factors}")
+    ratio = factors[1] / factors[0]
+    if any(b / a != ratio for a, b in zip(factors, factors[1:])):
+        raise ValueError(f"Richardson extrapolation needs geometric factors, got {factors}")
+
+    raw = run_sweep(fn, [tuple(point) + (factors,) for point in points], max_workers=max_workers,
+                    on_result=on_result)
+
+    results = []
+    for values in raw:
+        estimates = {metric: richardson(series, order, ratio) for metric, series in values.items()}
+        result = {
+            'factors': factors,
+            'values': values,
+            'bias': {metric: [e['bias'] * (f / factors[0])**order for f in factors]
+                     for metric, e in estimates.items()},
+            'observed_order': {metric: e['observed_order'] for metric, e in estimates.items()}
+        }
+        if extrapolate:
+            result['extrapolated'] = {metric: e['extrapolated'] for metric, e in estimates.items()}
+        if tol is not None:
+            within = [all(abs(bias[i]) <= tol for bias in result['bias'].values())
+                      for i in range(len(factors))]
+            # Largest factor such that it and every smaller one meet the tolerance
+            n_ok = within.index(False) if False in within else len(factors)
+            result['factor_max'] = factors[n_ok - 1] if n_ok else None
+        results.append(result)
+
+    return results
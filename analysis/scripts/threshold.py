@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Adaptive threshold finder for σ_c(K) and σ_mem(K)
+
+Instead of simulating a full σ grid and reading the crossing off it,
+find_crossing walks the coarse grid only until the seed-averaged metric
+first drops below the threshold, then refines the bracket by safeguarded
+secant (or bisection) steps. Points whose mean is statistically
+indistinguishable from the threshold get more seeds, up to a cap; all
+other points keep the base seed count. The crossing is reported with a
+confidence interval from the seed spread at the bracket ends.
+
+The metric is assumed to fall through the threshold as σ grows (|S|,
+ρ_S, PLI).
+"""
+
+import numpy as np
+
+
+class _Point:
+    """Per-seed metric values gathered at one σ"""
+
+    def __init__(self, sigma):
+        self.sigma = sigma
+        self.values = []
+
+    @property
+    def mean(self):
+        return float(np.mean(self.values))
+
+    @property
+    def sem(self):
+        if len(self.values) < 2:
+            return 0.0
+        return float(np.std(self.values, ddof=1) / np.sqrt(len(self.values)))
+
+    def record(self):
+        return {'sigma': float(self.sigma), 'mean': self.mean, 'sem': self.sem,
+                'n_seeds': len(self.values)}
+
+
+def find_crossing(evaluate, sigma_grid, level, n_seeds=5, max_seeds=40, tol=0.005,
+                  z=1.96, method='secant', first_seed=0, max_iter=30, above=None):
+    """
+    Locate the first σ at which the seed-averaged metric falls below `level`
+
+    Parameters:
+    -----------
+    evaluate : callable
+        evaluate(sigma, seeds) -> per-seed metric values for those seeds.
+        Seeds are consecutive ints from first_seed, so adding seeds at a
+        point extends its sample rather than redrawing it.
+    sigma_grid : sequence of float
+        Coarse σ values used to bracket the crossing (scanned in order)
+    level : float
+        Threshold on the metric
+    n_seeds : int
+        Seeds at every point
+    max_seeds : int
+        Cap on seeds at a point whose mean is within z·SEM of level
+    tol : float
+        Refine until the bracket is narrower than this
+    z : float
+        Normal quantile for the ambiguity test and the confidence interval
+    method : str
+        'secant' (safeguarded, falls back to bisection when the bracket
+        shrinks slowly) or 'bisection'
+    first_seed : int
+        Index of the first seed
+    max_iter : int
+        Cap on refinement steps
+    above : (float, sequence of float), optional
+        (σ, per-seed values) of a point already known to lie above level,
+        below the first grid σ (e.g. the noiseless reference at σ = 0).
+        It opens the bracket, so a crossing before the first grid point
+        is still found, and its seeds count in n_simulations.
+
+    Returns:
+    --------
+    result : dict
+        sigma       : crossing estimate (None if the grid never crosses)
+        ci          : [low, high] confidence interval on sigma
+        bracket     : [σ above level, σ below level]
+        converged   : bracket narrower than tol
+        n_simulations : total seeds simulated
+        points      : {sigma, mean, sem, n_seeds} for every σ visited
+    """
+    points = {}
+    if above is not None:
+        known = points[float(above[0])] = _Point(float(above[0]))
+        known.values = list(above[1])
+
+    def measure(sigma):
+        point = points.setdefault(float(sigma), _Point(float(sigma)))
+        target = n_seeds
+        while len(point.values) < target:
+            start = first_seed + len(point.values)
+            point.values.extend(evaluate(sigma, list(range(start, first_seed + target))))
+            # More seeds only while the point cannot be told apart from the threshold
+            if len(point.values) >= 2 and abs(point.mean - level) < z * point.sem:
+                target = min(2 * target, max_seeds)
+        return point
+
+    def result(sigma, ci, bracket, converged):
+        visited = sorted(points.values(), key=lambda point: point.sigma)
+        return {
+            'sigma': sigma,
+            'ci': ci,
+            'bracket': bracket,
+            'converged': converged,
+            'n_simulations': sum(len(point.values) for point in visited),
+            'points': [point.record() for point in visited]
+        }
+
+    # Bracket: first coarse point below the threshold
+    above = known if above is not None else None
+    below = None
+    for sigma in sigma_grid:
+        point = measure(sigma)
+        if point.mean < level:
+            below = point
+            break
+        above = point
+
+    if below is None:
+        return result(None, None, [float(sigma_grid[-1]), None], False)
+    if above is None:
+        return result(None, None, [None, float(below.sigma)], False)
+
+    # Refine
+    width = below.sigma - above.sigma
+    use_bisection = method == 'bisection'
+    for _ in range(max_iter):
+        if width <= tol:
+            break
+        if use_bisection:
+            sigma = 0.5 * (above.sigma + below.sigma)
+        else:
+            # Secant on the bracket, kept off the ends so the bracket always shrinks
+            fraction = (above.mean - level) / (above.mean - below.mean)
+            sigma = above.sigma + np.clip(fraction, 0.1, 0.9) * width
+
+        point = measure(sigma)
+        if point.mean < level:
+            below = point
+        else:
+            above = point
+
+        new_width = below.sigma - above.sigma
+        # Safeguard: bisect whenever a secant step failed to halve the bracket
+        use_bisection = method == 'bisection' or new_width > 0.5 * width
+        width = new_width
+
+    # Linear interpolation between the bracket ends, with the SEMs propagated
+    slope = (below.mean - above.mean) / width
+    w = (above.mean - level) / (above.mean - below.mean)
+    sigma_hat = above.sigma + w * width
+    sem = np.hypot((1 - w) * above.sem, w * below.sem)
+    half_width = max(z * sem / abs(slope), 0.5 * width) if slope != 0 else 0.5 * width
+
+    return result(float(sigma_hat), [float(sigma_hat - half_width), float(sigma_hat + half_width)],
+                  [float(above.sigma), float(below.sigma)], bool(width <= tol))
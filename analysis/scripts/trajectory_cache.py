@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Content-addressed disk cache for reduced trajectories and metrics
+
+Entries are .npz files named by a hash of (kind, normalized params, seed,
+RNG namespace, engine version), so any runner or figure script that asks
+for the same trajectory gets the stored arrays instead of re-simulating.
+The cache is bounded in size: when it grows past max_bytes the least
+recently used entries are evicted.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+import numpy as np
+
+from seed_streams import canonical
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent.parent / '.cache' / 'trajectories'
+DEFAULT_MAX_BYTES = 4 * 2**30
+
+
+class TrajectoryCache:
+    """
+    Size-bounded LRU cache of dicts of arrays on disk
+
+    Parameters:
+    -----------
+    root : str or Path
+        Cache directory (created if missing)
+    max_bytes : int
+        Total size above which least recently used entries are evicted
+    """
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def key(self, kind, params, seed, rng, engine):
+        """
+        Hash of everything that determines an entry
+
+        Parameters:
+        -----------
+        kind : str
+            What is stored, e.g. 'dtheta'
+        params : dict
+            Parameters the entry depends on (floats are normalized, so
+            0.1 + 0.05 and 0.15 share an entry)
+        seed : int
+            Seed index
+        rng : str
+            Seed-stream experiment id, or 'legacy' for the global RNG
+        engine : str
+            Engine version; bump it whenever the integrator's output changes
+        """
+        text = json.dumps({
+            'kind': kind,
+            'params': canonical(params),
+            'seed': canonical(seed),
+            'rng': rng,
+            'engine': engine
+        }, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return self.root / key[:2] / f"{key}.npz"
+
+    def get(self, key):
+        """Stored arrays for key, or None; a hit marks the entry as recently used"""
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+        os.utime(path)
+        return arrays
+
+    def put(self, key, arrays):
+        """Store a dict of arrays under key, then evict down to max_bytes"""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+
+        # Write to a temporary file and rename, so readers never see a partial entry
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, path)
+
+        self.evict()
+
+    def fetch(self, key, compute):
+        """Stored arrays for key, computing and storing them with compute() on a miss"""
+        arrays = self.get(key)
+        if arrays is None:
+            arrays = {name: np.asarray(value) for name, value in compute().items()}
+            self.put(key, arrays)
+        return arrays
+
+    def size(self):
+        """Total bytes currently stored"""
+        return sum(path.stat().st_size for path in self.root.glob('*/*.npz'))
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        for path in self.root.glob('*/*.npz'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
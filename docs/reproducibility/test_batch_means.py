@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Check the overlapping-batch-means error bars of the single-trajectory estimator
+"""
+
+import sys
+from pathlib import Path
+import numpy as np
+from scipy.signal import lfilter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'analysis' / 'scripts'))
+from rut_core import autocorr_S
+from batch_means import obm_sem, select_batch_size, autocorr_batch_means, run_batch_means_experiment
+
+PARAMS = {
+    'K': 0.5, 'delta_omega': 0.2, 'sigma': 0.3, 'T': 120000, 'dt': 0.01, 'transient': 20000,
+    'omega1': 1.0, 'angles': {'a': 0.0, 'a_prime': 98.0, 'b': 45.0, 'b_prime': 127.0},
+    'autocorr_tau': 25, 'S_window': 100
+}
+
+
+def test_ar1_standard_error():
+    """AR(1) with φ = 0.9: the selected batch size recovers SEM = 1 / ((1 − φ)√n)"""
+
+    rng = np.random.default_rng(0)
+    n, phi = 200000, 0.9
+    x = lfilter([1.0], [1.0, -phi], rng.standard_normal(n))
+
+    # White noise needs no batching
+    white = rng.standard_normal(n)
+    assert abs(obm_sem(white, 1) - white.std() / np.sqrt(n)) < 1e-4 / np.sqrt(n)
+
+    batch_size, sem, plateau = select_batch_size(x)
+    exact = 1 / ((1 - phi) * np.sqrt(n))
+    print(f"AR(1): batch size {batch_size}, SEM {sem:.5f} (exact {exact:.5f}), naive {x.std() / np.sqrt(n):.5f}")
+    assert plateau and batch_size > 10
+    assert abs(sem / exact - 1) < 0.15
+
+    # The estimator is autocorr_S's; only the error bar is new
+    rho = autocorr_batch_means(x, 5)
+    assert abs(rho['mean'] - autocorr_S(x, 5)[5]) < 1e-12
+
+
+def test_error_bars_match_seed_spread():
+    """OBM SEMs of |S|, PLI and ρ_S(τ) agree with the spread over independent long runs"""
+
+    print("=" * 80)
+    print("BATCH MEANS: mean OBM SEM vs spread over 12 runs at K = 0.5, σ = 0.3")
+    print("=" * 80)
+
+    runs = [run_batch_means_experiment(PARAMS, seed, 'test', n_segments=4)[0] for seed in range(12)]
+    for name in ['abs_S', 'PLI', 'rho_S']:
+        estimates = [r['batch_means'][name]['mean'] for r in runs]
+        sem = np.mean([r['batch_means'][name]['sem'] for r in runs])
+        spread = np.std(estimates, ddof=1)
+        print(f"{name:<6} spread {spread:.5f}, OBM SEM {sem:.5f}")
+        assert 0.5 < sem / spread < 2.0
+
+    # |S| is the run's own |S|; the segments split its measured steps
+    assert runs[0]['batch_means']['abs_S']['mean'] == runs[0]['abs_S']
+    assert len(runs[0]['segments']['abs_S']) == 4
+    assert abs(np.mean(runs[0]['segments']['abs_S']) - runs[0]['abs_S']) < 0.05
+
+
+if __name__ == "__main__":
+    test_ar1_standard_error()
+    test_error_bars_match_seed_spread()
+    print("\n✓ Batch-means error bars are calibrated")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Check σ continuation against independent cold starts
+"""
+
+import sys
+from pathlib import Path
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'analysis' / 'scripts'))
+from rut_core import run_single_experiment, run_sigma_continuation, stationarity_check
+
+PARAMS = {
+    'K': 0.7, 'delta_omega': 0.2, 'omega1': 1.0, 'T': 40000, 'dt': 0.01, 'transient': 20000,
+    'angles': {'a': 0, 'a_prime': 90, 'b': 45, 'b_prime': 135}
+}
+SIGMAS = [0.0, 0.1, 0.2, 0.3]
+
+
+def test_continuation_matches_cold_starts():
+    """Warm-started points agree with cold starts at a tenth of the transient"""
+
+    print("=" * 80)
+    print("σ CONTINUATION vs cold starts")
+    print("=" * 80)
+
+    warm = run_sigma_continuation(PARAMS, SIGMAS, seed=3, experiment_id='test', rerun_transient=2000)
+    cold = [run_single_experiment(dict(PARAMS, sigma=s), 3, 'test') for s in SIGMAS]
+
+    assert not warm[0]['warm_start'] and warm[0]['transient_used'] == 20000
+    # First point is an ordinary cold start
+    assert warm[0]['S'] == cold[0]['S']
+
+    for w, c in zip(warm, cold):
+        print(f"σ={w['parameters']['sigma']:.1f}: warm={w['warm_start']!s:<5} "
+              f"PLI {w['PLI']:.4f} vs {c['PLI']:.4f}, drift {w['stationarity']['drift']:.4f}")
+        assert w['parameters']['sigma'] == c['parameters']['sigma']
+        assert abs(w['PLI'] - c['PLI']) < 0.02
+        if w['warm_start']:
+            assert w['transient_used'] == 2000
+            assert w['stationarity']['stationary']
+            # Same number of measured steps as a cold start
+            assert w['parameters']['T'] - w['parameters']['transient'] == 20000
+
+
+def test_stationarity_check():
+    """A relaxing series is flagged, a stationary one is not"""
+
+    rng = np.random.default_rng(0)
+    settled = 0.3 * rng.normal(size=8000)
+    assert stationarity_check(settled)['stationary']
+
+    # Phase slipping freely in the first window, locked afterwards
+    relaxing = np.concatenate([np.linspace(0, 20 * np.pi, 2000), settled[:6000]])
+    check = stationarity_check(relaxing)
+    assert not check['stationary'] and check['drift'] > 0.5
+    assert len(check['pli_windows']) == 4
+
+
+if __name__ == "__main__":
+    test_continuation_matches_cold_starts()
+    test_stationarity_check()
+    print("\n✓ σ continuation reproduces cold starts")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Check that a journaled sweep resumes after a crash with identical results
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'analysis' / 'scripts'))
+from rut_core import run_single_experiment
+from sweep import run_sweep
+from journal import SweepJournal
+
+BASE = {
+    'K': 0.7,
+    'delta_omega': 0.2,
+    'angles': {'a': 0.0, 'a_prime': 98.0, 'b': 45.0, 'b_prime': 127.0},
+    'T': 5000,
+    'dt': 0.01,
+    'transient': 1000,
+    'omega1': 1.0,
+    'K_modulation': None
+}
+
+
+def test_resume_after_crash():
+    """Interrupted + resumed sweep == uninterrupted sweep, only missing tasks rerun"""
+
+    print("=" * 80)
+    print("SWEEP JOURNAL: resume after crash")
+    print("=" * 80)
+
+    tasks = [(dict(BASE, sigma=sigma), seed, 'TEST') for sigma in [0.1, 0.5] for seed in [1, 2, 3]]
+    keys = [(task[0]['sigma'], task[1]) for task in tasks]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'journal.jsonl'
+
+        journal = SweepJournal(path, BASE, meta={'run_id': 'RUN-1'})
+        full = run_sweep(run_single_experiment, tasks, max_workers=2, journal=journal, keys=keys)
+
+        # Crash: keep the header and two records, plus half of a third line
+        lines = path.read_text().split('\n')
+        path.write_text('\n'.join(lines[:3]) + '\n' + lines[3][:25])
+
+        resumed_journal = SweepJournal(path, BASE, meta={'run_id': 'RUN-2'})
+        print(f"Recovered {len(resumed_journal)} records, run_id {resumed_journal.meta['run_id']}")
+        assert len(resumed_journal) == 2
+        assert resumed_journal.meta['run_id'] == 'RUN-1'
+
+        rerun = []
+        resumed = run_sweep(run_single_experiment, tasks, max_workers=2,
+                            on_result=lambda index, task, result: rerun.append(index),
+                            journal=resumed_journal, keys=keys)
+        print(f"Rerun tasks: {sorted(rerun)}")
+        assert len(rerun) == len(tasks) - 2
+        assert resumed == full
+
+        try:
+            SweepJournal(path, dict(BASE, T=10000))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Journal of a different sweep was accepted")
+
+
+def test_torn_header():
+    """A crash while creating the journal leaves it empty or half-written: start fresh"""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'journal.jsonl'
+        header = path.parent / 'header.jsonl'
+        SweepJournal(header, BASE, meta={'run_id': 'RUN-1'})
+
+        for torn in ['', header.read_text()[:20]]:
+            path.write_text(torn)
+            journal = SweepJournal(path, BASE, meta={'run_id': 'RUN-2'})
+            assert len(journal) == 0 and journal.meta['run_id'] == 'RUN-2'
+            assert path.read_text() == header.read_text().replace('RUN-1', 'RUN-2')
+
+
+if __name__ == "__main__":
+    test_resume_after_crash()
+    test_torn_header()
+    print("\n✓ Journaled sweep resumes with identical results")
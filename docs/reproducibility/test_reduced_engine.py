@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Check the reduced Δθ engine against the full two-oscillator engine
+"""
+
+import sys
+from pathlib import Path
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'analysis' / 'scripts'))
+from rut_core import (
+    kuramoto_with_noise, phase_difference_sde, legacy_difference_increments,
+    run_single_experiment, run_reduced_experiment
+)
+
+PARAMS = {
+    'K': 0.7,
+    'delta_omega': 0.2,
+    'sigma': 0.2,
+    'angles': {'a': 0.0, 'a_prime': 98.0, 'b': 45.0, 'b_prime': 127.0},
+    'T': 50000,
+    'dt': 0.01,
+    'transient': 25000,
+    'omega1': 1.0,
+    'K_modulation': None
+}
+
+
+def test_pathwise_equivalence():
+    """Same noise path → Δθ identical to θ2 − θ1 up to rounding"""
+
+    print("=" * 80)
+    print("PATHWISE EQUIVALENCE: reduced Δθ engine vs kuramoto_with_noise")
+    print("=" * 80)
+
+    T, dt, seed = 20000, 0.01, 12345
+    omega1, delta_omega, K = 1.0, 0.2, 0.7
+
+    max_diffs = []
+    for sigma in [0.0, 0.2, 0.7, 1.5]:
+        np.random.seed(seed)
+        theta1_0, theta2_0 = np.random.uniform(0, 2*np.pi, size=2)
+
+        theta1, theta2 = kuramoto_with_noise(
+            theta1_0, theta2_0, omega1, omega1 + delta_omega, K, sigma, T, dt, seed=seed
+        )
+        increments = legacy_difference_increments(sigma, T, dt, seed=seed)
+        dtheta = phase_difference_sde(theta2_0 - theta1_0, delta_omega, K, sigma, T, dt,
+                                      increments=increments)
+
+        max_diff = np.max(np.abs(dtheta - (theta2 - theta1)))
+        max_diffs.append(max_diff)
+        print(f"σ = {sigma:.1f}: max |Δθ_reduced − (θ2 − θ1)| = {max_diff:.2e}")
+
+    assert max(max_diffs) < 1e-9
+
+
+def test_ensemble_seeding():
+    """One integer seed for an ensemble gives independent, reproducible members"""
+
+    dtheta0 = np.zeros(4)
+    ensemble = phase_difference_sde(dtheta0, 0.2, 0.7, 0.5, 2000, 0.01, seed=7)
+    assert np.array_equal(ensemble, phase_difference_sde(dtheta0, 0.2, 0.7, 0.5, 2000, 0.01, seed=7))
+    for i in range(1, 4):
+        assert not np.allclose(ensemble[0], ensemble[i])
+
+    # A scalar start keeps its own stream
+    single = phase_difference_sde(0.0, 0.2, 0.7, 0.5, 2000, 0.01, seed=7)
+    assert np.array_equal(single, phase_difference_sde(0.0, 0.2, 0.7, 0.5, 2000, 0.01,
+                                                       seed=np.random.default_rng(7)))
+
+
+def test_statistical_equivalence():
+    """Independent noise → seed-averaged |S| and PLI agree within error bars"""
+
+    print("\n" + "=" * 80)
+    print("STATISTICAL EQUIVALENCE: run_reduced_experiment vs run_single_experiment")
+    print("=" * 80)
+
+    seeds = range(1, 11)
+    full = [run_single_experiment(PARAMS, seed=s) for s in seeds]
+    reduced = [run_reduced_experiment(PARAMS, seed=s) for s in seeds]
+
+    for metric in ['abs_S', 'PLI']:
+        full_vals = np.array([r[metric] for r in full])
+        reduced_vals = np.array([r[metric] for r in reduced])
+        sem = np.sqrt(np.var(full_vals, ddof=1) / len(full_vals) +
+                      np.var(reduced_vals, ddof=1) / len(reduced_vals))
+        diff = abs(full_vals.mean() - reduced_vals.mean())
+
+        print(f"{metric:<8} full = {full_vals.mean():.4f}  reduced = {reduced_vals.mean():.4f}  "
+              f"diff = {diff:.2e}  (SEM {sem:.2e})")
+
+        assert diff < 4 * sem + 1e-3
+
+
+if __name__ == "__main__":
+    test_pathwise_equivalence()
+    test_ensemble_seeding()
+    test_statistical_equivalence()
+    print("\n✓ Reduced engine matches the full engine")
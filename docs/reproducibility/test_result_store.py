@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Check the columnar result store against the JSON documents it replaces
+"""
+
+import sys
+import json
+import tempfile
+from pathlib import Path
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'analysis' / 'scripts'))
+from rut_core import run_ensemble_experiment
+from result_store import save_columnar, load_columns, load_meta, load_results, export_json
+
+PARAMS = {
+    'delta_omega': 0.2, 'omega1': 1.0, 'T': 4000, 'dt': 0.01, 'transient': 2000,
+    'angles': {'a': 0, 'a_prime': 98, 'b': 45, 'b_prime': 127}, 'K_modulation': None
+}
+
+
+def sweep_document():
+    """A small A1-style document: grid points with per-seed results"""
+    grid_results = []
+    for K in [0.3, 0.7]:
+        for sigma in [0.0, 0.4]:
+            results = run_ensemble_experiment(dict(PARAMS, K=K, sigma=sigma), seeds=[1, 2, 3],
+                                              experiment_id='test')
+            abs_S = [r['abs_S'] for r in results]
+            grid_results.append({
+                'K': K, 'sigma': sigma, 'n_seeds': 3,
+                'abs_S_mean': float(np.mean(abs_S)), 'abs_S_sem': float(np.std(abs_S, ddof=1) / np.sqrt(3)),
+                'individual_results': results
+            })
+    # Round trip through JSON, as the runners' output is
+    return json.loads(json.dumps({
+        'experiment_id': 'TEST', 'config': {'parameters': PARAMS},
+        'grid_results': grid_results, 'sigma_c_analysis': {'K_values': [0.3, 0.7]}
+    }))
+
+
+def test_round_trip():
+    """Store -> document is exact; columns are typed and memory-mapped"""
+
+    print("=" * 80)
+    print("COLUMNAR STORE round trip")
+    print("=" * 80)
+
+    data = sweep_document()
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        store = save_columnar(tmp / 'sweep.cols', data)
+        with open(tmp / 'sweep.json', 'w') as f:
+            json.dump(data, f, indent=2)
+
+        assert load_results(store) == data
+        assert load_meta(tmp / 'sweep')['sigma_c_analysis'] == data['sigma_c_analysis']
+
+        points = load_columns(tmp / 'sweep', ['K', 'sigma', 'abs_S_mean'])
+        assert isinstance(points['abs_S_mean'], np.memmap)
+        assert points['K'].dtype == np.float64 and len(points['K']) == 4
+
+        seeds = load_columns(store, table='seeds')
+        assert seeds['violation'].dtype == bool
+        assert seeds['seed'].dtype == np.int64
+        assert list(seeds['point']) == [0, 0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3]
+        # One parameter dict per grid point, shared by its seeds
+        assert len(set(seeds['parameters'].tolist())) == 4
+        assert 'correlations.E_ab' in seeds
+
+        # The legacy JSON gives the same columns
+        legacy = load_columns(tmp / 'sweep.json', table='seeds')
+        for name, column in seeds.items():
+            assert np.array_equal(column, legacy[name], equal_nan=column.dtype.kind == 'f'), name
+
+        exported = export_json(store, tmp / 'archive.json')
+        with open(exported) as f:
+            assert json.load(f) == data
+
+        size_json = (tmp / 'sweep.json').stat().st_size
+        size_store = sum(p.stat().st_size for p in store.rglob('*') if p.is_file())
+        print(f"JSON {size_json} bytes, store {size_store} bytes")
+        assert size_store < size_json
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    print("\n✓ Columnar store reproduces the JSON document")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Cross-check the stationary Fokker–Planck solution against Monte Carlo
+"""
+
+import sys
+from pathlib import Path
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'analysis' / 'scripts'))
+from scipy.special import ive
+from stationary import stationary_moments, stationary_log_density, cross_check_monte_carlo
+
+ANGLES = {'a': 0.0, 'a_prime': 98.0, 'b': 45.0, 'b_prime': 127.0}
+
+
+def test_monte_carlo_agreement():
+    """Stationary moments agree with the Δθ engine within Monte Carlo error"""
+
+    print("=" * 80)
+    print("STATIONARY SOLUTION vs MONTE CARLO")
+    print("=" * 80)
+
+    for K, sigma in [(0.7, 0.2), (0.3, 0.6), (0.7, 1.0)]:
+        check = cross_check_monte_carlo(K, sigma, 0.2, ANGLES, seeds=range(1, 11),
+                                        T=50000, dt=0.01, transient=10000)
+        for name, c in check.items():
+            print(f"K={K:.1f} σ={sigma:.1f} {name:<6} stationary={c['stationary']:.4f}  "
+                  f"MC={c['mc_mean']:.4f}±{c['mc_sem']:.4f}  z={c['z']:+.2f}")
+            assert abs(c['mc_mean'] - c['stationary']) < 4 * c['mc_sem'] + 5e-3
+
+
+def test_small_noise_limit():
+    """σ → 0 approaches the locked fixed point sin Δθ* = Δω / 2K"""
+
+    K, delta_omega = 0.7, 0.2
+    exact = stationary_moments(K, 0.0, delta_omega)
+    small = stationary_moments(K, 0.01, delta_omega)
+
+    print(f"\nσ=0:    C={float(exact.C):.6f}  Sn={float(exact.Sn):.6f}")
+    print(f"σ=0.01: C={float(small.C):.6f}  Sn={float(small.Sn):.6f}")
+
+    assert np.isclose(float(exact.Sn), delta_omega / (2 * K))
+    assert abs(float(small.C) - float(exact.C)) < 1e-3
+    assert abs(float(small.Sn) - float(exact.Sn)) < 1e-3
+
+
+def test_continued_fraction():
+    """Δω = 0 is von Mises (⟨cos Δθ⟩ = I1(κ)/I0(κ), κ = 2K/σ²); the grid matches per-point quadrature"""
+
+    K = np.array([0.05, 0.3, 0.7, 1.6])
+    sigma = np.array([0.006, 0.05, 0.3, 1.2])[:, None]
+    kappa = 2 * K / sigma**2
+    moments = stationary_moments(K, sigma, 0.0)
+    assert moments.C.shape == (4, 4)
+    assert np.allclose(moments.C, ive(1, kappa) / ive(0, kappa), rtol=0, atol=1e-12)
+    assert np.allclose(moments.Sn, 0.0, atol=1e-12)
+
+    # Tilted density: fine-grid quadrature of stationary_log_density
+    for K, sigma in [(0.1, 0.05), (0.3, 0.6), (0.7, 0.2)]:
+        x, log_p = stationary_log_density(K, sigma, 0.2, n_grid=2**18)
+        w = np.exp(log_p - log_p.max())
+        w /= w.sum()
+        exact = stationary_moments(K, sigma, 0.2)
+        assert abs(float(exact.C) - np.dot(w, np.cos(x))) < 1e-6
+        assert abs(float(exact.Sn) - np.dot(w, np.sin(x))) < 1e-6
+
+    # No silent truncation where the recursion cannot converge
+    try:
+        stationary_moments(1.0, 1e-5, 0.2)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unconverged σ accepted")
+
+
+if __name__ == "__main__":
+    test_monte_carlo_agreement()
+    test_small_noise_limit()
+    test_continued_fraction()
+    print("\n✓ Stationary solution matches Monte Carlo")
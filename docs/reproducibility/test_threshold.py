@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Check the adaptive threshold finder on a metric with a known crossing
+"""
+
+import sys
+from pathlib import Path
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'analysis' / 'scripts'))
+from threshold import find_crossing
+
+SIGMA_TRUE = 0.1234
+NOISE = 0.02
+
+
+def metric(sigma, seed):
+    """Smooth decreasing curve through 0.5 at SIGMA_TRUE, plus per-seed noise"""
+    rng = np.random.default_rng([int(round(sigma * 1e6)), seed])
+    return 1.0 / (1.0 + np.exp((sigma - SIGMA_TRUE) / 0.03)) + NOISE * rng.normal()
+
+
+def test_finds_crossing():
+    """Estimate within its CI, far fewer simulations than the dense grid"""
+
+    print("=" * 80)
+    print("THRESHOLD SEARCH vs known crossing")
+    print("=" * 80)
+
+    calls = []
+
+    def evaluate(sigma, seeds):
+        calls.append((sigma, list(seeds)))
+        return [metric(sigma, seed) for seed in seeds]
+
+    grid = np.round(np.arange(0.0, 0.41, 0.02), 2)
+    for method in ['secant', 'bisection']:
+        calls.clear()
+        result = find_crossing(evaluate, grid, 0.5, n_seeds=5, max_seeds=40, tol=0.002, method=method)
+        low, high = result['ci']
+        print(f"{method:<9}: σ = {result['sigma']:.4f} [{low:.4f}, {high:.4f}], "
+              f"{result['n_simulations']} simulations, {len(result['points'])} points")
+
+        assert result['converged']
+        assert low <= SIGMA_TRUE <= high
+        assert high - low < 0.02
+        assert result['n_simulations'] == sum(len(seeds) for _, seeds in calls)
+        # Dense 0.002 grid over [0, 0.4] at 5 seeds would be ~1000 simulations
+        assert result['n_simulations'] < 250
+
+        # Seeds at a point are extended, never redrawn
+        for point in result['points']:
+            seeds = [seed for sigma, chunk in calls if sigma == point['sigma'] for seed in chunk]
+            assert seeds == list(range(point['n_seeds']))
+
+
+def test_no_crossing():
+    """Metric above the level everywhere, or already below at the first point"""
+
+    never = find_crossing(lambda sigma, seeds: [1.0] * len(seeds), [0.0, 0.1, 0.2], 0.5)
+    assert never['sigma'] is None and never['n_simulations'] == 15
+
+    always = find_crossing(lambda sigma, seeds: [0.0] * len(seeds), [0.0, 0.1, 0.2], 0.5)
+    assert always['sigma'] is None and always['n_simulations'] == 5
+
+
+def test_known_point_above():
+    """A known σ = 0 point opens the bracket when the first grid σ is already below the level"""
+
+    def evaluate(sigma, seeds):
+        return [metric(sigma, seed) for seed in seeds]
+
+    grid = np.round(np.arange(0.2, 0.41, 0.02), 2)
+    assert find_crossing(evaluate, grid, 0.5)['bracket'] == [None, 0.2]
+
+    reference = evaluate(0.0, range(5))
+    result = find_crossing(evaluate, grid, 0.5, tol=0.002, above=(0.0, reference))
+    low, high = result['ci']
+    print(f"known σ = 0: σ = {result['sigma']:.4f} [{low:.4f}, {high:.4f}]")
+    assert result['converged'] and low <= SIGMA_TRUE <= high
+    assert result['points'][0] == {'sigma': 0.0, 'mean': np.mean(reference),
+                                   'sem': np.std(reference, ddof=1) / np.sqrt(5), 'n_seeds': 5}
+
+
+if __name__ == "__main__":
+    test_finds_crossing()
+    test_no_crossing()
+    test_known_point_above()
+    print("\n✓ Threshold search locates the crossing")
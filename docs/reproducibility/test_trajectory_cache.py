@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Check the trajectory cache: hits reproduce the simulation, eviction is LRU
+"""
+
+import sys
+import time
+import tempfile
+from pathlib import Path
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'analysis' / 'scripts'))
+from rut_core import trajectory_dtheta, run_single_experiment, CircularMoments, ENGINE_VERSION
+from trajectory_cache import TrajectoryCache
+
+PARAMS = {
+    'K': 0.7,
+    'delta_omega': 0.2,
+    'sigma': 0.3,
+    'angles': {'a': 0.0, 'a_prime': 98.0, 'b': 45.0, 'b_prime': 127.0},
+    'T': 10000,
+    'dt': 0.01,
+    'transient': 2000,
+    'omega1': 1.0,
+    'K_modulation': None
+}
+
+
+def test_cache_hit_matches_simulation():
+    """A cached Δθ equals a fresh one and reproduces run_single_experiment"""
+
+    print("=" * 80)
+    print("TRAJECTORY CACHE: hit vs fresh simulation")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = TrajectoryCache(tmp)
+
+        fresh = trajectory_dtheta(PARAMS, seed=3, cache=cache)
+        # Different angles/transient and float noise in σ hit the same entry
+        hit = trajectory_dtheta(dict(PARAMS, sigma=0.1 + 0.2, transient=0), seed=3, cache=cache)
+        print(f"Entries: {len(list(Path(tmp).glob('*/*.npz')))}")
+        assert len(list(Path(tmp).glob('*/*.npz'))) == 1
+        assert np.array_equal(fresh, hit)
+
+        moments = CircularMoments.from_dtheta(hit, PARAMS['transient'])
+        reference = run_single_experiment(PARAMS, seed=3)
+        assert moments.chsh(PARAMS['angles'])[1] == reference['S']
+
+        # Seed-stream and legacy trajectories are separate entries
+        trajectory_dtheta(PARAMS, seed=3, experiment_id='TEST', cache=cache)
+        assert len(list(Path(tmp).glob('*/*.npz'))) == 2
+
+
+def test_lru_eviction():
+    """Past max_bytes the least recently used entries go first"""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        entry_bytes = 8000 + 1000
+        cache = TrajectoryCache(tmp, max_bytes=3 * entry_bytes)
+
+        keys = [cache.key('test', {'i': i}, 0, 'legacy', ENGINE_VERSION) for i in range(4)]
+        for key in keys[:3]:
+            cache.put(key, {'x': np.zeros(1000)})
+            time.sleep(0.01)
+
+        cache.get(keys[0])  # keys[1] is now least recently used
+        time.sleep(0.01)
+        cache.put(keys[3], {'x': np.zeros(1000)})
+
+        present = [cache.get(key) is not None for key in keys]
+        print(f"Present after eviction: {present}")
+        assert present == [True, False, True, True]
+        assert cache.size() <= cache.max_bytes
+
+
+if __name__ == "__main__":
+    test_cache_hit_matches_simulation()
+    test_lru_eviction()
+    print("\n✓ Trajectory cache works")
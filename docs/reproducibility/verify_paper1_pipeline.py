@@ -37,6 +37,10 @@ def subsection(title):
 REPO_ROOT = Path(__file__).parent
 SCRIPT_PATH = REPO_ROOT / "analysis/scripts/paper1_runners/RUN_ALL_PAPER1.sh"
 DATA_DIR = REPO_ROOT / "analysis/data/paper1"
+
+# A1/A2 write columnar stores (NAME.cols); the loaders also read legacy JSON
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "analysis" / "scripts"))
+from result_store import resolve_results, load_meta, load_results
 CONFIG_DIR = REPO_ROOT / "paper/configs_paper1"
 
 def check_script_hardening():
@@ -78,10 +82,13 @@ def verify_data_exists():
 
     results = {}
     for filename in expected_files:
-        filepath = DATA_DIR / filename
-        exists = filepath.exists()
+        try:
+            filepath = resolve_results(DATA_DIR / Path(filename).stem)
+            exists = True
+        except FileNotFoundError:
+            exists = False
         results[filename] = exists
-        print(f"{check_mark(exists)} {filename}")
+        print(f"{check_mark(exists)} {filepath.name if exists else filename}")
         if exists:
             # Get file timestamp
             mtime = datetime.fromtimestamp(filepath.stat().st_mtime)
@@ -98,8 +105,7 @@ def extract_key_metrics():
     # Metric 1: |S|max ≈ 2.819
     subsection("Metric 1: Maximum |S| value")
     try:
-        with open(DATA_DIR / "A2_angle_ridge.json") as f:
-            a2_data = json.load(f)
+        a2_data = load_meta(DATA_DIR / "A2_angle_ridge")
 
         if 'maximum' in a2_data:
             S_max = a2_data['maximum']['abs_S_mean']
@@ -128,8 +134,7 @@ def extract_key_metrics():
     # Metric 2: σc(K) fit R² ≥ 0.97
     subsection("Metric 2: Linear fit R² for σ_c(K)")
     try:
-        with open(DATA_DIR / "A1_sigma_c_K_sweep.json") as f:
-            a1_data = json.load(f)
+        a1_data = load_meta(DATA_DIR / "A1_sigma_c_K_sweep")
 
         if 'sigma_c_analysis' in a1_data and 'linear_fit' in a1_data['sigma_c_analysis']:
             fit = a1_data['sigma_c_analysis']['linear_fit']
@@ -210,8 +215,7 @@ def check_determinism():
     subsection("Data Structure Consistency")
 
     try:
-        with open(DATA_DIR / "A1_sigma_c_K_sweep.json") as f:
-            a1_data = json.load(f)
+        a1_data = load_results(DATA_DIR / "A1_sigma_c_K_sweep")
 
         # Check for required fields
         required_fields = ['experiment_id', 'timestamp', 'grid_results', 'sigma_c_analysis']
@@ -305,17 +309,20 @@ def generate_manifest():
 
         # Find the actual file
         if exp == 'A1':
-            data_file = DATA_DIR / "A1_sigma_c_K_sweep.json"
+            data_file = DATA_DIR / "A1_sigma_c_K_sweep"
         elif exp == 'A2':
-            data_file = DATA_DIR / "A2_angle_ridge.json"
+            data_file = DATA_DIR / "A2_angle_ridge"
         elif exp == 'A3':
-            data_file = DATA_DIR / "A3_delta_omega_sweep.json"
+            data_file = DATA_DIR / "A3_delta_omega_sweep"
         else:
-            data_file = DATA_DIR / "B1_minimal_echo.json"
+            data_file = DATA_DIR / "B1_minimal_echo"
 
+        try:
+            data_file = resolve_results(data_file)
+        except FileNotFoundError:
+            continue
         if data_file.exists():
-            with open(data_file) as f:
-                data = json.load(f)
+            data = load_meta(data_file)
 
             manifest['experiments'][exp] = {
                 'data_file': str(data_file.relative_to(REPO_ROOT)),
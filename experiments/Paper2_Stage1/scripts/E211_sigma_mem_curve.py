@@ -24,14 +24,20 @@ from typing import List, Dict, Optional, Tuple
 SCRIPT_DIR = Path(__file__).parent
 WARMUP_SCRIPTS = SCRIPT_DIR.parent.parent / "Paper2_Warmup" / "scripts"
 sys.path.insert(0, str(WARMUP_SCRIPTS))
+RUT_CORE_PATH = SCRIPT_DIR.resolve().parent.parent.parent / "analysis" / "scripts"
+sys.path.insert(0, str(RUT_CORE_PATH))
 
 from rut_core_p2 import run_experiment_with_memory
 from memory_metrics import rho_S
+from sweep import run_sweep
+from threshold import find_crossing
+from journal import SweepJournal
 
 # Paths
 CONFIG_DIR = SCRIPT_DIR.parent / "config"
 DATA_DIR = SCRIPT_DIR.parent / "analysis" / "data"
 LAB_DIR = SCRIPT_DIR.parent.parent.parent.parent / "lab"
+JOURNAL_PATH = DATA_DIR / "E211_journal.jsonl"
 
 
 def load_config() -> dict:
@@ -130,34 +136,35 @@ def compute_sigma_mem(
     return sigma_mem, point_data
 
 
-def main():
-    print("=" * 80)
-    print("Paper 2 - Mission 1: σ_mem(K) Curve")
-    print("=" * 80)
-    print()
+def run_grid_sweep(config: dict, journal: SweepJournal) -> Tuple[List[Dict], List[Optional[float]]]:
+    """
+    σ_mem(K) from the full (K, σ) grid: σ_mem = first grid σ below threshold.
 
-    # Load config
-    config = load_config()
+    Returns:
+        grid_data: {K, sigma, rho_S, rho_S_std} for every grid point
+        sigma_mem_values: σ_mem per K (None if never crossed)
+    """
     params = config['parameters']
-
     K_values = params['K_values']
     sigma_values = params['sigma_values']
     tau = params['tau']
     threshold_fraction = params['threshold_fraction']
     n_seeds = params['n_seeds']
 
-    print(f"Configuration:")
-    print(f"  K values: {len(K_values)} points from {K_values[0]} to {K_values[-1]}")
-    print(f"  σ values: {len(sigma_values)} points from {sigma_values[0]} to {sigma_values[-1]}")
-    print(f"  τ = {tau}")
-    print(f"  Threshold fraction f = {threshold_fraction}")
-    print(f"  Seeds per point: {n_seeds}")
-    print(f"  Total simulations: {len(K_values) * len(sigma_values) * n_seeds}")
-    print()
-
-    # Generate run ID
-    run_id = f"E211-{datetime.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:8]}"
-    print(f"Run ID: {run_id}")
+    # Every (K, σ, seed) simulation is independent: run them all across the
+    # process pool (σ = 0 first for each K, as in the serial sweep)
+    sweep_sigmas = [0.0] + list(sigma_values[1:])
+    tasks = [
+        (K, sigma, config, seed)
+        for K in K_values for sigma in sweep_sigmas for seed in range(n_seeds)
+    ]
+    print(f"Running {len(tasks)} simulations...")
+    keys = [(K, sigma, seed) for K, sigma, _, seed in tasks]
+    rho_all = [
+        rho for rho, _ in run_sweep(run_single_point, tasks, max_workers=params.get('n_workers'),
+                                    journal=journal, keys=keys)
+    ]
+    rho_all = np.array(rho_all).reshape(len(K_values), len(sweep_sigmas), n_seeds)
     print()
 
     # Results storage
@@ -169,10 +176,7 @@ def main():
         print(f"[{i+1}/{len(K_values)}] K = {K:.2f}")
 
         # First compute ρ_det at σ=0 for this K
-        rho_det_vals = []
-        for seed in range(n_seeds):
-            rho, _ = run_single_point(K, 0.0, config, seed)
-            rho_det_vals.append(rho)
+        rho_det_vals = list(rho_all[i, 0])
 
         rho_det = np.mean(rho_det_vals)
         rho_det_std = np.std(rho_det_vals)
@@ -191,11 +195,8 @@ def main():
         sigma_mem = None
         target_rho = threshold_fraction * rho_det
 
-        for sigma in sigma_values[1:]:  # Skip σ=0
-            rho_vals = []
-            for seed in range(n_seeds):
-                rho, _ = run_single_point(K, sigma, config, seed)
-                rho_vals.append(rho)
+        for j, sigma in enumerate(sigma_values[1:], start=1):  # Skip σ=0
+            rho_vals = list(rho_all[i, j])
 
             mean_rho = np.mean(rho_vals)
             std_rho = np.std(rho_vals)
@@ -217,6 +218,146 @@ def main():
 
         sigma_mem_values.append(sigma_mem)
 
+    return grid_data, sigma_mem_values
+
+
+def search_sigma_mem(K: float, config: dict) -> Dict:
+    """
+    Adaptive σ_mem(K): ρ_det from σ = 0, then threshold.find_crossing on
+    the σ > 0 grid for the first σ with ρ_S(τ) < f * ρ_det. σ = 0 is above
+    the threshold by construction and opens the bracket, so a crossing
+    before the first σ > 0 is refined rather than lost.
+
+    Returns find_crossing's result plus rho_det and rho_det_std.
+    """
+    params = config['parameters']
+    search = params['threshold_search']
+    n_seeds = params['n_seeds']
+
+    rho_det_vals = [run_single_point(K, 0.0, config, seed)[0] for seed in range(n_seeds)]
+    rho_det = float(np.mean(rho_det_vals))
+
+    def evaluate(sigma, seeds):
+        return [run_single_point(K, sigma, config, seed)[0] for seed in seeds]
+
+    result = find_crossing(
+        evaluate, params['sigma_values'][1:], params['threshold_fraction'] * rho_det,
+        n_seeds=n_seeds,
+        max_seeds=search.get('max_seeds', 4 * n_seeds),
+        tol=search.get('tol', 0.002),
+        method=search.get('method', 'secant'),
+        above=(0.0, rho_det_vals)
+    )
+    result['rho_det'] = rho_det
+    result['rho_det_std'] = float(np.std(rho_det_vals))
+    return result
+
+
+def run_threshold_search(config: dict, journal: SweepJournal) -> Tuple[List[Dict], List[Optional[float]], Dict]:
+    """
+    σ_mem(K) by adaptive threshold search, one task per K.
+
+    Returns:
+        grid_data: {K, sigma, rho_S, rho_S_sem, n_seeds} for every σ visited
+        sigma_mem_values: interpolated σ_mem per K (None if never crossed)
+        search_summary: confidence intervals, brackets and simulation counts
+    """
+    params = config['parameters']
+    K_values = params['K_values']
+
+    def report(index, task, result):
+        K = task[0]
+        print(f"[{index+1}/{len(K_values)}] K = {K:.2f}")
+        print(f"    ρ_det(τ={params['tau']}) = {result['rho_det']:.4f} ± {result['rho_det_std']:.4f}")
+        if result['sigma'] is not None:
+            low, high = result['ci']
+            print(f"    σ_mem = {result['sigma']:.4f} [{low:.4f}, {high:.4f}] "
+                  f"({result['n_simulations']} simulations)")
+        else:
+            print(f"    σ_mem = NULL (threshold never crossed in σ ∈ [0, {params['sigma_values'][-1]}])")
+
+    searches = run_sweep(search_sigma_mem, [(K, config) for K in K_values],
+                         max_workers=params.get('n_workers'), on_result=report,
+                         journal=journal, keys=list(K_values))
+
+    grid_data = []
+    for K, result in zip(K_values, searches):
+        grid_data.append({
+            "K": K,
+            "sigma": 0.0,
+            "rho_S": result['rho_det'],
+            "rho_S_std": result['rho_det_std']
+        })
+        for point in result['points']:
+            if point['sigma'] == 0.0:
+                continue
+            grid_data.append({
+                "K": K,
+                "sigma": point['sigma'],
+                "rho_S": point['mean'],
+                "rho_S_sem": point['sem'],
+                "n_seeds": point['n_seeds']
+            })
+
+    search_summary = {
+        "sigma_mem_ci": [result['ci'] for result in searches],
+        "bracket": [result['bracket'] for result in searches],
+        "converged": [result['converged'] for result in searches],
+        "n_simulations": sum(result['n_simulations'] for result in searches)
+    }
+    print()
+    print(f"Threshold search: {search_summary['n_simulations']} simulations "
+          f"(full grid: {len(K_values) * len(params['sigma_values']) * params['n_seeds']})")
+
+    return grid_data, [result['sigma'] for result in searches], search_summary
+
+
+def main():
+    print("=" * 80)
+    print("Paper 2 - Mission 1: σ_mem(K) Curve")
+    print("=" * 80)
+    print()
+
+    # Load config
+    config = load_config()
+    params = config['parameters']
+
+    K_values = params['K_values']
+    sigma_values = params['sigma_values']
+    tau = params['tau']
+    threshold_fraction = params['threshold_fraction']
+    n_seeds = params['n_seeds']
+
+    print(f"Configuration:")
+    print(f"  K values: {len(K_values)} points from {K_values[0]} to {K_values[-1]}")
+    print(f"  σ values: {len(sigma_values)} points from {sigma_values[0]} to {sigma_values[-1]}")
+    print(f"  τ = {tau}")
+    print(f"  Threshold fraction f = {threshold_fraction}")
+    print(f"  Seeds per point: {n_seeds}")
+    print(f"  Total simulations: {len(K_values) * len(sigma_values) * n_seeds}")
+    print()
+
+    # Generate run ID, or resume an interrupted run of the same config
+    # (the worker count may differ between attempts)
+    sweep = dict(config, parameters={k: v for k, v in params.items() if k != 'n_workers'})
+    journal = SweepJournal(JOURNAL_PATH, sweep, meta={
+        "run_id": f"E211-{datetime.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:8]}",
+        "timestamp": datetime.now().isoformat(),
+        "timestamp_utc": datetime.utcnow().isoformat()
+    })
+    run_id = journal.meta["run_id"]
+    print(f"Run ID: {run_id}")
+    if len(journal):
+        print(f"Resuming: {len(journal)} simulations already in {JOURNAL_PATH}")
+    print()
+
+    threshold_search = params.get('threshold_search', {})
+    if threshold_search.get('enabled', False):
+        grid_data, sigma_mem_values, search_summary = run_threshold_search(config, journal)
+    else:
+        grid_data, sigma_mem_values = run_grid_sweep(config, journal)
+        search_summary = None
+
     print()
     print("=" * 80)
     print("RESULTS SUMMARY")
@@ -236,7 +377,7 @@ def main():
         "experiment_id": "E211",
         "run_id": run_id,
         "run_type": "P2_Mission1_sigma_mem_curve",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": journal.meta["timestamp"],
         "tau": tau,
         "threshold_fraction": threshold_fraction,
         "grid": grid_data
@@ -252,7 +393,7 @@ def main():
         "experiment_id": "E211",
         "run_id": run_id,
         "run_type": "P2_Mission1_sigma_mem_curve",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": journal.meta["timestamp"],
         "tau": tau,
         "threshold_fraction": threshold_fraction,
         "K_values": K_values,
@@ -269,6 +410,9 @@ def main():
             "definition": f"σ_mem = smallest σ where ρ_S({tau}) < {threshold_fraction} * ρ_S({tau})|_{{σ=0}}"
         }
     }
+    if search_summary is not None:
+        curve_output["threshold_search"] = search_summary
+        curve_output["notes"]["method"] = "adaptive bracket + secant/bisection, interpolated crossing"
 
     curve_file = DATA_DIR / "memory_threshold_curve.json"
     with open(curve_file, 'w') as f:
@@ -283,7 +427,7 @@ def main():
         "run_id": run_id,
         "experiment_id": "E211",
         "run_type": "P2_Mission1_sigma_mem_curve",
-        "timestamp_utc": datetime.utcnow().isoformat(),
+        "timestamp_utc": journal.meta["timestamp_utc"],
         "operator": "tc",
         "origin_trigger": "manual",
         "status": "COMPLETED",
@@ -303,6 +447,8 @@ def main():
         json.dump(manifest, f, indent=2)
     print(f"Saved manifest: {manifest_file}")
 
+    journal.finish()
+
     print()
     print("=" * 80)
     print("Mission 1 COMPLETE")
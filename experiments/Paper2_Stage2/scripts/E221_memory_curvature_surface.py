@@ -26,13 +26,18 @@ from typing import List, Dict, Any
 SCRIPT_DIR = Path(__file__).parent
 WARMUP_SCRIPTS = SCRIPT_DIR.parent.parent / "Paper2_Warmup" / "scripts"
 sys.path.insert(0, str(WARMUP_SCRIPTS))
+RUT_CORE_PATH = SCRIPT_DIR.resolve().parent.parent.parent / "analysis" / "scripts"
+sys.path.insert(0, str(RUT_CORE_PATH))
 
 from rut_core_p2 import run_experiment_with_memory
 from memory_metrics import C_mem
+from sweep import run_sequential_sweep, default_workers
+from journal import SweepJournal
 
 # Paths
 CONFIG_DIR = SCRIPT_DIR.parent / "config"
 DATA_DIR = SCRIPT_DIR.parent / "analysis" / "data"
+JOURNAL_PATH = DATA_DIR / "E221_journal.jsonl"
 
 
 def load_config() -> dict:
@@ -41,13 +46,29 @@ def load_config() -> dict:
         return json.load(f)
 
 
+def dense_tau_grid(cfg: dict) -> List[int]:
+    """
+    Lags (in samples) at which ρ_S is evaluated for the curvature.
+
+    By default only the reported τ values (C_mem from their second
+    differences, as before). With `tau_grid_step` set, also every
+    `tau_grid_step` samples up to the largest reported τ: a denser but
+    costlier grid, since run_experiment_with_memory evaluates each lag
+    separately, and C_mem then becomes a local curvature at τ_mid.
+    """
+    step = cfg.get('tau_grid_step')
+    if step is None:
+        return sorted(cfg['tau_vals'])
+    return sorted(set(range(step, max(cfg['tau_vals']) + 1, step)) | set(cfg['tau_vals']))
+
+
 def run_single_point(K: float, sigma: float, config: dict, seed: int) -> Dict[str, Any]:
     """
     Run simulation at single (K, sigma) point with given seed.
-    Returns full memory metrics including curvature.
+    Returns full memory metrics, with ρ_S on the dense lag grid.
     """
     cfg = config['parameters']
-    tau_vals = cfg['tau_vals']
+    tau_vals = dense_tau_grid(cfg)
 
     params = {
         'K': K,
@@ -84,22 +105,41 @@ def main():
     sigma_values = params['sigma_values']
     tau_vals = params['tau_vals']
     tau_mid_vals = params['tau_mid_vals']
+    tau_grid = dense_tau_grid(params)
     n_seeds = params['n_seeds']
 
-    total_sims = len(K_values) * len(sigma_values) * n_seeds
+    # Sequential seed budget: with "sem_tol" set, each point keeps drawing
+    # seeds until the SEM of its "sem_metric" is below it or it has "max_seeds"
+    sem_tol = params.get('sem_tol')
+    sem_metric = params.get('sem_metric', 'S_instant_mean')
+    max_seeds = params.get('max_seeds', n_seeds) if sem_tol is not None else n_seeds
+
+    total_sims = len(K_values) * len(sigma_values) * max_seeds
 
     print(f"Configuration:")
     print(f"  K values: {len(K_values)} points [{K_values[0]}, {K_values[-1]}]")
     print(f"  σ values: {len(sigma_values)} points [{sigma_values[0]}, {sigma_values[-1]}]")
     print(f"  τ values: {tau_vals}")
     print(f"  τ_mid values: {tau_mid_vals}")
-    print(f"  Seeds per point: {n_seeds}")
+    print(f"  Curvature lag grid: {len(tau_grid)} lags in [{tau_grid[0]}, {tau_grid[-1]}]")
+    if sem_tol is None:
+        print(f"  Seeds per point: {n_seeds}")
+    else:
+        print(f"  Seeds per point: {n_seeds}–{max_seeds} (until SEM({sem_metric}) < {sem_tol})")
     print(f"  Total simulations: {total_sims}")
     print()
 
-    # Generate run ID
-    run_id = f"E221-{datetime.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:8]}"
+    # Generate run ID, or resume an interrupted run of the same config
+    # (the worker count may differ between attempts)
+    sweep = dict(config, parameters={k: v for k, v in params.items() if k != 'n_workers'})
+    journal = SweepJournal(JOURNAL_PATH, sweep, meta={
+        "run_id": f"E221-{datetime.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:8]}",
+        "timestamp": datetime.now().isoformat()
+    })
+    run_id = journal.meta["run_id"]
     print(f"Run ID: {run_id}")
+    if len(journal):
+        print(f"Resuming: {len(journal)}/{total_sims} simulations already in {JOURNAL_PATH}")
     print()
 
     # Initialize storage for surfaces
@@ -114,9 +154,33 @@ def main():
     # Full grid entries
     entries = []
 
-    sim_count = 0
+    sim_count = len(journal)
+    n_resumed = len(journal)
     start_time = datetime.now()
 
+    # Fan all (K, σ, seed) simulations out to the process pool
+    n_workers = params.get('n_workers') or default_workers()
+    print(f"Workers: {n_workers}")
+    print()
+
+    points = [(K, sigma, config) for K in K_values for sigma in sigma_values]
+
+    def report(index, task, result):
+        nonlocal sim_count
+        sim_count += 1
+        if sim_count % (5 * n_seeds) == 0 or sim_count == total_sims:
+            elapsed = (datetime.now() - start_time).total_seconds()
+            rate = (sim_count - n_resumed) / elapsed if elapsed > 0 else 0
+            remaining = (total_sims - sim_count) / rate if rate > 0 else 0
+            print(f"    {sim_count}/{total_sims} sims | ~{remaining/60:.1f} min remaining")
+
+    point_results = run_sequential_sweep(
+        run_single_point, points, lambda result: result[sem_metric], sem_tol=sem_tol,
+        min_seeds=n_seeds, max_seeds=max_seeds, max_workers=n_workers, on_result=report,
+        journal=journal, key=lambda task: (task[0], task[1], task[3])
+    )
+    print()
+
     for i, K in enumerate(K_values):
         print(f"[{i+1}/{len(K_values)}] K = {K:.2f}")
 
@@ -128,10 +192,7 @@ def main():
             rho_by_tau = {str(tau): [] for tau in tau_vals}
             curvature_by_tau_mid = {str(tm): [] for tm in tau_mid_vals}
 
-            for seed in range(n_seeds):
-                result = run_single_point(K, sigma, config, seed)
-                sim_count += 1
-
+            for result in point_results[i * n_sigma + j]:
                 S_instant_means.append(result['S_instant_mean'])
                 pli_vals.append(result['PLI'])
 
@@ -141,11 +202,14 @@ def main():
                     rho_by_tau[str(tau)].append(result.get(rho_key, 0.0))
 
                 # Compute curvature from rho values
-                rho_vals_for_curv = [result.get(f'rho_S_{tau}', 0.0) for tau in tau_vals]
-                tau_mids, C_vals = C_mem(rho_vals_for_curv, tau_vals)
+                rho_vals_for_curv = [result.get(f'rho_S_{tau}', 0.0) for tau in tau_grid]
+                tau_mids, C_vals = C_mem(rho_vals_for_curv, tau_grid)
+                if params.get('tau_grid_step') is not None:
+                    # Dense lag grid: read the local curvature off at each τ_mid
+                    tau_mids, C_vals = tau_mid_vals, np.interp(tau_mid_vals, tau_mids, C_vals)
 
                 for tm, cv in zip(tau_mids, C_vals):
-                    curvature_by_tau_mid[str(tm)].append(cv)
+                    curvature_by_tau_mid[str(tm)].append(float(cv))
 
             # Average over seeds
             entry = {
@@ -154,6 +218,7 @@ def main():
                 "S_instant_mean": float(np.mean(S_instant_means)),
                 "S_instant_std": float(np.std(S_instant_means)),
                 "PLI": float(np.mean(pli_vals)),
+                "n_seeds": len(S_instant_means),
                 "rho_by_tau": {},
                 "curvature": []
             }
@@ -186,14 +251,6 @@ def main():
 
             entries.append(entry)
 
-            # Progress update every 10 sigma points
-            if (j + 1) % 5 == 0:
-                elapsed = (datetime.now() - start_time).total_seconds()
-                rate = sim_count / elapsed if elapsed > 0 else 0
-                remaining = (total_sims - sim_count) / rate if rate > 0 else 0
-                print(f"    σ = {sigma:.2f} | {sim_count}/{total_sims} sims | "
-                      f"~{remaining/60:.1f} min remaining")
-
     print()
     print("=" * 80)
     print("SAVING RESULTS")
@@ -205,9 +262,10 @@ def main():
         "experiment_id": "E221",
         "run_id": run_id,
         "run_type": "P2_Mission2_memory_curvature_surface",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": journal.meta["timestamp"],
         "tau_vals": tau_vals,
         "tau_mid_vals": tau_mid_vals,
+        "tau_grid": tau_grid,
         "K_values": K_values,
         "sigma_values": sigma_values,
         "n_seeds": n_seeds,
@@ -265,6 +323,8 @@ def main():
 
     elapsed_total = (datetime.now() - start_time).total_seconds() / 60
     print(f"Total runtime: {elapsed_total:.1f} minutes")
+
+    journal.finish()
     print()
     print("=" * 80)
     print("Mission 2 COMPLETE")
@@ -10,9 +10,11 @@ Find optimal CHSH angles across (K, σ) grid and compute:
 - Echo_angle = ρ_{S*}(τ=50) (memory at optimal angles)
 - Angle flow vectors (how optimal angles shift with noise)
 
-Uses two-stage optimization:
-1. Coarse grid search (30° steps) to find approximate maximum
-2. Local refinement (6° steps) around the coarse optimum
+Optimal angles come from the closed-form solution on the circular moments
+of the sampled phases (rut_core.optimize_angles_analytic). The original
+two-stage grid search is kept for verification:
+1. Coarse grid search (15° steps) to find approximate maximum
+2. Local refinement (3° steps) around the coarse optimum
 """
 
 import numpy as np
@@ -23,6 +25,18 @@ from datetime import datetime
 from pathlib import Path
 from itertools import product
 
+# Add rut_core to path
+RUT_CORE_PATH = Path(__file__).resolve().parent.parent.parent.parent / 'analysis' / 'scripts'
+sys.path.insert(0, str(RUT_CORE_PATH))
+from rut_core import (
+    CircularMoments, optimize_angles_analytic, rolling_chsh, stationarity_check, detect_transient,
+    sde_step, pathwise_sensitivities, rolling_chsh_tangent
+)
+from seed_streams import trajectory_rng, initial_phases
+from sweep import run_sweep, run_sequential_sweep, default_workers
+from journal import SweepJournal
+from noise_tape import NoiseTapes
+
 # Ensure unbuffered output
 sys.stdout.reconfigure(line_buffering=True)
 
@@ -35,11 +49,18 @@ K_VALUES = np.linspace(0.10, 1.00, 19)
 SIGMA_VALUES = np.linspace(0.0, 0.40, 21)
 SEEDS_PER_POINT = 3
 
+# Sequential seed budget: with SEM_TOL set, a point keeps drawing seeds
+# until the SEM of its S* is below SEM_TOL or it has MAX_SEEDS_PER_POINT
+# (None = exactly SEEDS_PER_POINT everywhere)
+SEM_TOL = None
+MAX_SEEDS_PER_POINT = 12
+
 # Angle parameters (degrees)
 # Per Chase: 15° coarse (13^4 = 28561 combos), then refine top-N candidates
 ANGLE_COARSE = np.arange(0, 181, 15)  # 13 values for coarse search
 ANGLE_FINE = np.arange(-6, 7, 3)       # ±6° refinement in 3° steps
 TOP_N_CANDIDATES = 10                   # Keep top N from coarse for refinement
+VERIFY_ANGLES = False                   # Also run the grid search and record its S*
 
 # Lag values for echo computation
 TAU_LAGS = [0, 25, 50]
@@ -51,60 +72,217 @@ TRANSIENT = 300000
 SAMPLE_INTERVAL = 100
 DELTA_OMEGA = 0.1
 
+# Integration scheme (rut_core.SDE_SCHEMES): 'euler' is the original
+# Euler–Maruyama loop; 'heun' (weak order 2) and 'srk' (strong order 1.5)
+# allow a coarser DT, see rut_core.dt_convergence. T_STEPS, TRANSIENT and
+# SAMPLE_INTERVAL count steps: scale them by 0.01 / DT to keep the same times.
+SCHEME = 'euler'
+
+# Random streams: one Philox stream per (K, σ, seed) trajectory, noise drawn
+# in blocks. LEGACY_RNG = True reseeds the global RNG per trajectory and
+# reproduces earlier runs bit-for-bit.
+RNG_EXPERIMENT_ID = "E231"
+NOISE_BLOCK = 100000
+LEGACY_RNG = False
+
+# Common random numbers: with NOISE_TAPES every σ of a seed (and, with
+# TAPE_SHARE_K, every K) reuses one memory-mapped noise tape (noise_tape):
+# same initial phases, same standard normals scaled by σ. Neighbouring σ
+# points then differ by σ alone, so χ_angle = ∂S*/∂σ is a coupled, low-
+# variance difference. Tapes are written to TAPE_DIR before the sweep and
+# removed with the journal at the end. Ignored with LEGACY_RNG.
+NOISE_TAPES = False
+TAPE_SHARE_K = False
+
+# σ continuation: each (K, seed) runs SIGMA_VALUES in order, every σ after the
+# first starting from the last sampled state of the previous σ and
+# re-equilibrating for CONTINUATION_TRANSIENT steps instead of TRANSIENT. A
+# warm start whose running PLI drifts by more than STATIONARITY_TOL across
+# STATIONARITY_WINDOWS windows is rerun cold. Uses SEEDS_PER_POINT seeds
+# everywhere (SEM_TOL is ignored).
+CONTINUATION = False
+CONTINUATION_TRANSIENT = 30000
+STATIONARITY_WINDOWS = 4
+STATIONARITY_TOL = 0.05
+
+# Equilibration detector: the transient is also sampled and every record
+# logs the detected transient (steps, running PLI over TRANSIENT_WINDOW-step
+# windows). AUTO_TRANSIENT = True measures from the detected point instead
+# of discarding the full TRANSIENT.
+TRANSIENT_WINDOW = 1000
+AUTO_TRANSIENT = False
+
+# Pathwise sensitivities: integrate the tangent equations of θ1 − θ2 with
+# respect to σ and K alongside the phases (Euler–Maruyama only). Every record
+# then carries ∂S*/∂σ, ∂S*/∂K (at the optimal angles, which is the derivative
+# of S* itself) and ∂echo_50/∂σ, ∂echo_50/∂K, and χ_angle_pathwise is the
+# seed mean of ∂S*/∂σ, next to the finite-difference χ_angle.
+PATHWISE_CHI = False
+
+# Worker processes for the (K, σ, seed) sweep (None = all cores)
+N_WORKERS = None
+
 # Output directory
 OUTPUT_DIR = Path(__file__).parent.parent / "analysis" / "data"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Completed (K, σ, seed) records are journaled here; an interrupted run
+# resumes from it and the file is removed once all outputs are written
+JOURNAL_PATH = OUTPUT_DIR / "E231_journal.jsonl"
+TAPE_DIR = OUTPUT_DIR / "E231_noise_tapes"
+
+_tapes = None
+
+
+def noise_tapes():
+    """This scan's NoiseTapes (one per process, so open tapes stay mapped)"""
+    global _tapes
+    if _tapes is None:
+        _tapes = NoiseTapes(TAPE_DIR, RNG_EXPERIMENT_ID, T_STEPS, 4 if SCHEME == 'srk' else 2,
+                            share_K=TAPE_SHARE_K, block_size=NOISE_BLOCK)
+    return _tapes
+
 
 # ============================================================================
 # SIMULATION CORE
 # ============================================================================
 
-def run_oscillator_simulation(K, sigma, seed, return_phases=True):
+def run_oscillator_simulation(K, sigma, seed, return_phases=True, initial_state=None,
+                              transient=None, include_transient=False, tangents=False):
     """
     Run two coupled Kuramoto oscillators.
     Returns sampled phases after transient.
-    """
-    np.random.seed(seed)
 
-    # Initialize phases
-    theta1 = np.random.uniform(0, 2*np.pi)
-    theta2 = np.random.uniform(0, 2*np.pi)
+    initial_state = (θ1, θ2) replaces the random initial phases (the noise
+    is unchanged); the run lasts transient + (T_STEPS - TRANSIENT) steps
+    (transient defaults to TRANSIENT), so a shorter transient keeps the same
+    number of samples. transient and T_STEPS - TRANSIENT must be multiples
+    of SAMPLE_INTERVAL (ValueError otherwise).
+
+    include_transient = True returns the samples from the start of the run
+    (same sampling grid) and the index of the first post-transient sample.
+
+    tangents = True also returns {'sigma': ∂(θ1 − θ2)/∂σ, 'K': ∂(θ1 − θ2)/∂K},
+    integrated along the same noise path and sampled on the same grid.
+    """
+    if tangents and SCHEME not in ('euler', 'milstein'):
+        raise ValueError("Tangent equations are integrated for SCHEME = 'euler' only")
+
+    if LEGACY_RNG:
+        np.random.seed(seed)
+        draw_noise = np.random.randn
+        theta1 = np.random.uniform(0, 2*np.pi)
+        theta2 = np.random.uniform(0, 2*np.pi)
+    elif NOISE_TAPES:
+        (theta1, theta2), tape = noise_tapes().open(K, seed)
+        cursor = [0]
+
+        def draw_noise(*shape):
+            block = np.asarray(tape[cursor[0]:cursor[0] + shape[0]])
+            cursor[0] += shape[0]
+            return block
+    else:
+        rng = trajectory_rng(RNG_EXPERIMENT_ID, (K, sigma, DELTA_OMEGA), seed)
+        draw_noise = lambda *shape: rng.standard_normal(shape)
+        theta1, theta2 = initial_phases(rng)
+
+    if initial_state is not None:
+        theta1, theta2 = initial_state
+    if transient is None:
+        transient = TRANSIENT
+    # The sampling grid is aligned with the end of the transient; the sample
+    # counts below assume both phases are whole numbers of intervals
+    if transient % SAMPLE_INTERVAL or (T_STEPS - TRANSIENT) % SAMPLE_INTERVAL:
+        raise ValueError(f"transient ({transient}) and T_STEPS - TRANSIENT ({T_STEPS - TRANSIENT}) "
+                         f"must be multiples of SAMPLE_INTERVAL ({SAMPLE_INTERVAL})")
+    n_total = transient + T_STEPS - TRANSIENT
 
     omega1 = 1.0
     omega2 = 1.0 + DELTA_OMEGA
 
-    # Storage for sampled phases
-    n_samples = (T_STEPS - TRANSIENT) // SAMPLE_INTERVAL
-    phases1 = np.zeros(n_samples)
-    phases2 = np.zeros(n_samples)
+    # Storage for sampled phases, transient included
+    n_pre = transient // SAMPLE_INTERVAL
+    n_samples = (n_total - transient) // SAMPLE_INTERVAL
+    phases1 = np.zeros(n_pre + n_samples)
+    phases2 = np.zeros(n_pre + n_samples)
     sample_idx = 0
+    if tangents:
+        tangent_sigma = np.zeros(n_pre + n_samples)
+        tangent_K = np.zeros(n_pre + n_samples)
+        u = v = 0.0
 
     sqrt_dt = np.sqrt(DT)
 
-    for t in range(T_STEPS):
-        # Kuramoto dynamics
-        coupling1 = K * np.sin(theta2 - theta1)
-        coupling2 = K * np.sin(theta1 - theta2)
+    for start in range(0, n_total, NOISE_BLOCK):
+        n_steps = min(NOISE_BLOCK, n_total - start)
+        # Row-major (step, oscillator) block: same draw order as per-step randn()
+        # ('srk' draws two more columns per step for ΔZ)
+        # (the σ tangent needs the normals even at σ = 0)
+        if sigma > 0 or tangents:
+            block = draw_noise(n_steps, 4 if SCHEME == 'srk' else 2)
+
+        if SCHEME not in ('euler', 'milstein'):
+            dW = sigma * sqrt_dt * block[:, :2] if sigma > 0 else np.zeros((n_steps, 2))
+            dZ = np.zeros((n_steps, 2))
+            if SCHEME == 'srk' and sigma > 0:
+                dZ = 0.5 * DT * (dW + sigma * sqrt_dt * block[:, 2:] / np.sqrt(3))
+
+        for k in range(n_steps):
+            t = start + k
+
+            if SCHEME in ('euler', 'milstein'):
+                # Kuramoto dynamics
+                coupling1 = K * np.sin(theta2 - theta1)
+                coupling2 = K * np.sin(theta1 - theta2)
+
+                # Noise
+                if sigma > 0:
+                    noise1 = sigma * block[k, 0] * sqrt_dt
+                    noise2 = sigma * block[k, 1] * sqrt_dt
+                else:
+                    noise1 = noise2 = 0
+
+                # Tangents of θ1 − θ2, from the pre-step phases
+                if tangents:
+                    contraction = 1 - 2 * K * DT * np.cos(theta1 - theta2)
+                    u = contraction * u + sqrt_dt * (block[k, 0] - block[k, 1])
+                    v = contraction * v - 2 * DT * np.sin(theta1 - theta2)
+
+                # Update
+                theta1 += (omega1 + coupling1) * DT + noise1
+                theta2 += (omega2 + coupling2) * DT + noise2
+            else:
+                theta1, theta2 = sde_step(theta1, theta2, omega1, omega2, K, sigma, DT, dW[k], dZ[k], SCHEME)
 
-        # Noise
-        if sigma > 0:
-            noise1 = sigma * np.random.randn() * sqrt_dt
-            noise2 = sigma * np.random.randn() * sqrt_dt
-        else:
-            noise1 = noise2 = 0
+            # Sample on a grid aligned with the end of the transient
+            if (t - transient) % SAMPLE_INTERVAL == 0:
+                phases1[sample_idx] = theta1
+                phases2[sample_idx] = theta2
+                if tangents:
+                    tangent_sigma[sample_idx] = u
+                    tangent_K[sample_idx] = v
+                sample_idx += 1
 
-        # Update
-        theta1 += (omega1 + coupling1) * DT + noise1
-        theta2 += (omega2 + coupling2) * DT + noise2
+    if tangents:
+        sampled = {'sigma': tangent_sigma, 'K': tangent_K}
+        if include_transient:
+            return phases1, phases2, n_pre, sampled
+        return phases1[n_pre:], phases2[n_pre:], {name: x[n_pre:] for name, x in sampled.items()}
 
-        # Sample after transient
-        if t >= TRANSIENT and (t - TRANSIENT) % SAMPLE_INTERVAL == 0:
-            phases1[sample_idx] = theta1
-            phases2[sample_idx] = theta2
-            sample_idx += 1
+    if include_transient:
+        return phases1, phases2, n_pre
+    return phases1[n_pre:], phases2[n_pre:]
 
-    return phases1, phases2
+
+def phase_moments(phases1, phases2):
+    """
+    Reduce sampled phases to their circular moments in one pass.
+    Every CHSH evaluation afterwards is O(1) instead of a cosine pass.
+
+    Built from θ1 − θ2 so that rut_core's E(a,b) on these moments equals
+    this script's <cos(θ1 - θ2 - (a - b))>.
+    """
+    return CircularMoments.from_trajectories(phases2, phases1)
 
 
 def compute_E_correlation(phases1, phases2, angle1_deg, angle2_deg):
@@ -113,10 +291,15 @@ def compute_E_correlation(phases1, phases2, angle1_deg, angle2_deg):
     E = <cos(θ1 - a)cos(θ2 - b) + sin(θ1 - a)sin(θ2 - b)>
       = <cos((θ1 - a) - (θ2 - b))>
       = <cos(θ1 - θ2 - (a - b))>
+
+    phases1 may be a CircularMoments from phase_moments (phases2 unused).
     """
     a_rad = np.deg2rad(angle1_deg)
     b_rad = np.deg2rad(angle2_deg)
 
+    if isinstance(phases1, CircularMoments):
+        return phases1.correlation(a_rad, b_rad)
+
     # Phase difference relative to measurement angles
     delta = (phases1 - a_rad) - (phases2 - b_rad)
 
@@ -126,7 +309,7 @@ def compute_E_correlation(phases1, phases2, angle1_deg, angle2_deg):
 def compute_CHSH(phases1, phases2, a, ap, b, bp):
     """
     Compute CHSH functional S = E(a,b) - E(a,b') + E(a',b) + E(a',b')
-    All angles in degrees.
+    All angles in degrees. Accepts a CircularMoments in place of the phases.
     """
     E_ab = compute_E_correlation(phases1, phases2, a, b)
     E_abp = compute_E_correlation(phases1, phases2, a, bp)
@@ -140,29 +323,14 @@ def compute_CHSH(phases1, phases2, a, ap, b, bp):
 def compute_S_timeseries(phases1, phases2, a, ap, b, bp, window=100):
     """
     Compute instantaneous CHSH values for autocorrelation.
-    Uses rolling window for smoothing.
-    """
-    n = len(phases1)
-    n_windows = n - window + 1
-    S_series = np.zeros(n_windows)
-
-    a_rad = np.deg2rad(a)
-    ap_rad = np.deg2rad(ap)
-    b_rad = np.deg2rad(b)
-    bp_rad = np.deg2rad(bp)
+    Uses rolling window for smoothing (prefix sums, O(N) per window).
 
-    for i in range(n_windows):
-        p1 = phases1[i:i+window]
-        p2 = phases2[i:i+window]
-
-        E_ab = np.mean(np.cos((p1 - a_rad) - (p2 - b_rad)))
-        E_abp = np.mean(np.cos((p1 - a_rad) - (p2 - bp_rad)))
-        E_apb = np.mean(np.cos((p1 - ap_rad) - (p2 - b_rad)))
-        E_apbp = np.mean(np.cos((p1 - ap_rad) - (p2 - bp_rad)))
-
-        S_series[i] = E_ab - E_abp + E_apb + E_apbp
+    window may be a list of window lengths, giving {window: S_series}.
+    """
+    angles = {'a': a, 'a_prime': ap, 'b': b, 'b_prime': bp}
 
-    return S_series
+    # θ1 − θ2: rut_core's E(a,b) then equals <cos(θ1 - θ2 - (a - b))>
+    return rolling_chsh(phases1 - phases2, angles, window)
 
 
 def compute_echo(S_series, tau_lag):
@@ -185,6 +353,23 @@ def compute_echo(S_series, tau_lag):
     return cov / S_var
 
 
+def compute_echo_tangent(S_series, dS_series, tau_lag):
+    """Derivative of compute_echo(S_series, tau_lag) along a tangent dS of S(t)."""
+    if tau_lag == 0 or tau_lag >= len(S_series):
+        return 0.0
+
+    S_var = np.var(S_series)
+    if S_var < 1e-12:
+        return 0.0
+
+    x = S_series - np.mean(S_series)
+    dx = dS_series - np.mean(dS_series)
+    cov = np.mean(x[:-tau_lag] * x[tau_lag:])
+    d_cov = np.mean(dx[:-tau_lag] * x[tau_lag:] + x[:-tau_lag] * dx[tau_lag:])
+    d_var = 2 * np.mean(x * dx)
+    return d_cov / S_var - cov * d_var / S_var**2
+
+
 # ============================================================================
 # ANGLE OPTIMIZATION
 # ============================================================================
@@ -194,13 +379,14 @@ def find_optimal_angles_coarse(phases1, phases2):
     Coarse grid search over angles to find top-N candidates.
     Returns list of (angles, S) tuples sorted by |S|.
     """
+    moments = phase_moments(phases1, phases2)
     candidates = []
 
     for a in ANGLE_COARSE:
         for ap in ANGLE_COARSE:
             for b in ANGLE_COARSE:
                 for bp in ANGLE_COARSE:
-                    S = compute_CHSH(phases1, phases2, a, ap, b, bp)
+                    S = compute_CHSH(moments, None, a, ap, b, bp)
                     candidates.append(((a, ap, b, bp), S))
 
     # Sort by |S| descending, keep top N
@@ -213,6 +399,7 @@ def find_optimal_angles_refined(phases1, phases2, candidate_angles):
     Refine around each candidate using fine grid.
     Returns best overall (angles, S).
     """
+    moments = phase_moments(phases1, phases2)
     best_S = 0.0  # Initialize to 0 so abs() comparison works
     best_angles = candidate_angles[0][0]  # Default to best coarse
 
@@ -228,7 +415,7 @@ def find_optimal_angles_refined(phases1, phases2, candidate_angles):
                         b = b0 + db
                         bp = bp0 + dbp
 
-                        S = compute_CHSH(phases1, phases2, a, ap, b, bp)
+                        S = compute_CHSH(moments, None, a, ap, b, bp)
                         if abs(S) > abs(best_S):
                             best_S = S
                             best_angles = (a, ap, b, bp)
@@ -236,7 +423,7 @@ def find_optimal_angles_refined(phases1, phases2, candidate_angles):
     return best_angles, best_S
 
 
-def optimize_angles(phases1, phases2):
+def optimize_angles_grid(phases1, phases2):
     """
     Two-stage angle optimization:
     1. Coarse grid search (15° steps) → top-N candidates
@@ -247,10 +434,124 @@ def optimize_angles(phases1, phases2):
     return fine_angles, fine_S
 
 
+def optimize_angles(phases1, phases2):
+    """
+    Exact optimum from the circular moments: S* = 2√2·PLI at
+    a = 0°, a' = 90°, b = 45° − ψ, b' = 135° − ψ (ψ = arg<exp(i(θ1 - θ2))>).
+    Angles are reduced to [0°, 360°).
+    """
+    optimum = optimize_angles_analytic(phase_moments(phases1, phases2))
+    angles = optimum['angles']
+    return (angles['a'], angles['a_prime'], angles['b'], angles['b_prime']), optimum['S_star']
+
+
+def circular_mean_deg(angles, axis=0):
+    """
+    Mean direction arg<exp(i·angle)> of angles in degrees, in [0°, 360°).
+    b and b' follow the noisy per-seed ψ, so values such as 2° and 358°
+    must average to 0°, not 180°.
+    """
+    mean = np.angle(np.mean(np.exp(1j * np.deg2rad(angles)), axis=axis))
+    return np.rad2deg(mean) % 360.0
+
+
 # ============================================================================
 # MAIN EXPERIMENT
 # ============================================================================
 
+def run_seed(K, sigma, seed, initial_state=None, transient=None, return_state=False):
+    """
+    Simulate one (K, σ, seed) trajectory and return its result record.
+
+    A warm start (initial_state given) also records its stationarity check;
+    return_state additionally returns the last sampled (θ1, θ2).
+    """
+    simulation = run_oscillator_simulation(K, sigma, seed, initial_state=initial_state, transient=transient,
+                                           include_transient=True, tangents=PATHWISE_CHI)
+    phases1, phases2, n_pre = simulation[:3]
+
+    # Equilibration detected on the running PLI of the sampled Δθ
+    detected = detect_transient(phases1 - phases2, max(TRANSIENT_WINDOW // SAMPLE_INTERVAL, 1))
+    start = n_pre
+    if AUTO_TRANSIENT and detected is not None:
+        start = detected
+    phases1 = phases1[start:]
+    phases2 = phases2[start:]
+
+    # Find optimal angles
+    opt_angles, S_star = optimize_angles(phases1, phases2)
+
+    # Compute echo at optimal angles
+    S_series = compute_S_timeseries(phases1, phases2, *opt_angles)
+    echo_50 = compute_echo(S_series, 50)
+
+    # Store result (convert numpy types to Python native)
+    record = {
+        "K": float(K),
+        "sigma": float(sigma),
+        "seed": int(seed),
+        "S_star": float(S_star),
+        "angle_a": float(opt_angles[0]),
+        "angle_ap": float(opt_angles[1]),
+        "angle_b": float(opt_angles[2]),
+        "angle_bp": float(opt_angles[3]),
+        "echo_50": float(echo_50),
+        "transient_detected": None if detected is None else int(detected * SAMPLE_INTERVAL),
+        "transient_used": int(start * SAMPLE_INTERVAL)
+    }
+    if VERIFY_ANGLES:
+        _, S_grid = optimize_angles_grid(phases1, phases2)
+        record["S_star_grid"] = float(S_grid)
+
+    if PATHWISE_CHI:
+        # S* is stationary in the angles, so dS*/dp is dS/dp at the optimal
+        # angles. echo_50 is not: b and b' follow the mean phase ψ, and
+        # turning them with ψ is the same as shifting θ1 − θ2 by −∂ψ.
+        angles = dict(zip(["a", "a_prime", "b", "b_prime"], opt_angles))
+        delta = phases1 - phases2
+        moments = CircularMoments.from_dtheta(delta)
+        tangents = {name: x[start:] for name, x in simulation[3].items()}
+        sensitivities = pathwise_sensitivities(delta, tangents, angles)
+        for name, tangent in tangents.items():
+            d = CircularMoments.from_tangent(delta, tangent)
+            d_psi = (moments.C * d.Sn - moments.Sn * d.C) / moments.pli**2
+            dS_series = rolling_chsh_tangent(delta, tangent - d_psi, angles, 100)
+            record[f"dS_star_d{name}"] = float(sensitivities[name]["S"])
+            record[f"decho_50_d{name}"] = float(compute_echo_tangent(S_series, dS_series, 50))
+
+    if initial_state is not None:
+        check = stationarity_check(phases1 - phases2, STATIONARITY_WINDOWS, STATIONARITY_TOL)
+        record.update(warm_start=True, pli_drift=check["drift"], stationary=check["stationary"])
+
+    if return_state:
+        return record, (float(phases1[-1]), float(phases2[-1]))
+    return record
+
+
+def run_sigma_chain(K, seed):
+    """
+    Run one seed through SIGMA_VALUES by continuation; one record per σ.
+
+    The first σ is a cold start. Each later σ starts from the previous final
+    state with CONTINUATION_TRANSIENT steps of re-equilibration, and is
+    rerun cold if the running PLI has not settled.
+    """
+    records = []
+    state = None
+    for sigma in SIGMA_VALUES:
+        if state is None:
+            record, state = run_seed(K, sigma, seed, return_state=True)
+        else:
+            record, state = run_seed(K, sigma, seed, initial_state=state,
+                                     transient=CONTINUATION_TRANSIENT, return_state=True)
+            if not record["stationary"]:
+                drift = record["pli_drift"]
+                record, state = run_seed(K, sigma, seed, return_state=True)
+                record.update(warm_start=False, pli_drift=drift, stationary=False)
+        records.append(record)
+    return records
+
+
 def run_experiment():
     """Run E231 angle-resolved field scan."""
 
@@ -261,22 +562,69 @@ def run_experiment():
     n_K = len(K_VALUES)
     n_sigma = len(SIGMA_VALUES)
     total_points = n_K * n_sigma
-    total_sims = total_points * SEEDS_PER_POINT
+    max_seeds = SEEDS_PER_POINT if SEM_TOL is None or CONTINUATION else MAX_SEEDS_PER_POINT
+    total_sims = total_points * max_seeds
 
     print(f"\nConfiguration:")
     print(f"  K values: {n_K} points [{K_VALUES[0]:.2f}, {K_VALUES[-1]:.2f}]")
     print(f"  σ values: {n_sigma} points [{SIGMA_VALUES[0]:.2f}, {SIGMA_VALUES[-1]:.2f}]")
-    print(f"  Seeds per point: {SEEDS_PER_POINT}")
-    print(f"  Total simulations: {total_sims}")
-    print(f"  Coarse angle grid: {len(ANGLE_COARSE)}^4 = {len(ANGLE_COARSE)**4} combos (15° steps)")
-    print(f"  Top-N candidates kept: {TOP_N_CANDIDATES}")
-    print(f"  Fine refinement per candidate: {len(ANGLE_FINE)}^4 = {len(ANGLE_FINE)**4} combos (3° steps)")
-
-    run_id = f"E231-{datetime.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:8]}"
+    if SEM_TOL is None or CONTINUATION:
+        print(f"  Seeds per point: {SEEDS_PER_POINT}")
+        print(f"  Total simulations: {total_sims}")
+    else:
+        print(f"  Seeds per point: {SEEDS_PER_POINT}–{MAX_SEEDS_PER_POINT} (until SEM(S*) < {SEM_TOL})")
+        print(f"  Total simulations: at most {total_sims}")
+    print(f"  Angle optimization: closed form from circular moments")
+    print(f"  Integration: {SCHEME}, dt = {DT}")
+    if CONTINUATION:
+        print(f"  σ continuation: {CONTINUATION_TRANSIENT} re-equilibration steps after the first σ "
+              f"(cold start: {TRANSIENT})")
+    if VERIFY_ANGLES:
+        print(f"  Verification grid: {len(ANGLE_COARSE)}^4 coarse + {TOP_N_CANDIDATES}×{len(ANGLE_FINE)}^4 fine combos")
+
+    # Resume from the journal if an earlier run of this sweep was interrupted
+    sweep = {
+        "K_values": K_VALUES.tolist(),
+        "sigma_values": SIGMA_VALUES.tolist(),
+        "seeds_per_point": SEEDS_PER_POINT,
+        "T_steps": T_STEPS,
+        "dt": DT,
+        "transient": TRANSIENT,
+        "sample_interval": SAMPLE_INTERVAL,
+        "delta_omega": DELTA_OMEGA,
+        "legacy_rng": LEGACY_RNG,
+        "verify_angles": VERIFY_ANGLES
+    }
+    if CONTINUATION:
+        sweep.update(continuation_transient=CONTINUATION_TRANSIENT,
+                     stationarity_windows=STATIONARITY_WINDOWS, stationarity_tol=STATIONARITY_TOL)
+    elif SEM_TOL is not None:
+        sweep.update(sem_tol=SEM_TOL, max_seeds_per_point=MAX_SEEDS_PER_POINT)
+    if AUTO_TRANSIENT:
+        sweep.update(auto_transient=True, transient_window=TRANSIENT_WINDOW)
+    if SCHEME != 'euler':
+        sweep.update(scheme=SCHEME)
+    if PATHWISE_CHI:
+        sweep.update(pathwise_chi=True)
+    if NOISE_TAPES and not LEGACY_RNG:
+        sweep.update(noise_tapes=True, tape_share_K=TAPE_SHARE_K)
+    journal = SweepJournal(JOURNAL_PATH, sweep, meta={
+        "run_id": f"E231-{datetime.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:8]}",
+        "timestamp": datetime.now().isoformat()
+    })
+    run_id = journal.meta["run_id"]
     print(f"\nRun ID: {run_id}")
-
-    # Storage
-    results = []
+    # Journal entries are whole σ chains in continuation mode
+    n_resumed = len(journal) * (n_sigma if CONTINUATION else 1)
+    if n_resumed:
+        print(f"Resuming: {n_resumed}/{total_sims} simulations already in {JOURNAL_PATH}")
+
+    if NOISE_TAPES and not LEGACY_RNG:
+        # Write the tapes once here; workers only map them (extra seeds of a
+        # sequential budget get theirs on first use)
+        noise_tapes().prepare(K_VALUES, range(SEEDS_PER_POINT))
+        n_tapes = SEEDS_PER_POINT * (1 if TAPE_SHARE_K else n_K)
+        print(f"Noise tapes: {n_tapes} in {TAPE_DIR}, shared across σ{' and K' if TAPE_SHARE_K else ''}")
 
     # Surfaces (mean over seeds)
     S_star_surface = np.zeros((n_K, n_sigma))
@@ -285,51 +633,65 @@ def run_experiment():
     angle_b_surface = np.zeros((n_K, n_sigma))
     angle_bp_surface = np.zeros((n_K, n_sigma))
     echo_angle_surface = np.zeros((n_K, n_sigma))
+    n_seeds_surface = np.zeros((n_K, n_sigma), dtype=int)
 
     start_time = datetime.now()
-    sim_count = 0
+    sim_count = n_resumed
+
+    # Fan all (K, σ, seed) simulations out to the process pool
+    print(f"  Workers: {N_WORKERS or default_workers()}")
+    points = [(K, sigma) for K in K_VALUES for sigma in SIGMA_VALUES]
+
+    def report(index, task, record):
+        nonlocal sim_count
+        sim_count += 1
+        if VERIFY_ANGLES and abs(record["S_star_grid"]) > record["S_star"] + 1e-9:
+            print(f"    ⚠️  K={record['K']:.2f} σ={record['sigma']:.2f}: grid |S|={abs(record['S_star_grid']):.6f} "
+                  f"exceeds analytic S*={record['S_star']:.6f}")
+        if sim_count % (5 * SEEDS_PER_POINT) == 0 or sim_count == total_sims:
+            elapsed = (datetime.now() - start_time).total_seconds() / 60
+            rate = (sim_count - n_resumed) / elapsed if elapsed > 0 else 0
+            remaining = (total_sims - sim_count) / rate if rate > 0 else 0
+            print(f"    {sim_count}/{total_sims} sims | ~{remaining:.1f} min remaining")
+
+    if CONTINUATION:
+        # One task per (K, seed) chain, journaled as a whole
+        chains = [(K, seed) for K in K_VALUES for seed in range(SEEDS_PER_POINT)]
+
+        def report_chain(index, task, records):
+            for record in records:
+                report(index, task, record)
+
+        chain_results = run_sweep(run_sigma_chain, chains, max_workers=N_WORKERS,
+                                  on_result=report_chain, journal=journal, keys=chains)
+        point_results = [
+            [chain_results[i_K * SEEDS_PER_POINT + seed][i_sigma] for seed in range(SEEDS_PER_POINT)]
+            for i_K in range(n_K) for i_sigma in range(n_sigma)
+        ]
+        warm = [r for point in point_results for r in point if "warm_start" in r]
+        n_rejected = sum(not r["warm_start"] for r in warm)
+        print(f"  Warm starts: {len(warm) - n_rejected}/{len(warm)} stationary, "
+              f"{n_rejected} rerun cold (max PLI drift {max((r['pli_drift'] for r in warm), default=0.0):.3f})")
+    else:
+        point_results = run_sequential_sweep(
+            run_seed, points, lambda record: record["S_star"], sem_tol=SEM_TOL,
+            min_seeds=SEEDS_PER_POINT, max_seeds=MAX_SEEDS_PER_POINT,
+            max_workers=N_WORKERS, on_result=report, journal=journal
+        )
+    results = [record for point in point_results for record in point]
 
     for i_K, K in enumerate(K_VALUES):
-        print(f"\n[{i_K+1}/{n_K}] K = {K:.2f}")
-
         for i_sigma, sigma in enumerate(SIGMA_VALUES):
-            # Storage for seeds
-            S_stars = []
-            angles_list = []
-            echoes = []
-
-            for seed in range(SEEDS_PER_POINT):
-                sim_count += 1
-
-                # Run simulation
-                phases1, phases2 = run_oscillator_simulation(K, sigma, seed)
-
-                # Find optimal angles
-                opt_angles, S_star = optimize_angles(phases1, phases2)
-                S_stars.append(S_star)
-                angles_list.append(opt_angles)
-
-                # Compute echo at optimal angles
-                S_series = compute_S_timeseries(phases1, phases2, *opt_angles)
-                echo_50 = compute_echo(S_series, 50)
-                echoes.append(echo_50)
-
-                # Store result (convert numpy types to Python native)
-                results.append({
-                    "K": float(K),
-                    "sigma": float(sigma),
-                    "seed": int(seed),
-                    "S_star": float(S_star),
-                    "angle_a": float(opt_angles[0]),
-                    "angle_ap": float(opt_angles[1]),
-                    "angle_b": float(opt_angles[2]),
-                    "angle_bp": float(opt_angles[3]),
-                    "echo_50": float(echo_50)
-                })
+            point = point_results[i_K * n_sigma + i_sigma]
+            n_seeds_surface[i_K, i_sigma] = len(point)
+
+            S_stars = [r["S_star"] for r in point]
+            angles_list = [(r["angle_a"], r["angle_ap"], r["angle_b"], r["angle_bp"]) for r in point]
+            echoes = [r["echo_50"] for r in point]
 
             # Compute means
             mean_S = np.mean(S_stars)
-            mean_angles = np.mean(angles_list, axis=0)
+            mean_angles = circular_mean_deg(angles_list, axis=0)
             mean_echo = np.mean(echoes)
 
             S_star_surface[i_K, i_sigma] = mean_S
@@ -339,13 +701,6 @@ def run_experiment():
             angle_bp_surface[i_K, i_sigma] = mean_angles[3]
             echo_angle_surface[i_K, i_sigma] = mean_echo
 
-            # Progress update
-            if (i_sigma + 1) % 5 == 0:
-                elapsed = (datetime.now() - start_time).total_seconds() / 60
-                rate = sim_count / elapsed if elapsed > 0 else 0
-                remaining = (total_sims - sim_count) / rate if rate > 0 else 0
-                print(f"    σ = {sigma:.2f} | {sim_count}/{total_sims} sims | ~{remaining:.1f} min remaining")
-
     # Compute χ_angle = ∂S*/∂σ
     chi_angle_surface = np.zeros((n_K, n_sigma))
     d_sigma = SIGMA_VALUES[1] - SIGMA_VALUES[0]
@@ -362,6 +717,13 @@ def run_experiment():
                 # Central difference
                 chi_angle_surface[i_K, i_sigma] = (S_star_surface[i_K, i_sigma+1] - S_star_surface[i_K, i_sigma-1]) / (2 * d_sigma)
 
+    # Pathwise χ_angle and ∂S*/∂K: seed means of the per-run tangent derivatives
+    if PATHWISE_CHI:
+        pathwise = {
+            name: np.array([np.mean([r[name] for r in point]) for point in point_results]).reshape(n_K, n_sigma)
+            for name in ["dS_star_dsigma", "dS_star_dK", "decho_50_dsigma", "decho_50_dK"]
+        }
+
     # Compute angle flow vectors (change in optimal angles with σ)
     angle_flow = {
         "da_dsigma": np.zeros((n_K, n_sigma)),
@@ -370,12 +732,22 @@ def run_experiment():
         "dbp_dsigma": np.zeros((n_K, n_sigma))
     }
 
+    # Angles live on the circle: unwrap along σ so a step across 0°/360°
+    # is a small change, not a ±360°/dσ jump
+    def unwrap_sigma(surface):
+        return np.rad2deg(np.unwrap(np.deg2rad(surface), axis=1))
+
+    flow_a = unwrap_sigma(angle_a_surface)
+    flow_ap = unwrap_sigma(angle_ap_surface)
+    flow_b = unwrap_sigma(angle_b_surface)
+    flow_bp = unwrap_sigma(angle_bp_surface)
+
     for i_K in range(n_K):
         for i_sigma in range(1, n_sigma):
-            angle_flow["da_dsigma"][i_K, i_sigma] = (angle_a_surface[i_K, i_sigma] - angle_a_surface[i_K, i_sigma-1]) / d_sigma
-            angle_flow["dap_dsigma"][i_K, i_sigma] = (angle_ap_surface[i_K, i_sigma] - angle_ap_surface[i_K, i_sigma-1]) / d_sigma
-            angle_flow["db_dsigma"][i_K, i_sigma] = (angle_b_surface[i_K, i_sigma] - angle_b_surface[i_K, i_sigma-1]) / d_sigma
-            angle_flow["dbp_dsigma"][i_K, i_sigma] = (angle_bp_surface[i_K, i_sigma] - angle_bp_surface[i_K, i_sigma-1]) / d_sigma
+            angle_flow["da_dsigma"][i_K, i_sigma] = (flow_a[i_K, i_sigma] - flow_a[i_K, i_sigma-1]) / d_sigma
+            angle_flow["dap_dsigma"][i_K, i_sigma] = (flow_ap[i_K, i_sigma] - flow_ap[i_K, i_sigma-1]) / d_sigma
+            angle_flow["db_dsigma"][i_K, i_sigma] = (flow_b[i_K, i_sigma] - flow_b[i_K, i_sigma-1]) / d_sigma
+            angle_flow["dbp_dsigma"][i_K, i_sigma] = (flow_bp[i_K, i_sigma] - flow_bp[i_K, i_sigma-1]) / d_sigma
 
     # ========================================================================
     # SAVE RESULTS
@@ -389,13 +761,25 @@ def run_experiment():
     main_output = {
         "experiment_id": "E231",
         "run_id": run_id,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": journal.meta["timestamp"],
         "parameters": {
             "K_values": K_VALUES.tolist(),
             "sigma_values": SIGMA_VALUES.tolist(),
             "seeds_per_point": SEEDS_PER_POINT,
+            "sem_tol": None if CONTINUATION else SEM_TOL,
+            "max_seeds_per_point": max_seeds,
+            "continuation": CONTINUATION,
+            "continuation_transient": CONTINUATION_TRANSIENT if CONTINUATION else None,
+            "auto_transient": AUTO_TRANSIENT,
+            "transient_window": TRANSIENT_WINDOW,
+            "scheme": SCHEME,
+            "pathwise_chi": PATHWISE_CHI,
+            "noise_tapes": NOISE_TAPES and not LEGACY_RNG,
+            "tape_share_K": TAPE_SHARE_K,
+            "dt": DT,
             "tau_lags": TAU_LAGS
         },
+        "n_seeds": n_seeds_surface.tolist(),
         "results": results
     }
 
@@ -435,6 +819,13 @@ def run_experiment():
         "sigma_values": SIGMA_VALUES.tolist(),
         "chi_angle": chi_angle_surface.tolist()
     }
+    if PATHWISE_CHI:
+        chi_output.update(
+            chi_angle_pathwise=pathwise["dS_star_dsigma"].tolist(),
+            dS_star_dK=pathwise["dS_star_dK"].tolist(),
+            decho_50_dsigma=pathwise["decho_50_dsigma"].tolist(),
+            decho_50_dK=pathwise["decho_50_dK"].tolist()
+        )
     chi_path = OUTPUT_DIR / "chi_angle_surface.json"
     with open(chi_path, 'w') as f:
         json.dump(chi_output, f, indent=2)
@@ -480,6 +871,10 @@ def run_experiment():
 
     print(f"\nχ_angle surface:")
     print(f"  Range: [{chi_angle_surface.min():.4f}, {chi_angle_surface.max():.4f}]")
+    if PATHWISE_CHI:
+        chi_pathwise = pathwise["dS_star_dsigma"]
+        print(f"  Pathwise: [{chi_pathwise.min():.4f}, {chi_pathwise.max():.4f}], "
+              f"RMS difference to finite differences {np.sqrt(np.mean((chi_pathwise - chi_angle_surface)**2)):.4f}")
 
     print(f"\nEcho_angle surface (τ=50):")
     print(f"  Range: [{echo_angle_surface.min():.4f}, {echo_angle_surface.max():.4f}]")
@@ -491,9 +886,23 @@ def run_experiment():
     print(f"  b:  [{angle_b_surface.min():.1f}°, {angle_b_surface.max():.1f}°]")
     print(f"  b': [{angle_bp_surface.min():.1f}°, {angle_bp_surface.max():.1f}°]")
 
+    print(f"\nSeeds per point: [{n_seeds_surface.min()}, {n_seeds_surface.max()}], "
+          f"{n_seeds_surface.sum()} simulations")
+
+    # How much of the discarded transient was actually needed
+    detected = [r["transient_detected"] for r in results if r["transient_detected"] is not None]
+    n_unsettled = len(results) - len(detected)
+    if detected:
+        print(f"Detected transient: median {np.median(detected):.0f}, max {max(detected)} steps "
+              f"(TRANSIENT = {TRANSIENT}); {n_unsettled}/{len(results)} runs not settled")
+
     elapsed = (datetime.now() - start_time).total_seconds() / 60
     print(f"\nTotal runtime: {elapsed:.1f} minutes")
 
+    journal.finish()
+    if NOISE_TAPES and not LEGACY_RNG:
+        noise_tapes().clear()
+
     print("\n" + "=" * 80)
     print("Mission 4 COMPLETE")
     print("=" * 80)
@@ -8,27 +8,53 @@ Inset: Small 3D surface for visual impact (minimal labels)
 Best of both worlds: readability + wow factor!
 """
 
-import json
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 from scipy.interpolate import griddata
 from pathlib import Path
 
-# Load A1 data
-data_dir = Path(__file__).parent.parent.parent.parent / "analysis" / "data" / "paper1"
-with open(data_dir / "A1_sigma_c_K_sweep.json") as f:
-    data = json.load(f)
+# Surface source: 'interpolated' (cubic griddata from the measured A1 points)
+# or 'stationary' (exact Fokker–Planck |S| evaluated on the dense grid)
+SURFACE_SOURCE = 'interpolated'
 
-# Extract grid results
-results = data['grid_results']
+# Add rut_core to path
+SCRIPT_DIR = Path(__file__).resolve().parent
+RUT_CORE_PATH = SCRIPT_DIR.parent.parent.parent / 'analysis' / 'scripts'
+sys.path.insert(0, str(RUT_CORE_PATH))
+from stationary import stationary_landscape
+from result_store import load_columns, load_meta
 
-# Get measured K, σ, and |S| values
-K_measured = np.array([r['K'] for r in results])
-sigma_measured = np.array([r['sigma'] for r in results])
-abs_S_measured = np.array([r['abs_S_mean'] for r in results])
+# A1 data: the uniform grid, or "A1_adaptive_landscape" for the
+# quadtree-refined scattered points (same grid_results layout). Columnar
+# store (.cols) if present, legacy JSON otherwise.
+DATA_FILE = "A1_sigma_c_K_sweep"
 
-print(f"Loaded {len(results)} measured points from A1 experiment")
+# Load A1 data: only the three columns the figure needs
+data_dir = Path(__file__).parent.parent.parent.parent / "analysis" / "data" / "paper1"
+columns = load_columns(data_dir / DATA_FILE, ['K', 'sigma', 'abs_S_mean'])
+
+# Get measured K, σ, and |S| values
+K_measured = np.asarray(columns['K'])
+sigma_measured = np.asarray(columns['sigma'])
+abs_S_measured = np.asarray(columns['abs_S_mean'])
+
+print(f"Loaded {len(K_measured)} measured points from A1 experiment")
+
+a1_params = load_meta(data_dir / DATA_FILE)['config']['parameters']
+
+def surface(K_points, sigma_points, method):
+    """|S| on the requested points, interpolated or from the stationary solution"""
+    if SURFACE_SOURCE == 'stationary':
+        return stationary_landscape(K_points, sigma_points, a1_params['delta_omega'],
+                                    a1_params['angles'])['abs_S']
+    return griddata(
+        points=(K_measured, sigma_measured),
+        values=abs_S_measured,
+        xi=(K_points, sigma_points),
+        method=method
+    )
 
 # Create smooth interpolated grid
 K_grid_fine = np.linspace(0, 1.6, 200)
@@ -36,12 +62,7 @@ sigma_grid_fine = np.linspace(0, 1.2, 200)
 K_mesh, sigma_mesh = np.meshgrid(K_grid_fine, sigma_grid_fine)
 
 # Interpolate |S| values
-abs_S_mesh = griddata(
-    points=(K_measured, sigma_measured),
-    values=abs_S_measured,
-    xi=(K_mesh, sigma_mesh),
-    method='cubic'
-)
+abs_S_mesh = surface(K_mesh, sigma_mesh, 'cubic')
 
 # Create main figure
 fig = plt.figure(figsize=(12, 8))
@@ -129,12 +150,7 @@ sigma_grid_3d = np.linspace(0, 1.2, 50)
 K_mesh_3d, sigma_mesh_3d = np.meshgrid(K_grid_3d, sigma_grid_3d)
 
 # Interpolate for 3D
-abs_S_mesh_3d = griddata(
-    points=(K_measured, sigma_measured),
-    values=abs_S_measured,
-    xi=(K_mesh_3d, sigma_mesh_3d),
-    method='cubic'
-)
+abs_S_mesh_3d = surface(K_mesh_3d, sigma_mesh_3d, 'cubic')
 
 # Plot 3D surface with full opacity for clarity
 surf = ax_inset.plot_surface(K_mesh_3d, sigma_mesh_3d, abs_S_mesh_3d,
@@ -158,12 +174,7 @@ ax_inset.plot_surface(K_plane, sigma_plane, tsirelson_plane,
 # Add wall plane at sigma=0 (showing the K-|S| profile at zero noise)
 K_wall = np.linspace(0.1, 1.5, 50)
 sigma_wall = np.zeros_like(K_wall)
-abs_S_wall = griddata(
-    points=(K_measured, sigma_measured),
-    values=abs_S_measured,
-    xi=(K_wall, sigma_wall),
-    method='linear'
-)
+abs_S_wall = surface(K_wall, sigma_wall, 'linear')
 ax_inset.plot(K_wall, sigma_wall, abs_S_wall, color='cyan', linewidth=2, alpha=0.7)
 
 # Add axis labels - K and σ automated, |S| manual placement
@@ -6,24 +6,31 @@ Clean quantitative reference view showing |S|(K, σ) as a heatmap
 with boundary line, optimal point, and tested configurations.
 """
 
-import json
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.interpolate import griddata
 from pathlib import Path
 
-# Load A1 data
-data_dir = Path(__file__).parent.parent.parent.parent / "analysis" / "data" / "paper1"
-with open(data_dir / "A1_sigma_c_K_sweep.json") as f:
-    data = json.load(f)
+# Add rut_core to path
+SCRIPT_DIR = Path(__file__).resolve().parent
+RUT_CORE_PATH = SCRIPT_DIR.parent.parent.parent / 'analysis' / 'scripts'
+sys.path.insert(0, str(RUT_CORE_PATH))
+from result_store import load_columns
+
+# A1 data: the uniform grid, or "A1_adaptive_landscape" for the
+# quadtree-refined scattered points (same grid_results layout). Columnar
+# store (.cols) if present, legacy JSON otherwise.
+DATA_FILE = "A1_sigma_c_K_sweep"
 
-# Extract grid results
-results = data['grid_results']
+# Load A1 data: only the three columns the figure needs
+data_dir = Path(__file__).parent.parent.parent.parent / "analysis" / "data" / "paper1"
+columns = load_columns(data_dir / DATA_FILE, ['K', 'sigma', 'abs_S_mean'])
 
 # Get measured K, σ, and |S| values
-K_measured = np.array([r['K'] for r in results])
-sigma_measured = np.array([r['sigma'] for r in results])
-abs_S_measured = np.array([r['abs_S_mean'] for r in results])
+K_measured = np.asarray(columns['K'])
+sigma_measured = np.asarray(columns['sigma'])
+abs_S_measured = np.asarray(columns['abs_S_mean'])
 
 # Create smooth interpolated grid for heatmap
 K_grid_fine = np.linspace(0, 1.6, 200)
@@ -6,15 +6,20 @@ Shows the linear relationship between coupling strength K
 and critical noise σ_c where violations collapse.
 """
 
-import json
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 
-# Load A1 data
+# Add rut_core to path
+SCRIPT_DIR = Path(__file__).resolve().parent
+RUT_CORE_PATH = SCRIPT_DIR.parent.parent.parent / 'analysis' / 'scripts'
+sys.path.insert(0, str(RUT_CORE_PATH))
+from result_store import load_meta
+
+# Load A1 data (store or legacy JSON; the scaling analysis is in its metadata)
 data_dir = Path(__file__).parent.parent.parent.parent / "analysis" / "data" / "paper1"
-with open(data_dir / "A1_sigma_c_K_sweep.json") as f:
-    data = json.load(f)
+data = load_meta(data_dir / "A1_sigma_c_K_sweep")
 
 # Extract scaling law
 analysis = data['sigma_c_analysis']
@@ -6,21 +6,24 @@ Shows how CHSH violations decay with noise for different
 coupling strengths, illustrating the collapse at σ_c.
 """
 
-import json
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 
-# Load A1 data
-data_dir = Path(__file__).parent.parent.parent.parent / "analysis" / "data" / "paper1"
-with open(data_dir / "A1_sigma_c_K_sweep.json") as f:
-    data = json.load(f)
+# Add rut_core to path
+SCRIPT_DIR = Path(__file__).resolve().parent
+RUT_CORE_PATH = SCRIPT_DIR.parent.parent.parent / 'analysis' / 'scripts'
+sys.path.insert(0, str(RUT_CORE_PATH))
+from result_store import load_columns
 
-# Extract grid results
-results = data['grid_results']
+# Load A1 data (store or legacy JSON): only the columns plotted
+data_dir = Path(__file__).parent.parent.parent.parent / "analysis" / "data" / "paper1"
+columns = load_columns(data_dir / "A1_sigma_c_K_sweep", ['K', 'sigma', 'abs_S_mean', 'abs_S_sem'])
+K_all = np.asarray(columns['K'])
 
 # Organize by K
-K_values = sorted(list(set(r['K'] for r in results)))
+K_values = sorted(set(K_all.tolist()))
 # Extended color palette for more K values
 colors = ['#E63946', '#F77F00', '#06A77D', '#2E86AB', '#9D4EDD', '#FF006E', '#8338EC', '#3A86FF', '#FB5607', '#FFBE0B', '#06FFA5', '#FF1654']
 
@@ -28,12 +31,12 @@ colors = ['#E63946', '#F77F00', '#06A77D', '#2E86AB', '#9D4EDD', '#FF006E', '#83
 fig, ax = plt.subplots(figsize=(8, 6))
 
 for i, K in enumerate(K_values):
-    K_data = [r for r in results if r['K'] == K]
-    K_data_sorted = sorted(K_data, key=lambda r: r['sigma'])
+    rows = np.flatnonzero(K_all == K)
+    rows = rows[np.argsort(columns['sigma'][rows], kind='stable')]
 
-    sigmas = [r['sigma'] for r in K_data_sorted]
-    abs_S = [r['abs_S_mean'] for r in K_data_sorted]
-    errors = [r['abs_S_sem'] for r in K_data_sorted]
+    sigmas = columns['sigma'][rows]
+    abs_S = columns['abs_S_mean'][rows]
+    errors = columns['abs_S_sem'][rows]
 
     ax.errorbar(sigmas, abs_S, yerr=errors,
                 marker='o', markersize=8, linewidth=2, capsize=5,
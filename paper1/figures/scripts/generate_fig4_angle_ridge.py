@@ -6,31 +6,33 @@ Shows the 2D landscape of CHSH values over measurement angle space,
 revealing the broad ridge and optimal geometry.
 """
 
-import json
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 
-# Load A2 data
-data_dir = Path(__file__).parent.parent.parent.parent / "analysis" / "data" / "paper1"
-with open(data_dir / "A2_angle_ridge.json") as f:
-    data = json.load(f)
+# Add rut_core to path
+SCRIPT_DIR = Path(__file__).resolve().parent
+RUT_CORE_PATH = SCRIPT_DIR.parent.parent.parent / 'analysis' / 'scripts'
+sys.path.insert(0, str(RUT_CORE_PATH))
+from result_store import load_columns, load_meta
 
-# Extract results
-results = data['grid_results']
-optimal = data['maximum']
+# Load A2 data (store or legacy JSON)
+data_dir = Path(__file__).parent.parent.parent.parent / "analysis" / "data" / "paper1"
+columns = load_columns(data_dir / "A2_angle_ridge", ['delta_alpha', 'delta_beta', 'abs_S_mean'])
+optimal = load_meta(data_dir / "A2_angle_ridge")['maximum']
 
 # Get unique Δα and Δβ values
-delta_alpha_vals = sorted(list(set(r['delta_alpha'] for r in results)))
-delta_beta_vals = sorted(list(set(r['delta_beta'] for r in results)))
+delta_alpha_vals = sorted(set(np.asarray(columns['delta_alpha']).tolist()))
+delta_beta_vals = sorted(set(np.asarray(columns['delta_beta']).tolist()))
 
 # Create 2D grid
 S_grid = np.zeros((len(delta_beta_vals), len(delta_alpha_vals)))
 
-for r in results:
-    i = delta_alpha_vals.index(r['delta_alpha'])
-    j = delta_beta_vals.index(r['delta_beta'])
-    S_grid[j, i] = r['abs_S_mean']
+for alpha, beta, abs_S in zip(columns['delta_alpha'], columns['delta_beta'], columns['abs_S_mean']):
+    i = delta_alpha_vals.index(alpha)
+    j = delta_beta_vals.index(beta)
+    S_grid[j, i] = abs_S
 
 # Create figure
 fig, ax = plt.subplots(figsize=(10, 8))
@@ -26,7 +26,11 @@ from pathlib import Path
 SCRIPT_DIR = Path(__file__).resolve().parent
 RUT_CORE_PATH = SCRIPT_DIR.parent.parent.parent / 'analysis' / 'scripts'
 sys.path.insert(0, str(RUT_CORE_PATH))
-from rut_core import kuramoto_with_noise
+from rut_core import trajectory_dtheta, ensemble_autocorr_S
+from trajectory_cache import TrajectoryCache
+
+# Seed-stream namespace, shared with the other ρ_S figure so overlapping σ reuse trajectories
+RNG_EXPERIMENT_ID = 'P1-RHO-S'
 
 def compute_rho_S_decay(K, sigma, delta_omega, angles, tau_max=200, n_seeds=30):
     """
@@ -40,29 +44,18 @@ def compute_rho_S_decay(K, sigma, delta_omega, angles, tau_max=200, n_seeds=30):
     T = 100000
     dt = 0.01
     transient = 20000
-    omega1 = 1.0
-    omega2 = omega1 + delta_omega
+    params = {'K': K, 'delta_omega': delta_omega, 'sigma': sigma, 'T': T, 'dt': dt}
+    cache = TrajectoryCache()
 
     tau_steps = np.arange(0, tau_max + 1, 1)  # Every 1 time unit
-    rho_S_all = []
+    S_all = []
 
     for seed in range(1, n_seeds + 1):
-        # Run simulation
-        theta1, theta2 = kuramoto_with_noise(
-            theta1_0=np.random.uniform(0, 2*np.pi),
-            theta2_0=np.random.uniform(0, 2*np.pi),
-            omega1=omega1,
-            omega2=omega2,
-            K=K,
-            sigma=sigma,
-            T=T,
-            dt=dt,
-            seed=seed
-        )
+        # Run simulation (or reuse it from the trajectory cache)
+        dtheta = trajectory_dtheta(params, seed=seed, experiment_id=RNG_EXPERIMENT_ID, cache=cache)
 
         # Compute S(t) time series manually
-        theta1_post = theta1[transient:]
-        theta2_post = theta2[transient:]
+        dtheta_post = dtheta[transient:]
 
         # Compute instantaneous correlations
         a = np.deg2rad(angles['a'])
@@ -71,34 +64,18 @@ def compute_rho_S_decay(K, sigma, delta_omega, angles, tau_max=200, n_seeds=30):
         b_prime = np.deg2rad(angles['b_prime'])
 
         # E(a,b) = <cos(Δθ + (a-b))>
-        E_ab_t = np.cos(theta2_post - theta1_post + (a - b))
-        E_ab_prime_t = np.cos(theta2_post - theta1_post + (a - b_prime))
-        E_a_prime_b_t = np.cos(theta2_post - theta1_post + (a_prime - b))
-        E_a_prime_b_prime_t = np.cos(theta2_post - theta1_post + (a_prime - b_prime))
+        E_ab_t = np.cos(dtheta_post + (a - b))
+        E_ab_prime_t = np.cos(dtheta_post + (a - b_prime))
+        E_a_prime_b_t = np.cos(dtheta_post + (a_prime - b))
+        E_a_prime_b_prime_t = np.cos(dtheta_post + (a_prime - b_prime))
 
         # S(t) = E(a,b) - E(a,b') + E(a',b) + E(a',b')
         S_series = E_ab_t - E_ab_prime_t + E_a_prime_b_t + E_a_prime_b_prime_t
 
-        # Compute autocorrelation for each lag
-        rho_S_seed = []
-        for tau in tau_steps:
-            if tau == 0:
-                rho_S_seed.append(1.0)
-            else:
-                # Autocorrelation: Corr[S(t), S(t+tau)]
-                S_t = S_series[:-tau]
-                S_t_tau = S_series[tau:]
-
-                # Pearson correlation
-                corr = np.corrcoef(S_t, S_t_tau)[0, 1]
-                rho_S_seed.append(corr)
-
-        rho_S_all.append(rho_S_seed)
-
-    # Statistics
-    rho_S_all = np.array(rho_S_all)
-    rho_S_mean = np.mean(rho_S_all, axis=0)
-    rho_S_sem = np.std(rho_S_all, axis=0, ddof=1) / np.sqrt(n_seeds)
+        S_all.append(S_series)
+
+    # Autocorrelation at every lag (FFT), averaged over seeds
+    rho_S_mean, rho_S_sem = ensemble_autocorr_S(np.array(S_all), tau_max)
 
     return tau_steps, rho_S_mean, rho_S_sem
 
@@ -13,6 +13,7 @@ Shows:
 - Saturation/bending at high K
 """
 
+import sys
 import json
 import numpy as np
 import matplotlib.pyplot as plt
@@ -20,10 +21,19 @@ from scipy.interpolate import interp1d
 from pathlib import Path
 import csv
 
+# Add rut_core to path
+SCRIPT_DIR = Path(__file__).resolve().parent
+RUT_CORE_PATH = SCRIPT_DIR.parent.parent.parent / 'analysis' / 'scripts'
+sys.path.insert(0, str(RUT_CORE_PATH))
+from result_store import load_columns
+
 # Load A1 data (original + extended)
 data_dir = Path(__file__).parent.parent.parent.parent / "analysis" / "data" / "paper1"
-with open(data_dir / "A1_sigma_c_K_sweep.json") as f:
-    data1 = json.load(f)
+columns = load_columns(data_dir / "A1_sigma_c_K_sweep", ['K', 'sigma', 'abs_S_mean'])
+grid_results = [
+    {'K': float(K), 'sigma': float(sigma), 'abs_S_mean': float(abs_S)}
+    for K, sigma, abs_S in zip(columns['K'], columns['sigma'], columns['abs_S_mean'])
+]
 
 # Load extended data
 try:
@@ -34,7 +44,7 @@ except FileNotFoundError:
     extended_results = []
 
 # Merge results
-results = data1['grid_results'] + extended_results
+results = grid_results + extended_results
 K_values = sorted(set(r['K'] for r in results))
 
 print(f"Computing σ_c(K) for {len(K_values)} K values")
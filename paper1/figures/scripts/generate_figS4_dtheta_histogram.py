@@ -25,6 +25,10 @@ RUT_CORE_PATH = SCRIPT_DIR.parent.parent.parent / 'analysis' / 'scripts'
 sys.path.insert(0, str(RUT_CORE_PATH))
 
 from rut_core import kuramoto_with_noise
+from seed_streams import trajectory_rng, initial_phases
+
+# Seed-stream namespace (one stream per (K, σ, Δω, seed) trajectory)
+RNG_EXPERIMENT_ID = 'P1-FIGS4'
 
 def extract_dtheta_distribution(K, sigma, delta_omega, n_seeds=30):
     """
@@ -54,16 +58,18 @@ def extract_dtheta_distribution(K, sigma, delta_omega, n_seeds=30):
             print(f"  Completed {seed}/{n_seeds} seeds")
 
         # Run simulation
+        rng = trajectory_rng(RNG_EXPERIMENT_ID, (K, sigma, delta_omega), seed)
+        theta1_0, theta2_0 = initial_phases(rng)
         theta1, theta2 = kuramoto_with_noise(
-            theta1_0=np.random.uniform(0, 2*np.pi),
-            theta2_0=np.random.uniform(0, 2*np.pi),
+            theta1_0=theta1_0,
+            theta2_0=theta2_0,
             omega1=omega1,
             omega2=omega2,
             K=K,
             sigma=sigma,
             T=T,
             dt=dt,
-            seed=seed
+            seed=rng
         )
 
         # Extract post-transient Δθ
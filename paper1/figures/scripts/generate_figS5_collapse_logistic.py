@@ -15,12 +15,15 @@ Reads:
 Saves: figS5_collapse_logistic.png
 """
 
-import json
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 from scipy.optimize import curve_fit
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent / 'analysis' / 'scripts'))
+from result_store import load_columns
+
 def logistic_function(sigma, S_high, S_low, sigma_c, w):
     """
     Four-parameter logistic function for collapse curve
@@ -31,15 +34,14 @@ def main():
     # Paths
     script_dir = Path(__file__).resolve().parent
     repo_root = script_dir.parent.parent.parent
-    data_file = repo_root / 'analysis' / 'data' / 'paper1' / 'A1_sigma_c_K_sweep.json'
+    data_file = repo_root / 'analysis' / 'data' / 'paper1' / 'A1_sigma_c_K_sweep'
     table_file = script_dir.parent / 'tableS2_logistic_params.csv'
     output_dir = script_dir.parent
 
     print("Loading data...")
 
-    # Load A1 data
-    with open(data_file, 'r') as f:
-        a1_data = json.load(f)
+    # Load A1 data (store or legacy JSON)
+    a1_columns = load_columns(data_file, ['K', 'sigma', 'abs_S_mean'])
 
     # Load logistic fit parameters
     table_data = np.genfromtxt(table_file, delimiter=',', skip_header=1,
@@ -47,10 +49,8 @@ def main():
 
     # Build |S|(sigma, K) grid from results
     S_grid = {}
-    for result in a1_data['grid_results']:
-        K = result['K']
-        sigma = result['sigma']
-        S_mean = result['abs_S_mean']  # Note: key is 'abs_S_mean' not 'S_mean'
+    for K, sigma, S_mean in zip(a1_columns['K'].tolist(), a1_columns['sigma'].tolist(),
+                                a1_columns['abs_S_mean'].tolist()):
 
         if K not in S_grid:
             S_grid[K] = {}
@@ -30,7 +30,7 @@ import numpy as np
 # Core Simulation (self-contained, no external dependencies)
 # ============================================================================
 
-def simulate_coupled_oscillators(K, sigma, T=5000, dt=0.01, seed=None, delta_omega=0.0):
+def simulate_coupled_oscillators(K, sigma, T=5000, dt=0.01, seed=None, delta_omega=0.0, scheme='euler'):
     """
     Simulate two Kuramoto-coupled oscillators with noise.
 
@@ -41,6 +41,8 @@ def simulate_coupled_oscillators(K, sigma, T=5000, dt=0.01, seed=None, delta_ome
         dt          : Time step size
         seed        : Random seed for reproducibility
         delta_omega : Frequency mismatch (omega2 - omega1)
+        scheme      : 'euler' (Euler-Maruyama) or 'heun' (stochastic Heun,
+                      weak order 2 for this additive noise: allows a larger dt)
 
     Returns:
         theta1, theta2 : Phase trajectories
@@ -58,7 +60,10 @@ def simulate_coupled_oscillators(K, sigma, T=5000, dt=0.01, seed=None, delta_ome
     omega1 = 1.0
     omega2 = omega1 + delta_omega
 
-    # Euler-Maruyama integration
+    if scheme not in ('euler', 'heun'):
+        raise ValueError(f"Unknown scheme {scheme!r}")
+
+    # Euler-Maruyama integration (Heun: corrected drift, same noise)
     for t in range(T - 1):
         # Kuramoto coupling: each oscillator pulls toward the other
         coupling1 = K * np.sin(theta2[t] - theta1[t])
@@ -72,6 +77,12 @@ def simulate_coupled_oscillators(K, sigma, T=5000, dt=0.01, seed=None, delta_ome
         theta1[t+1] = theta1[t] + dt * (omega1 + coupling1) + noise1
         theta2[t+1] = theta2[t] + dt * (omega2 + coupling2) + noise2
 
+        if scheme == 'heun':
+            # Average the drift at both ends of the step
+            coupling1_end = K * np.sin(theta2[t+1] - theta1[t+1])
+            theta1[t+1] = theta1[t] + dt * (omega1 + 0.5 * (coupling1 + coupling1_end)) + noise1
+            theta2[t+1] = theta2[t] + dt * (omega2 + 0.5 * (coupling2 - coupling1_end)) + noise2
+
     return theta1, theta2
 
 